@@ -0,0 +1,365 @@
+"""Async data-access path for the hot API endpoints.
+
+- PostgreSQL: ``psycopg.AsyncConnection`` with the same qmark compatibility
+  as ``PostgresConnection``.
+- SQLite: each connection lives on its own dedicated thread (aiosqlite
+  style), so blocking sqlite3 calls never occupy the event loop or the
+  default threadpool.
+
+Both are exposed through ``AsyncConnectionPool`` and the
+``async_db_connection`` FastAPI dependency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Iterable, Sequence
+
+from apps.api.database import (
+    PoolClosed,
+    PoolTimeout,
+    _connect,
+    _env_float,
+    _is_postgres_url,
+    _normalize_database_url,
+    _postgres_statement,
+    is_truthy_env,
+    pool_budget,
+)
+
+try:
+    import psycopg
+    from psycopg.rows import dict_row
+except ImportError:  # pragma: no cover - optional in local SQLite mode
+    psycopg = None
+    dict_row = None
+
+Params = Sequence | Iterable | None
+
+
+class AsyncPostgresConnection:
+    """Async counterpart of ``PostgresConnection``."""
+
+    def __init__(self, conn, *, prepare: bool = False):
+        self._conn = conn
+        self._prepared: set[str] | None = set() if prepare else None
+
+    @classmethod
+    async def connect(cls) -> "AsyncPostgresConnection":
+        if psycopg is None:
+            raise RuntimeError(
+                "DATABASE_URL is set to PostgreSQL but psycopg is not installed. "
+                "Install dependencies from requirements.txt."
+            )
+        database_url = _normalize_database_url(os.getenv("DATABASE_URL", "").strip())
+        conn = await psycopg.AsyncConnection.connect(database_url, row_factory=dict_row)
+        return cls(conn, prepare=is_truthy_env("DB_PREPARE_STATEMENTS"))
+
+    async def _execute(self, query: str, params: Params):
+        converted, prepare = _postgres_statement(query, self._prepared)
+        if params is None:
+            return await self._conn.execute(converted, prepare=prepare)
+        return await self._conn.execute(converted, tuple(params), prepare=prepare)
+
+    async def execute(self, query: str, params: Params = None) -> None:
+        await self._execute(query, params)
+
+    async def fetchone(self, query: str, params: Params = None):
+        cur = await self._execute(query, params)
+        return await cur.fetchone()
+
+    async def fetchall(self, query: str, params: Params = None) -> list:
+        cur = await self._execute(query, params)
+        return await cur.fetchall()
+
+    async def commit(self) -> None:
+        await self._conn.commit()
+
+    async def rollback(self) -> None:
+        await self._conn.rollback()
+
+    async def close(self) -> None:
+        await self._conn.close()
+
+
+class AsyncSQLiteConnection:
+    """sqlite3 connection bound to a dedicated worker thread."""
+
+    def __init__(self, executor: ThreadPoolExecutor, conn: sqlite3.Connection):
+        self._executor = executor
+        self._conn = conn
+
+    @classmethod
+    async def connect(cls) -> "AsyncSQLiteConnection":
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-conn")
+        loop = asyncio.get_running_loop()
+        conn = await loop.run_in_executor(executor, _connect)
+        return cls(executor, conn)
+
+    async def _run(self, fn: Callable[..., Any], *args) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    def _execute(self, query: str, params: Params):
+        if params is None:
+            return self._conn.execute(query)
+        return self._conn.execute(query, tuple(params))
+
+    async def execute(self, query: str, params: Params = None) -> None:
+        await self._run(self._execute, query, params)
+
+    async def fetchone(self, query: str, params: Params = None):
+        return await self._run(lambda: self._execute(query, params).fetchone())
+
+    async def fetchall(self, query: str, params: Params = None) -> list:
+        return await self._run(lambda: self._execute(query, params).fetchall())
+
+    async def commit(self) -> None:
+        await self._run(self._conn.commit)
+
+    async def rollback(self) -> None:
+        await self._run(self._conn.rollback)
+
+    async def close(self) -> None:
+        try:
+            await self._run(self._conn.close)
+        finally:
+            self._executor.shutdown(wait=False)
+
+
+AsyncConnection = AsyncPostgresConnection | AsyncSQLiteConnection
+
+
+async def connect_async() -> AsyncConnection:
+    if _is_postgres_url(os.getenv("DATABASE_URL", "").strip()):
+        return await AsyncPostgresConnection.connect()
+    return await AsyncSQLiteConnection.connect()
+
+
+# ---------------------------------------------------------------------------
+# Async pool
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _AsyncPoolEntry:
+    conn: AsyncConnection
+    created_at: float
+    last_used_at: float
+
+
+class AsyncConnectionPool:
+    """Async counterpart of ``ConnectionPool`` with the same sizing knobs.
+
+    Its ``max_size`` is the async share of the per-process connection
+    budget (see ``pool_budget``).
+
+    Bookkeeping uses a thread lock and waiters are woken through their own
+    event loop, so the pool is not tied to a single loop.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any] = connect_async,
+        *,
+        max_size: int = 10,
+        max_lifetime_seconds: float = 3600.0,
+        check_idle_seconds: float = 30.0,
+        timeout_seconds: float = 30.0,
+    ):
+        if max_size < 1:
+            raise ValueError(f"Invalid pool size: max_size={max_size}")
+        self._connect = connect
+        self.max_size = max_size
+        self.max_lifetime_seconds = max_lifetime_seconds
+        self.check_idle_seconds = check_idle_seconds
+        self.timeout_seconds = timeout_seconds
+        self._lock = threading.Lock()
+        self._idle: deque[_AsyncPoolEntry] = deque()
+        self._in_use: dict[int, _AsyncPoolEntry] = {}
+        self._connecting = 0
+        self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._closed = False
+
+    @classmethod
+    def from_env(cls) -> "AsyncConnectionPool":
+        _, max_size = pool_budget()
+        return cls(
+            max_size=max_size,
+            max_lifetime_seconds=_env_float("DB_POOL_MAX_LIFETIME_SECONDS", 3600.0),
+            check_idle_seconds=_env_float("DB_POOL_CHECK_IDLE_SECONDS", 30.0),
+            timeout_seconds=_env_float("DB_POOL_TIMEOUT_SECONDS", 30.0),
+        )
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return len(self._idle) + len(self._in_use) + self._connecting
+
+    async def acquire(self) -> AsyncConnection:
+        deadline = time.monotonic() + self.timeout_seconds
+        while True:
+            entry, create, waiter = self._try_reserve()
+            if waiter is not None:
+                remaining = deadline - time.monotonic()
+                try:
+                    await asyncio.wait_for(waiter, max(remaining, 0))
+                except asyncio.TimeoutError as exc:
+                    raise PoolTimeout(
+                        f"No DB connection available within {self.timeout_seconds}s "
+                        f"(max_size={self.max_size})"
+                    ) from exc
+                continue
+
+            if create:
+                try:
+                    now = time.monotonic()
+                    entry = _AsyncPoolEntry(await self._connect(), now, now)
+                finally:
+                    with self._lock:
+                        self._connecting -= 1
+                    self._wake_one()
+            elif self._is_expired(entry) or not await self._is_healthy(entry):
+                await _close_quietly(entry.conn)
+                self._wake_one()
+                continue
+
+            with self._lock:
+                closed = self._closed
+                if not closed:
+                    self._in_use[id(entry.conn)] = entry
+            if closed:
+                await _close_quietly(entry.conn)
+                raise PoolClosed("DB connection pool is closed")
+            return entry.conn
+
+    def _try_reserve(self):
+        with self._lock:
+            if self._closed:
+                raise PoolClosed("DB connection pool is closed")
+            if self._idle:
+                return self._idle.pop(), False, None
+            if len(self._in_use) + self._connecting < self.max_size:
+                self._connecting += 1
+                return None, True, None
+            loop = asyncio.get_running_loop()
+            waiter = loop.create_future()
+            self._waiters.append((loop, waiter))
+            return None, False, waiter
+
+    def _wake_one(self) -> None:
+        with self._lock:
+            while self._waiters:
+                loop, waiter = self._waiters.popleft()
+                if waiter.done() or loop.is_closed():
+                    continue
+                loop.call_soon_threadsafe(_resolve, waiter)
+                return
+
+    async def release(self, conn: AsyncConnection, *, discard: bool = False) -> None:
+        with self._lock:
+            entry = self._in_use.pop(id(conn), None)
+        if entry is None:
+            await _close_quietly(conn)
+            return
+        if not discard:
+            try:
+                await conn.rollback()
+            except Exception:
+                discard = True
+        with self._lock:
+            keep = not discard and not self._closed and not self._is_expired(entry)
+            if keep:
+                entry.last_used_at = time.monotonic()
+                self._idle.append(entry)
+        if not keep:
+            await _close_quietly(conn)
+        self._wake_one()
+
+    async def close(self) -> None:
+        """Close idle connections and wake every waiter.
+
+        In-use connections are closed when released; ``acquire`` raises
+        ``PoolClosed`` from now on.
+        """
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            waiters = list(self._waiters)
+            self._waiters.clear()
+        for loop, waiter in waiters:
+            if not waiter.done() and not loop.is_closed():
+                loop.call_soon_threadsafe(_resolve, waiter)
+        for entry in idle:
+            await _close_quietly(entry.conn)
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[AsyncConnection]:
+        conn = await self.acquire()
+        try:
+            yield conn
+        finally:
+            await self.release(conn)
+
+    def _is_expired(self, entry: _AsyncPoolEntry) -> bool:
+        if self.max_lifetime_seconds <= 0:
+            return False
+        return time.monotonic() - entry.created_at > self.max_lifetime_seconds
+
+    async def _is_healthy(self, entry: _AsyncPoolEntry) -> bool:
+        if time.monotonic() - entry.last_used_at < self.check_idle_seconds:
+            return True
+        try:
+            await entry.conn.fetchone("SELECT 1")
+            await entry.conn.rollback()
+            return True
+        except Exception:
+            return False
+
+
+def _resolve(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+async def _close_quietly(conn: AsyncConnection) -> None:
+    try:
+        await conn.close()
+    except Exception:
+        pass
+
+
+_async_pool: AsyncConnectionPool | None = None
+_async_pool_lock = threading.Lock()
+
+
+def get_async_pool() -> AsyncConnectionPool:
+    global _async_pool
+    if _async_pool is None:
+        with _async_pool_lock:
+            if _async_pool is None:
+                _async_pool = AsyncConnectionPool.from_env()
+    return _async_pool
+
+
+async def close_async_pool() -> None:
+    global _async_pool
+    with _async_pool_lock:
+        pool, _async_pool = _async_pool, None
+    if pool is not None:
+        await pool.close()
+
+
+async def async_db_connection() -> AsyncIterator[AsyncConnection]:
+    """FastAPI dependency yielding a pooled async connection for one request."""
+    async with get_async_pool().connection() as conn:
+        yield conn
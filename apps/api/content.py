@@ -0,0 +1,323 @@
+"""In-process, read-through cache of the curriculum content graph.
+
+Content tables (``stages``, ``modules``, ``steps``, ``options``) only change
+when ``apps/api/seed.py`` runs. Triggers installed by migration
+``002_content_version`` bump ``content_version.version`` on every content
+write, so the cache checks that single row and reloads the whole graph only
+when the version moved. Endpoints then hit the DB for ``user_progress`` only.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from apps.api.compression import compress
+from apps.api.database import hot_query
+from apps.api.models import OptionResponse, StepResponse
+from apps.api.progress import CurriculumStructure
+
+CONTENT_VERSION_SQL = hot_query("SELECT version FROM content_version WHERE id = 1")
+STEP_CONTENT_SQL = (
+    "SELECT id, module_id, type, title, content_md, order_idx, extension_md "
+    "FROM steps ORDER BY module_id, order_idx"
+)
+OPTION_CONTENT_SQL = (
+    "SELECT id, step_id, label, content, is_correct, feedback_md, order_idx "
+    "FROM options ORDER BY step_id, order_idx"
+)
+
+
+@dataclass(frozen=True)
+class OptionContent:
+    id: int
+    step_id: int
+    label: str
+    content: str
+    is_correct: bool
+    feedback_md: str
+    order_idx: int
+
+
+@dataclass(frozen=True)
+class StepContent:
+    id: int
+    module_id: int
+    type: str
+    title: str
+    content_md: str
+    order_idx: int
+    extension_md: str | None
+    options: tuple[OptionContent, ...] = ()
+
+    def option(self, option_id: int) -> OptionContent | None:
+        return next((o for o in self.options if o.id == option_id), None)
+
+    @property
+    def correct_option(self) -> OptionContent | None:
+        return next((o for o in self.options if o.is_correct), None)
+
+
+@dataclass
+class CurriculumContent:
+    """Immutable snapshot of every content table at one content version."""
+
+    version: int
+    structure: CurriculumStructure
+    steps: dict[int, StepContent] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, conn, version: int) -> "CurriculumContent":
+        return cls.from_rows(
+            version,
+            CurriculumStructure.load(conn),
+            conn.execute(STEP_CONTENT_SQL).fetchall(),
+            conn.execute(OPTION_CONTENT_SQL).fetchall(),
+        )
+
+    @classmethod
+    async def aload(cls, aconn, version: int) -> "CurriculumContent":
+        return cls.from_rows(
+            version,
+            await CurriculumStructure.aload(aconn),
+            await aconn.fetchall(STEP_CONTENT_SQL),
+            await aconn.fetchall(OPTION_CONTENT_SQL),
+        )
+
+    @classmethod
+    def from_rows(
+        cls, version: int, structure: CurriculumStructure, step_rows, option_rows
+    ) -> "CurriculumContent":
+        options_by_step: dict[int, list[OptionContent]] = {}
+        for row in option_rows:
+            options_by_step.setdefault(row["step_id"], []).append(
+                OptionContent(
+                    id=row["id"],
+                    step_id=row["step_id"],
+                    label=row["label"],
+                    content=row["content"],
+                    is_correct=bool(row["is_correct"]),
+                    feedback_md=row["feedback_md"],
+                    order_idx=row["order_idx"],
+                )
+            )
+
+        steps = {
+            row["id"]: StepContent(
+                id=row["id"],
+                module_id=row["module_id"],
+                type=row["type"],
+                title=row["title"],
+                content_md=row["content_md"],
+                order_idx=row["order_idx"],
+                extension_md=row["extension_md"],
+                options=tuple(options_by_step.get(row["id"], ())),
+            )
+            for row in step_rows
+        }
+        return cls(version=version, structure=structure, steps=steps)
+
+    def module_steps(self, module_id: int) -> list[StepContent]:
+        return [self.steps[s.id] for s in self.structure.module_steps(module_id)]
+
+
+def _step_response(s: StepContent, is_completed: bool) -> StepResponse:
+    options = None
+    if s.type in ("quiz", "practice"):
+        options = [
+            OptionResponse(id=o.id, label=o.label, content=o.content)
+            for o in s.options
+        ]
+    return StepResponse(
+        id=s.id,
+        module_id=s.module_id,
+        type=s.type,
+        title=s.title,
+        content_md=s.content_md,
+        order_idx=s.order_idx,
+        extension_md=s.extension_md,
+        options=options,
+        is_completed=is_completed,
+    )
+
+
+def build_step_responses(
+    content: CurriculumContent,
+    module_ids: list[int],
+    completed_step_ids: set[int] | dict[int, object],
+) -> dict[int, list[StepResponse]]:
+    """Assemble ``StepResponse`` lists for several modules in one pass.
+
+    Step bodies and options come from the cached content; the caller passes
+    the user's completion set, so no per-step queries are issued. Options
+    are exposed without ``is_correct``/``feedback_md``.
+    """
+    return {
+        module_id: [
+            _step_response(s, s.id in completed_step_ids)
+            for s in content.module_steps(module_id)
+        ]
+        for module_id in module_ids
+    }
+
+
+# ---------------------------------------------------------------------------
+# Pre-serialized step payloads
+# ---------------------------------------------------------------------------
+
+_COMPLETED_SUFFIX = b"false}"
+
+
+@dataclass(frozen=True)
+class ModuleStepPayload:
+    """JSON fragments for one module's step list, minus ``is_completed``.
+
+    Each fragment is a serialized ``StepResponse`` cut right before its
+    ``is_completed`` value (the model's last field), so a user-specific body
+    is a byte join rather than a Pydantic validation/serialization pass.
+    """
+
+    step_ids: tuple[int, ...]
+    fragments: tuple[bytes, ...]
+
+    @classmethod
+    def build(cls, steps: list[StepContent]) -> "ModuleStepPayload":
+        fragments = []
+        for s in steps:
+            raw = _step_response(s, False).model_dump_json().encode("utf-8")
+            if not raw.endswith(_COMPLETED_SUFFIX):
+                raise RuntimeError("StepResponse.is_completed must be its last field")
+            fragments.append(raw[: -len(_COMPLETED_SUFFIX)])
+        return cls(step_ids=tuple(s.id for s in steps), fragments=tuple(fragments))
+
+    def completion_mask(self, completed_step_ids) -> tuple[bool, ...]:
+        return tuple(step_id in completed_step_ids for step_id in self.step_ids)
+
+    def render(self, mask: tuple[bool, ...]) -> bytes:
+        return (
+            b"["
+            + b",".join(
+                fragment + (b"true}" if done else b"false}")
+                for fragment, done in zip(self.fragments, mask)
+            )
+            + b"]"
+        )
+
+
+class StepPayloadCache:
+    """Bounded LRU of rendered (and optionally compressed) step list bodies.
+
+    Keys are (content version, module id, completion mask, encoding); a
+    learner's completion mask only changes when they answer, so revisits hit
+    the cache and skip both serialization and compression.
+    """
+
+    def __init__(self, max_entries: int = 512) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._payloads: dict[tuple[int, int], ModuleStepPayload] = {}
+        self._bodies: OrderedDict[tuple, bytes] = OrderedDict()
+
+    def payload(self, content: CurriculumContent, module_id: int) -> ModuleStepPayload:
+        key = (content.version, module_id)
+        payload = self._payloads.get(key)
+        if payload is None:
+            payload = ModuleStepPayload.build(content.module_steps(module_id))
+            with self._lock:
+                # Drop payloads from older content versions.
+                if any(v != content.version for v, _ in self._payloads):
+                    self._payloads = {
+                        k: p for k, p in self._payloads.items() if k[0] == content.version
+                    }
+                self._payloads[key] = payload
+        return payload
+
+    def body(
+        self,
+        content: CurriculumContent,
+        module_id: int,
+        completed_step_ids,
+        encoding: str | None = None,
+    ) -> bytes:
+        payload = self.payload(content, module_id)
+        mask = payload.completion_mask(completed_step_ids)
+        key = (content.version, module_id, mask, encoding)
+        with self._lock:
+            body = self._bodies.get(key)
+            if body is not None:
+                self._bodies.move_to_end(key)
+                return body
+
+        body = payload.render(mask)
+        if encoding is not None:
+            body = compress(body, encoding)
+        with self._lock:
+            self._bodies[key] = body
+            while len(self._bodies) > self.max_entries:
+                self._bodies.popitem(last=False)
+        return body
+
+    def clear(self) -> None:
+        with self._lock:
+            self._payloads.clear()
+            self._bodies.clear()
+
+
+step_payload_cache = StepPayloadCache()
+
+
+def read_content_version(conn) -> int:
+    row = conn.execute(CONTENT_VERSION_SQL).fetchone()
+    return int(row["version"]) if row else 0
+
+
+async def aread_content_version(aconn) -> int:
+    row = await aconn.fetchone(CONTENT_VERSION_SQL)
+    return int(row["version"]) if row else 0
+
+
+class ContentCache:
+    """Thread-safe holder of the current ``CurriculumContent``."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._content: CurriculumContent | None = None
+
+    def get(self, conn) -> CurriculumContent:
+        """Return cached content, reloading it if the DB version moved."""
+        version = read_content_version(conn)
+        content = self._content
+        if content is not None and content.version == version:
+            return content
+        with self._lock:
+            content = self._content
+            if content is None or content.version != version:
+                content = CurriculumContent.load(conn, version)
+                self._content = content
+        return content
+
+    async def aget(self, aconn) -> CurriculumContent:
+        """Async variant of ``get`` for endpoints on the async DB path."""
+        version = await aread_content_version(aconn)
+        content = self._content
+        if content is not None and content.version == version:
+            return content
+        loaded = await CurriculumContent.aload(aconn, version)
+        with self._lock:
+            if self._content is None or self._content.version != version:
+                self._content = loaded
+            return self._content
+
+    def load(self, conn) -> CurriculumContent:
+        """Eagerly (re)load content, e.g. from the app lifespan."""
+        with self._lock:
+            self._content = CurriculumContent.load(conn, read_content_version(conn))
+            return self._content
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._content = None
+
+
+content_cache = ContentCache()
@@ -0,0 +1,188 @@
+"""Curriculum content as data: JSON source files and a compiled bundle.
+
+Source of truth is one JSON document per stage under ``data/curriculum/``
+(``stage_<id>.json``: stage -> modules -> steps -> options). The compiler
+writes ``data/curriculum.bundle``, a zlib-compressed compact JSON payload
+that loads in a few milliseconds, and ``apps/api/seed.py`` builds its
+``SeedPlan`` from that bundle.
+
+Run with:  python -m apps.api.curriculum [--check]
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sys
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+SOURCE_DIR = ROOT_DIR / "data" / "curriculum"
+BUNDLE_PATH = ROOT_DIR / "data" / "curriculum.bundle"
+BUNDLE_MAGIC = b"GEOCURRICULUM\x01"
+
+# Bump when the hashed representation changes, to force a full re-seed.
+SEED_HASH_VERSION = 1
+
+ModuleKey = tuple[int, int]  # (stage_id, order_idx)
+StepKey = tuple[ModuleKey, int]  # (module key, order_idx)
+
+
+# ---------------------------------------------------------------------------
+# Plan: desired content graph, keyed by natural keys
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class SeedPlan:
+    """Desired content graph built in memory before touching the DB.
+
+    Modules, steps and options are keyed by their natural unique keys
+    (``(stage_id, order_idx)`` and friends), so the plan can be built without
+    knowing surrogate ids. A repeated key overwrites the earlier entry.
+    """
+
+    stages: dict[int, tuple] = field(default_factory=dict)
+    modules: dict[ModuleKey, tuple[str, str]] = field(default_factory=dict)
+    steps: dict[StepKey, tuple[str, str, str, str | None]] = field(default_factory=dict)
+    options: dict[StepKey, dict[int, dict]] = field(default_factory=dict)
+
+    @classmethod
+    def from_documents(cls, documents: list[dict]) -> "SeedPlan":
+        """Build a plan from parsed stage documents."""
+        plan = cls()
+        for doc in documents:
+            stage_id = doc["id"]
+            unlock = doc.get("unlock_condition")
+            plan.stages[stage_id] = (
+                doc["title"],
+                doc["description"],
+                doc["order_idx"],
+                json.dumps(unlock, ensure_ascii=False) if unlock else None,
+            )
+            for module in doc["modules"]:
+                module_key = (stage_id, module["order_idx"])
+                plan.modules[module_key] = (module["title"], module["description"])
+                for step in module["steps"]:
+                    step_key = (module_key, step["order_idx"])
+                    plan.steps[step_key] = (
+                        step["type"],
+                        step["title"],
+                        step["content_md"],
+                        step.get("extension_md"),
+                    )
+                    for opt in step.get("options", ()):
+                        plan.options.setdefault(step_key, {})[opt["order_idx"]] = {
+                            "label": opt["label"],
+                            "content": opt["content"],
+                            "is_correct": int(opt["is_correct"]),
+                            "feedback_md": opt["feedback_md"],
+                            "order_idx": opt["order_idx"],
+                        }
+        return plan
+
+    def stage_hashes(self) -> dict[int, str]:
+        """Deterministic sha256 of each stage subtree (stage, modules, steps, options)."""
+        hashes = {}
+        for stage_id in sorted(self.stages):
+            subtree = {
+                "stage": self.stages[stage_id],
+                "modules": sorted(
+                    (key[1], *values)
+                    for key, values in self.modules.items()
+                    if key[0] == stage_id
+                ),
+                "steps": sorted(
+                    (module_key[1], order_idx, *values)
+                    for (module_key, order_idx), values in self.steps.items()
+                    if module_key[0] == stage_id
+                ),
+                "options": sorted(
+                    (
+                        module_key[1],
+                        step_order,
+                        opt["order_idx"],
+                        opt["label"],
+                        opt["content"],
+                        opt["is_correct"],
+                        opt["feedback_md"],
+                    )
+                    for (module_key, step_order), options in self.options.items()
+                    if module_key[0] == stage_id
+                    for opt in options.values()
+                ),
+            }
+            raw = json.dumps(
+                [SEED_HASH_VERSION, subtree], ensure_ascii=False, sort_keys=True
+            )
+            hashes[stage_id] = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+        return hashes
+
+    def only_stages(self, stage_ids: set[int]) -> "SeedPlan":
+        """Return the sub-plan covering ``stage_ids`` only."""
+        return SeedPlan(
+            stages={k: v for k, v in self.stages.items() if k in stage_ids},
+            modules={k: v for k, v in self.modules.items() if k[0] in stage_ids},
+            steps={k: v for k, v in self.steps.items() if k[0][0] in stage_ids},
+            options={k: v for k, v in self.options.items() if k[0][0] in stage_ids},
+        )
+
+
+def combined_hash(stage_hashes: dict[int, str]) -> str:
+    raw = ",".join(f"{stage_id}:{h}" for stage_id, h in sorted(stage_hashes.items()))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Source files and bundle
+# ---------------------------------------------------------------------------
+
+
+def read_source(source_dir: Path = SOURCE_DIR) -> list[dict]:
+    """Parse every ``stage_*.json`` document, ordered by stage id."""
+    documents = [
+        json.loads(path.read_text(encoding="utf-8"))
+        for path in source_dir.glob("stage_*.json")
+    ]
+    if not documents:
+        raise FileNotFoundError(f"No curriculum source files in {source_dir}")
+    return sorted(documents, key=lambda doc: doc["id"])
+
+
+def compile_bundle(documents: list[dict]) -> bytes:
+    payload = json.dumps(
+        {"stages": documents}, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+    return BUNDLE_MAGIC + zlib.compress(payload, 9)
+
+
+def read_bundle(bundle_path: Path = BUNDLE_PATH) -> list[dict]:
+    raw = bundle_path.read_bytes()
+    if not raw.startswith(BUNDLE_MAGIC):
+        raise ValueError(f"{bundle_path} is not a curriculum bundle")
+    payload = zlib.decompress(raw[len(BUNDLE_MAGIC) :])
+    return json.loads(payload)["stages"]
+
+
+def load_plan(bundle_path: Path = BUNDLE_PATH) -> SeedPlan:
+    """Load the compiled curriculum as a ``SeedPlan``."""
+    return SeedPlan.from_documents(read_bundle(bundle_path))
+
+
+def main(argv: list[str]) -> int:
+    bundle = compile_bundle(read_source())
+    if "--check" in argv:
+        if not BUNDLE_PATH.exists() or BUNDLE_PATH.read_bytes() != bundle:
+            print(f"{BUNDLE_PATH} is out of date; run python -m apps.api.curriculum")
+            return 1
+        print(f"{BUNDLE_PATH} is up to date.")
+        return 0
+    BUNDLE_PATH.write_bytes(bundle)
+    print(f"Wrote {BUNDLE_PATH} ({len(bundle)} bytes).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -4,8 +4,14 @@ from __future__ import annotations
 
 import os
 import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterable, Iterator, Sequence
 
 try:
     import psycopg
@@ -17,6 +23,7 @@ except ImportError:  # pragma: no cover - optional in local SQLite mode
 DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "geo_mentor.db"
 MIGRATIONS_DIR = Path(__file__).resolve().parent / "migrations"
 TRUTHY_VALUES = {"1", "true", "yes", "on"}
+QMARK_CACHE_SIZE = 512
 
 
 def _normalize_database_url(database_url: str) -> str:
@@ -52,10 +59,13 @@ def is_truthy_env(name: str, default: bool = False) -> bool:
     return value.strip().lower() in TRUTHY_VALUES
 
 
+@lru_cache(maxsize=QMARK_CACHE_SIZE)
 def _convert_qmark_to_postgres(query: str) -> str:
     """Convert DB-API qmark placeholders to psycopg placeholders.
 
     This keeps existing SQLite-style SQL in application code portable.
+    Application SQL is a small fixed set of strings, so conversions are
+    memoized by query text and the scan runs once per distinct statement.
     """
     if "?" not in query:
         return query
@@ -127,17 +137,88 @@ def _split_sql_statements(sql_script: str) -> list[str]:
     return statements
 
 
+# ---------------------------------------------------------------------------
+# Hot statements and server-side prepares
+# ---------------------------------------------------------------------------
+
+HOT_QUERIES: set[str] = set()
+
+
+def hot_query(query: str) -> str:
+    """Register ``query`` as a hot-path statement and return it unchanged.
+
+    With ``DB_PREPARE_STATEMENTS`` on, PostgreSQL connections execute hot
+    statements with ``prepare=True`` so the server plans them once per
+    session. It is opt-in because session-level prepared statements do not
+    survive transaction-mode poolers such as PgBouncer.
+    """
+    HOT_QUERIES.add(query)
+    return query
+
+
+class _PrepareCounter:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.prepared = 0
+        self.reused = 0
+
+    def record(self, reused: bool) -> None:
+        with self._lock:
+            if reused:
+                self.reused += 1
+            else:
+                self.prepared += 1
+
+
+_prepare_counter = _PrepareCounter()
+
+
+def query_stats() -> dict:
+    """Placeholder-conversion cache and prepared-statement counters."""
+    info = _convert_qmark_to_postgres.cache_info()
+    return {
+        "conversion_hits": info.hits,
+        "conversion_misses": info.misses,
+        "conversion_cache_size": info.currsize,
+        "statements_prepared": _prepare_counter.prepared,
+        "prepare_hits": _prepare_counter.reused,
+    }
+
+
+def _postgres_statement(
+    query: str, prepared: set[str] | None
+) -> tuple[str, bool | None]:
+    """Return the psycopg query text and ``prepare`` flag for ``query``.
+
+    ``prepared`` is the connection's set of already-prepared statements, or
+    ``None`` when prepares are disabled (psycopg's own heuristic applies).
+    """
+    converted = _convert_qmark_to_postgres(query)
+    if prepared is None or query not in HOT_QUERIES:
+        return converted, None
+    _prepare_counter.record(converted in prepared)
+    prepared.add(converted)
+    return converted, True
+
+
 class PostgresConnection:
     """Tiny compatibility layer with sqlite3.Connection API used by the app."""
 
-    def __init__(self, conn):
+    def __init__(self, conn, *, prepare: bool = False):
         self._conn = conn
+        self._prepared: set[str] | None = set() if prepare else None
 
     def execute(self, query: str, params: Sequence | Iterable | None = None):
-        converted = _convert_qmark_to_postgres(query)
+        converted, prepare = _postgres_statement(query, self._prepared)
         if params is None:
-            return self._conn.execute(converted)
-        return self._conn.execute(converted, tuple(params))
+            return self._conn.execute(converted, prepare=prepare)
+        return self._conn.execute(converted, tuple(params), prepare=prepare)
+
+    def executemany(self, query: str, params_seq: Iterable[Sequence]) -> None:
+        # psycopg pipelines executemany, so a batch costs ~one round trip.
+        converted = _convert_qmark_to_postgres(query)
+        with self._conn.cursor() as cur:
+            cur.executemany(converted, [tuple(params) for params in params_seq])
 
     def commit(self) -> None:
         self._conn.commit()
@@ -149,14 +230,41 @@ class PostgresConnection:
         self._conn.close()
 
 
-def get_db() -> sqlite3.Connection | PostgresConnection:
-    """Return a backend-aware DB connection.
+# ---------------------------------------------------------------------------
+# SQLite performance profile
+# ---------------------------------------------------------------------------
 
-    Priority:
-    1) DATABASE_URL postgres* -> PostgreSQL
-    2) DATABASE_URL sqlite:///... or SQLITE_PATH -> SQLite path
-    3) default SQLite path data/geo_mentor.db
+
+def sqlite_pragmas() -> list[tuple[str, str]]:
+    """PRAGMAs applied to every new SQLite connection, in order.
+
+    ``foreign_keys`` is always on. Unless ``SQLITE_PERFORMANCE_PROFILE`` is
+    off, the connection also switches to WAL (readers no longer block on a
+    writer), ``synchronous=NORMAL`` (durable across app crashes; the last
+    commits can be lost only on power loss), a memory-mapped read path, a
+    larger page cache, an in-memory temp store and a busy timeout so a
+    briefly locked database waits instead of failing.
     """
+    pragmas = [("foreign_keys", "ON")]
+    if not is_truthy_env("SQLITE_PERFORMANCE_PROFILE", default=True):
+        return pragmas
+    return pragmas + [
+        ("journal_mode", "WAL"),
+        ("synchronous", "NORMAL"),
+        ("busy_timeout", str(_env_int("SQLITE_BUSY_TIMEOUT_MS", 5000))),
+        ("mmap_size", str(_env_int("SQLITE_MMAP_SIZE", 256 * 1024 * 1024))),
+        # Negative cache_size is in KiB rather than pages.
+        ("cache_size", str(-_env_int("SQLITE_CACHE_SIZE_KIB", 64 * 1024))),
+        ("temp_store", "MEMORY"),
+    ]
+
+
+def _apply_sqlite_pragmas(conn: sqlite3.Connection) -> None:
+    for name, value in sqlite_pragmas():
+        conn.execute(f"PRAGMA {name} = {value}")
+
+
+def _connect(*, shared: bool = False) -> sqlite3.Connection | PostgresConnection:
     database_url = os.getenv("DATABASE_URL", "").strip()
 
     if _is_postgres_url(database_url):
@@ -167,16 +275,293 @@ def get_db() -> sqlite3.Connection | PostgresConnection:
             )
         normalized = _normalize_database_url(database_url)
         conn = psycopg.connect(normalized, row_factory=dict_row)
-        return PostgresConnection(conn)
+        return PostgresConnection(conn, prepare=is_truthy_env("DB_PREPARE_STATEMENTS"))
 
     db_path = _resolve_sqlite_path(database_url)
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(db_path))
+    # Pooled SQLite connections are handed between threadpool workers, but
+    # only ever used by one request at a time.
+    conn = sqlite3.connect(str(db_path), check_same_thread=not shared)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
+    # Pooled connections live long, so the profile is paid once per connection.
+    _apply_sqlite_pragmas(conn)
     return conn
 
 
+def get_db() -> sqlite3.Connection | PostgresConnection:
+    """Return a backend-aware DB connection.
+
+    Priority:
+    1) DATABASE_URL postgres* -> PostgreSQL
+    2) DATABASE_URL sqlite:///... or SQLITE_PATH -> SQLite path
+    3) default SQLite path data/geo_mentor.db
+
+    The caller owns the connection and must close it. Request handlers use
+    the pooled ``db_connection`` dependency instead.
+    """
+    return _connect()
+
+
+# ---------------------------------------------------------------------------
+# Connection pool
+# ---------------------------------------------------------------------------
+
+
+class PoolTimeout(RuntimeError):
+    """Raised when no pooled connection becomes available in time."""
+
+
+class PoolClosed(RuntimeError):
+    """Raised when acquiring from a pool that has been closed."""
+
+
+@dataclass
+class _PoolEntry:
+    conn: sqlite3.Connection | PostgresConnection
+    created_at: float
+    last_used_at: float
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name, "").strip()
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name, "").strip()
+    return float(value) if value else default
+
+
+def pool_budget() -> tuple[int, int]:
+    """Split the per-process ``DB_POOL_MAX_SIZE`` into (sync, async) pool sizes.
+
+    Both pools open connections to the same database, so they share one
+    budget: ``DB_ASYNC_POOL_MAX_SIZE`` (default: half) goes to the async
+    pool and the rest to the sync pool.
+    """
+    total = _env_int("DB_POOL_MAX_SIZE", 10)
+    async_size = _env_int("DB_ASYNC_POOL_MAX_SIZE", max(total // 2, 1))
+    if not 1 <= async_size < total:
+        raise ValueError(
+            f"DB_ASYNC_POOL_MAX_SIZE={async_size} must leave at least one "
+            f"connection of DB_POOL_MAX_SIZE={total} to the sync pool"
+        )
+    return total - async_size, async_size
+
+
+class ConnectionPool:
+    """Thread-safe pool of backend-aware connections.
+
+    - keeps at least ``min_size`` idle connections open and never more than
+      ``max_size`` in total;
+    - health-checks (``SELECT 1``) a connection that sat idle longer than
+      ``check_idle_seconds`` before handing it out;
+    - closes connections older than ``max_lifetime_seconds`` on release or
+      acquire, so long-lived Postgres sessions get recycled.
+    """
+
+    def __init__(
+        self,
+        connect=None,
+        *,
+        min_size: int = 1,
+        max_size: int = 10,
+        max_lifetime_seconds: float = 3600.0,
+        check_idle_seconds: float = 30.0,
+        timeout_seconds: float = 30.0,
+    ):
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError(
+                f"Invalid pool size: min_size={min_size}, max_size={max_size}"
+            )
+        self._connect = connect or (lambda: _connect(shared=True))
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_lifetime_seconds = max_lifetime_seconds
+        self.check_idle_seconds = check_idle_seconds
+        self.timeout_seconds = timeout_seconds
+        self._idle: deque[_PoolEntry] = deque()
+        self._in_use: dict[int, _PoolEntry] = {}
+        self._connecting = 0
+        self._cond = threading.Condition()
+        self._closed = False
+
+    @classmethod
+    def from_env(cls) -> "ConnectionPool":
+        max_size, _ = pool_budget()
+        return cls(
+            min_size=min(_env_int("DB_POOL_MIN_SIZE", 1), max_size),
+            max_size=max_size,
+            max_lifetime_seconds=_env_float("DB_POOL_MAX_LIFETIME_SECONDS", 3600.0),
+            check_idle_seconds=_env_float("DB_POOL_CHECK_IDLE_SECONDS", 30.0),
+            timeout_seconds=_env_float("DB_POOL_TIMEOUT_SECONDS", 30.0),
+        )
+
+    @property
+    def size(self) -> int:
+        with self._cond:
+            return self._total()
+
+    def _total(self) -> int:
+        return len(self._idle) + len(self._in_use) + self._connecting
+
+    def open(self) -> None:
+        """Pre-open ``min_size`` connections (called from app startup)."""
+        with self._cond:
+            self._closed = False
+            missing = self.min_size - self._total()
+        for _ in range(max(missing, 0)):
+            entry = self._new_entry()
+            with self._cond:
+                self._idle.append(entry)
+                self._cond.notify()
+
+    def close(self) -> None:
+        """Close idle connections; in-use ones are closed when released.
+
+        Waiting and later ``acquire`` calls raise ``PoolClosed`` until
+        ``open`` is called again.
+        """
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+        for entry in idle:
+            _close_quietly(entry.conn)
+
+    def acquire(self) -> sqlite3.Connection | PostgresConnection:
+        deadline = time.monotonic() + self.timeout_seconds
+        while True:
+            with self._cond:
+                while (
+                    not self._closed
+                    and not self._idle
+                    and self._total() >= self.max_size
+                ):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolTimeout(
+                            f"No DB connection available within {self.timeout_seconds}s "
+                            f"(max_size={self.max_size})"
+                        )
+                    self._cond.wait(remaining)
+                if self._closed:
+                    raise PoolClosed("DB connection pool is closed")
+                entry = self._idle.pop() if self._idle else None
+                if entry is None:
+                    # Reserve the slot while connecting outside the lock.
+                    self._connecting += 1
+
+            if entry is None:
+                try:
+                    entry = self._new_entry()
+                finally:
+                    with self._cond:
+                        self._connecting -= 1
+                        self._cond.notify()
+            elif self._is_expired(entry) or not self._is_healthy(entry):
+                _close_quietly(entry.conn)
+                continue
+
+            with self._cond:
+                closed = self._closed
+                if not closed:
+                    self._in_use[id(entry.conn)] = entry
+            if closed:
+                _close_quietly(entry.conn)
+                raise PoolClosed("DB connection pool is closed")
+            return entry.conn
+
+    def release(self, conn, *, discard: bool = False) -> None:
+        with self._cond:
+            entry = self._in_use.pop(id(conn), None)
+        if entry is None:
+            _close_quietly(conn)
+            return
+
+        if not discard:
+            try:
+                # Never hand out a connection with a half-finished transaction;
+                # a failing rollback means the session itself is broken.
+                conn.rollback()
+            except Exception:
+                discard = True
+
+        with self._cond:
+            keep = not discard and not self._closed and not self._is_expired(entry)
+            if keep:
+                entry.last_used_at = time.monotonic()
+                self._idle.append(entry)
+            self._cond.notify()
+        if not keep:
+            _close_quietly(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection | PostgresConnection]:
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def _new_entry(self) -> _PoolEntry:
+        now = time.monotonic()
+        return _PoolEntry(conn=self._connect(), created_at=now, last_used_at=now)
+
+    def _is_expired(self, entry: _PoolEntry) -> bool:
+        if self.max_lifetime_seconds <= 0:
+            return False
+        return time.monotonic() - entry.created_at > self.max_lifetime_seconds
+
+    def _is_healthy(self, entry: _PoolEntry) -> bool:
+        if time.monotonic() - entry.last_used_at < self.check_idle_seconds:
+            return True
+        try:
+            entry.conn.execute("SELECT 1").fetchone()
+            entry.conn.rollback()
+            return True
+        except Exception:
+            return False
+
+
+def _close_quietly(conn) -> None:
+    if conn is None:
+        return
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """Return the process-wide pool, creating it from env on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool.from_env()
+    return _pool
+
+
+def close_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
+
+
+def db_connection() -> Iterator[sqlite3.Connection | PostgresConnection]:
+    """FastAPI dependency yielding a pooled connection for one request."""
+    with get_pool().connection() as conn:
+        yield conn
+
+
 def _ensure_schema_migrations_table(conn) -> None:
     conn.execute(
         """
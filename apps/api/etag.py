@@ -0,0 +1,76 @@
+"""Strong ETags for per-user curriculum responses.
+
+A module/step response only changes when the content graph changes
+(``content_version``) or when the user writes progress
+(``user_progress_version``, bumped by triggers from migration
+``004_user_progress_version``). Both counters are read before any payload is
+built, so a matching ``If-None-Match`` is answered with 304 and no body.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+from fastapi import Response
+
+from apps.api.database import hot_query
+
+PROGRESS_VERSION_SQL = hot_query(
+    "SELECT version FROM user_progress_version WHERE user_id = ?"
+)
+CACHE_CONTROL = "private, no-cache"
+
+
+def read_progress_version(conn, user_id: str) -> int:
+    row = conn.execute(PROGRESS_VERSION_SQL, (user_id,)).fetchone()
+    return int(row["version"]) if row else 0
+
+
+async def aread_progress_version(aconn, user_id: str) -> int:
+    row = await aconn.fetchone(PROGRESS_VERSION_SQL, (user_id,))
+    return int(row["version"]) if row else 0
+
+
+def make_etag(
+    scope: str,
+    user_id: str,
+    content_version: int,
+    progress_version: int,
+    encoding: str | None = None,
+) -> str:
+    """Return a quoted strong ETag for one resource as seen by one user.
+
+    Strong ETags identify exact bytes, so a response whose body depends on
+    the negotiated ``Content-Encoding`` must pass that ``encoding`` in.
+    """
+    raw = f"{scope}|{user_id}|{content_version}|{progress_version}"
+    if encoding is not None:
+        raw += f"|{encoding}"
+    return '"' + hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Evaluate an ``If-None-Match`` header against ``etag`` (weak comparison)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str, vary: str | None = None) -> Response:
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if vary is not None:
+        headers["Vary"] = vary
+    return Response(status_code=304, headers=headers)
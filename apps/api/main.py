@@ -14,31 +14,58 @@ import time
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import Depends, FastAPI, Header, HTTPException
+from fastapi import Depends, FastAPI, Header, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 
-from apps.api.database import get_db, init_db, is_truthy_env
+from apps.api.async_database import async_db_connection, close_async_pool
+from apps.api.compression import CompressionMiddleware, negotiate_encoding
+from apps.api.content import build_step_responses, content_cache, step_payload_cache
+from apps.api.database import (
+    close_pool,
+    db_connection,
+    get_pool,
+    hot_query,
+    init_db,
+    is_truthy_env,
+    query_stats,
+)
+from apps.api.etag import (
+    aread_progress_version,
+    etag_matches,
+    make_etag,
+    not_modified,
+    read_progress_version,
+    set_etag,
+)
 from apps.api.models import (
     AdminStatsResponse,
     AnswerRequest,
     AnswerResponse,
+    CohortStatsResponse,
     EvaluateResponse,
     LoginRequest,
     LoginResponse,
     LogoutResponse,
     MeResponse,
+    MetricsResponse,
     ModuleResponse,
-    ModuleStats,
-    OptionResponse,
+    ModuleSteps,
     OptionReveal,
     ProgressResponse,
+    QueryStats,
     ReadingCompleteResponse,
     StageProgress,
     StageResponse,
     StepResponse,
+    TokenCacheStats,
+    UserStats,
 )
+from apps.api.progress import REFRESH_MODULE_ROLLUP_SQL, UserProgressSnapshot
+from apps.api.stats import compute_admin_stats
+from apps.api.token_cache import token_cache
+from apps.api.write_queue import awrite, close_write_queue, write
 
 # ---------------------------------------------------------------------------
 # Lifespan — initialise DB on startup
@@ -52,7 +79,14 @@ async def lifespan(application: FastAPI):  # noqa: ARG001
         from apps.api.seed import seed
 
         seed(run_migrations=False)
+    pool = get_pool()
+    pool.open()
+    with pool.connection() as conn:
+        content_cache.load(conn)
     yield
+    close_write_queue()
+    await close_async_pool()
+    close_pool()
 
 
 # ---------------------------------------------------------------------------
@@ -74,6 +108,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(CompressionMiddleware)
 
 # ---------------------------------------------------------------------------
 # Static files — serve apps/web/ at "/"
@@ -89,6 +124,11 @@ WEB_DIR = Path(__file__).resolve().parent.parent / "web"
 ALLOWED_USER_IDS = {f"b2b_mkt_{idx}" for idx in range(1, 11)}
 SESSION_SECRET = os.getenv("SESSION_SECRET", "dev-session-secret-change-me")
 SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", "604800"))
+ADMIN_USER_IDS = {
+    user_id.strip()
+    for user_id in os.getenv("ADMIN_USER_IDS", "b2b_mkt_1").split(",")
+    if user_id.strip()
+}
 
 
 def _b64url_encode(raw: bytes) -> str:
@@ -122,6 +162,10 @@ def _create_access_token(user_id: str) -> str:
 
 
 def _decode_access_token(token: str) -> str:
+    cached_user_id = token_cache.get(token)
+    if cached_user_id is not None:
+        return cached_user_id
+
     try:
         payload_b64, signature = token.split(".", 1)
     except ValueError as exc:
@@ -142,6 +186,7 @@ def _decode_access_token(token: str) -> str:
         raise HTTPException(status_code=401, detail="Token expired")
     if user_id not in ALLOWED_USER_IDS:
         raise HTTPException(status_code=401, detail="Unknown user")
+    token_cache.put(token, user_id, exp)
     return user_id
 
 
@@ -156,68 +201,17 @@ def get_current_user_id(
     return _decode_access_token(token)
 
 
-def _is_stage_unlocked(stage_row, conn, user_id: str) -> bool:
-    """Check whether a stage is unlocked for the current user."""
-    if stage_row["id"] == 1:
-        return True
-    if not stage_row["unlock_condition"]:
-        return True
-
-    condition = json.loads(stage_row["unlock_condition"])
-    required_stage = condition.get("require_stage_complete")
-    min_score = condition.get("min_score_pct", 70)
-
-    if required_stage is None:
-        return True
-
-    # Find last module (highest order_idx) in the required stage
-    last_module = conn.execute(
-        "SELECT id FROM modules WHERE stage_id = ? ORDER BY order_idx DESC LIMIT 1",
-        (required_stage,),
-    ).fetchone()
-    if not last_module:
-        return False
-
-    # Get quiz steps in that module
-    quiz_steps = conn.execute(
-        "SELECT id FROM steps WHERE module_id = ? AND type = 'quiz'",
-        (last_module["id"],),
-    ).fetchall()
-    if not quiz_steps:
-        return False
-
-    quiz_step_ids = [s["id"] for s in quiz_steps]
-    placeholders = ",".join("?" * len(quiz_step_ids))
-    correct = conn.execute(
-        f"SELECT COUNT(*) AS cnt FROM user_progress "
-        f"WHERE user_id = ? AND step_id IN ({placeholders}) AND is_correct = 1",
-        [user_id, *quiz_step_ids],
-    ).fetchone()["cnt"]
-
-    score_pct = (correct / len(quiz_step_ids)) * 100
-    return score_pct >= min_score
-
-
-def _module_completed_steps(module_id: int, conn, user_id: str) -> tuple[int, int]:
-    """Return (completed_steps, total_steps) for a module."""
-    total = conn.execute(
-        "SELECT COUNT(*) AS cnt FROM steps WHERE module_id = ?",
-        (module_id,),
-    ).fetchone()["cnt"]
-
-    completed = conn.execute(
-        "SELECT COUNT(*) AS cnt FROM user_progress up "
-        "JOIN steps s ON up.step_id = s.id "
-        "WHERE s.module_id = ? AND up.user_id = ?",
-        (module_id, user_id),
-    ).fetchone()["cnt"]
-
-    return completed, total
+def require_admin(user_id: str = Depends(get_current_user_id)) -> str:
+    """Dependency for endpoints exposing other accounts or server internals."""
+    if user_id not in ADMIN_USER_IDS:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return user_id
 
 
-def _is_module_completed(module_id: int, conn, user_id: str) -> bool:
-    completed, total = _module_completed_steps(module_id, conn, user_id)
-    return total > 0 and completed >= total
+def _load_snapshot(conn, user_id: str) -> UserProgressSnapshot:
+    """Build the user's progress snapshot on top of the cached structure."""
+    structure = content_cache.get(conn).structure
+    return UserProgressSnapshot.load(conn, user_id, structure)
 
 
 # ---------------------------------------------------------------------------
@@ -255,378 +249,306 @@ def logout(_: str = Depends(get_current_user_id)):
 
 
 @app.get("/api/stages", response_model=list[StageResponse])
-def list_stages(user_id: str = Depends(get_current_user_id)):
+def list_stages(
+    user_id: str = Depends(get_current_user_id),
+    conn=Depends(db_connection),
+):
     """Return all stages with unlock status and progress."""
-    conn = get_db()
-    try:
-        stages = conn.execute(
-            "SELECT * FROM stages ORDER BY order_idx"
-        ).fetchall()
-
-        result: list[StageResponse] = []
-        for s in stages:
-            modules = conn.execute(
-                "SELECT id FROM modules WHERE stage_id = ?", (s["id"],)
-            ).fetchall()
-            total_modules = len(modules)
-            completed_modules = sum(
-                1 for m in modules if _is_module_completed(m["id"], conn, user_id)
-            )
-            result.append(
-                StageResponse(
-                    id=s["id"],
-                    title=s["title"],
-                    description=s["description"],
-                    order_idx=s["order_idx"],
-                    is_unlocked=_is_stage_unlocked(s, conn, user_id),
-                    completed_modules=completed_modules,
-                    total_modules=total_modules,
-                )
-            )
-        return result
-    finally:
-        conn.close()
+    snapshot = _load_snapshot(conn, user_id)
+    return [
+        StageResponse(
+            id=s.id,
+            title=s.title,
+            description=s.description,
+            order_idx=s.order_idx,
+            is_unlocked=snapshot.is_stage_unlocked(s),
+            completed_modules=snapshot.completed_modules(s.id),
+            total_modules=snapshot.total_modules(s.id),
+        )
+        for s in snapshot.structure.stages
+    ]
+
+
+def _module_response(module, snapshot: UserProgressSnapshot) -> ModuleResponse:
+    completed, total = snapshot.module_completed_steps(module.id)
+    return ModuleResponse(
+        id=module.id,
+        stage_id=module.stage_id,
+        title=module.title,
+        description=module.description,
+        order_idx=module.order_idx,
+        completed_steps=completed,
+        total_steps=total,
+    )
 
 
 @app.get("/api/stages/{stage_id}/modules", response_model=list[ModuleResponse])
-def list_modules(stage_id: int, user_id: str = Depends(get_current_user_id)):
+def list_modules(
+    stage_id: int,
+    response: Response,
+    user_id: str = Depends(get_current_user_id),
+    if_none_match: str | None = Header(default=None),
+    accept_encoding: str | None = Header(default=None),
+    conn=Depends(db_connection),
+):
     """Return modules within a stage, with progress info."""
-    conn = get_db()
-    try:
-        stage = conn.execute(
-            "SELECT * FROM stages WHERE id = ?", (stage_id,)
-        ).fetchone()
-        if not stage:
-            raise HTTPException(status_code=404, detail="Stage not found")
-
-        modules = conn.execute(
-            "SELECT * FROM modules WHERE stage_id = ? ORDER BY order_idx",
-            (stage_id,),
-        ).fetchall()
-
-        result: list[ModuleResponse] = []
-        for m in modules:
-            completed, total = _module_completed_steps(m["id"], conn, user_id)
-            result.append(
-                ModuleResponse(
-                    id=m["id"],
-                    stage_id=m["stage_id"],
-                    title=m["title"],
-                    description=m["description"],
-                    order_idx=m["order_idx"],
-                    completed_steps=completed,
-                    total_steps=total,
-                )
-            )
-        return result
-    finally:
-        conn.close()
+    content = content_cache.get(conn)
+    if content.structure.stage(stage_id) is None:
+        raise HTTPException(status_code=404, detail="Stage not found")
+
+    etag = make_etag(
+        f"stage-modules:{stage_id}",
+        user_id,
+        content.version,
+        read_progress_version(conn, user_id),
+        negotiate_encoding(accept_encoding),
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, vary="Accept-Encoding")
+    set_etag(response, etag)
+    response.headers["Vary"] = "Accept-Encoding"
+
+    snapshot = UserProgressSnapshot.load(conn, user_id, content.structure)
+    return [
+        _module_response(m, snapshot)
+        for m in snapshot.structure.stage_modules(stage_id)
+    ]
 
 
 @app.get("/api/modules/{module_id}", response_model=ModuleResponse)
-def get_module(module_id: int, user_id: str = Depends(get_current_user_id)):
+def get_module(
+    module_id: int,
+    response: Response,
+    user_id: str = Depends(get_current_user_id),
+    if_none_match: str | None = Header(default=None),
+    accept_encoding: str | None = Header(default=None),
+    conn=Depends(db_connection),
+):
     """Return a single module with progress info."""
-    conn = get_db()
-    try:
-        m = conn.execute(
-            "SELECT * FROM modules WHERE id = ?", (module_id,)
-        ).fetchone()
-        if not m:
-            raise HTTPException(status_code=404, detail="Module not found")
-
-        completed, total = _module_completed_steps(m["id"], conn, user_id)
-        return ModuleResponse(
-            id=m["id"],
-            stage_id=m["stage_id"],
-            title=m["title"],
-            description=m["description"],
-            order_idx=m["order_idx"],
-            completed_steps=completed,
-            total_steps=total,
-        )
-    finally:
-        conn.close()
+    content = content_cache.get(conn)
+    m = content.structure.modules.get(module_id)
+    if m is None:
+        raise HTTPException(status_code=404, detail="Module not found")
+
+    etag = make_etag(
+        f"module:{module_id}",
+        user_id,
+        content.version,
+        read_progress_version(conn, user_id),
+        negotiate_encoding(accept_encoding),
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, vary="Accept-Encoding")
+    set_etag(response, etag)
+    response.headers["Vary"] = "Accept-Encoding"
+
+    snapshot = UserProgressSnapshot.load(conn, user_id, content.structure)
+    return _module_response(m, snapshot)
 
 
 @app.get(
     "/api/modules/{module_id}/steps", response_model=list[StepResponse]
 )
-def list_steps(module_id: int, user_id: str = Depends(get_current_user_id)):
-    """Return steps within a module, with options (hiding is_correct/feedback)."""
-    conn = get_db()
-    try:
-        m = conn.execute(
-            "SELECT id FROM modules WHERE id = ?", (module_id,)
-        ).fetchone()
-        if not m:
-            raise HTTPException(status_code=404, detail="Module not found")
-
-        steps = conn.execute(
-            "SELECT * FROM steps WHERE module_id = ? ORDER BY order_idx",
-            (module_id,),
-        ).fetchall()
-
-        result: list[StepResponse] = []
-        for s in steps:
-            # Check completion
-            progress = conn.execute(
-                "SELECT id FROM user_progress WHERE user_id = ? AND step_id = ?",
-                (user_id, s["id"]),
-            ).fetchone()
-            is_completed = progress is not None
-
-            # Get options for quiz/practice steps
-            options = None
-            if s["type"] in ("quiz", "practice"):
-                opt_rows = conn.execute(
-                    "SELECT id, label, content FROM options "
-                    "WHERE step_id = ? ORDER BY order_idx",
-                    (s["id"],),
-                ).fetchall()
-                options = [
-                    OptionResponse(
-                        id=o["id"], label=o["label"], content=o["content"]
-                    )
-                    for o in opt_rows
-                ]
-
-            result.append(
-                StepResponse(
-                    id=s["id"],
-                    module_id=s["module_id"],
-                    type=s["type"],
-                    title=s["title"],
-                    content_md=s["content_md"],
-                    order_idx=s["order_idx"],
-                    extension_md=s["extension_md"],
-                    options=options,
-                    is_completed=is_completed,
-                )
-            )
-        return result
-    finally:
-        conn.close()
+async def list_steps(
+    module_id: int,
+    user_id: str = Depends(get_current_user_id),
+    if_none_match: str | None = Header(default=None),
+    accept_encoding: str | None = Header(default=None),
+    aconn=Depends(async_db_connection),
+):
+    """Return steps within a module, with options (hiding is_correct/feedback).
+
+    The body comes pre-serialized (and pre-compressed) from
+    ``step_payload_cache``; only the user's completion flags vary.
+    """
+    content = await content_cache.aget(aconn)
+    if module_id not in content.structure.modules:
+        raise HTTPException(status_code=404, detail="Module not found")
+
+    encoding = negotiate_encoding(accept_encoding)
+    etag = make_etag(
+        f"module-steps:{module_id}",
+        user_id,
+        content.version,
+        await aread_progress_version(aconn, user_id),
+        encoding,
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, vary="Accept-Encoding")
+
+    snapshot = await UserProgressSnapshot.aload(
+        aconn, user_id, content.structure, include_steps=True
+    )
+    body = step_payload_cache.body(content, module_id, snapshot.progress, encoding)
+    response = Response(
+        content=body,
+        media_type="application/json",
+        headers={"Vary": "Accept-Encoding"},
+    )
+    if encoding is not None:
+        response.headers["Content-Encoding"] = encoding
+    set_etag(response, etag)
+    return response
+
+
+SAVE_READING_SQL = hot_query(
+    "INSERT INTO user_progress "
+    "(user_id, step_id, selected_option_id, is_correct, time_spent_seconds) "
+    "VALUES (?, ?, NULL, NULL, ?) "
+    "ON CONFLICT(user_id, step_id) DO UPDATE SET "
+    "selected_option_id = NULL, "
+    "is_correct = NULL, "
+    "time_spent_seconds = excluded.time_spent_seconds, "
+    "completed_at = CURRENT_TIMESTAMP"
+)
+SAVE_ANSWER_SQL = hot_query(
+    "INSERT INTO user_progress "
+    "(user_id, step_id, selected_option_id, is_correct, time_spent_seconds) "
+    "VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT(user_id, step_id) DO UPDATE SET "
+    "selected_option_id = excluded.selected_option_id, "
+    "is_correct = excluded.is_correct, "
+    "time_spent_seconds = excluded.time_spent_seconds, "
+    "completed_at = CURRENT_TIMESTAMP"
+)
 
 
 @app.post("/api/steps/{step_id}/answer")
-def submit_answer(
+async def submit_answer(
     step_id: int,
     body: AnswerRequest | None = None,
     user_id: str = Depends(get_current_user_id),
+    aconn=Depends(async_db_connection),
 ):
     """Submit an answer for a quiz/practice step, or mark a reading step as complete."""
-    conn = get_db()
-    try:
-        step = conn.execute(
-            "SELECT * FROM steps WHERE id = ?", (step_id,)
-        ).fetchone()
-        if not step:
-            raise HTTPException(status_code=404, detail="Step not found")
-
-        # ---- Reading step: just mark complete ----
-        if step["type"] == "reading":
-            time_spent = body.time_spent_seconds if body and body.time_spent_seconds else 0
-            conn.execute(
-                "INSERT INTO user_progress "
-                "(user_id, step_id, selected_option_id, is_correct, time_spent_seconds) "
-                "VALUES (?, ?, NULL, NULL, ?) "
-                "ON CONFLICT(user_id, step_id) DO UPDATE SET "
-                "selected_option_id = NULL, "
-                "is_correct = NULL, "
-                "time_spent_seconds = excluded.time_spent_seconds, "
-                "completed_at = CURRENT_TIMESTAMP",
-                (user_id, step_id, time_spent),
-            )
-            conn.commit()
-            return JSONResponse(
-                content={"completed": True},
-                media_type="application/json; charset=utf-8",
-            )
-
-        # ---- Quiz / Practice: require an option ----
-        if body is None or body.selected_option_id is None:
-            raise HTTPException(
-                status_code=422,
-                detail="selected_option_id is required for quiz/practice steps",
-            )
-
-        selected = conn.execute(
-            "SELECT * FROM options WHERE id = ? AND step_id = ?",
-            (body.selected_option_id, step_id),
-        ).fetchone()
-        if not selected:
-            raise HTTPException(
-                status_code=404,
-                detail="Option not found for this step",
-            )
-
-        is_correct = bool(selected["is_correct"])
-
-        # UPSERT progress
-        time_spent = body.time_spent_seconds if body.time_spent_seconds else 0
-        conn.execute(
-            "INSERT INTO user_progress "
-            "(user_id, step_id, selected_option_id, is_correct, time_spent_seconds) "
-            "VALUES (?, ?, ?, ?, ?) "
-            "ON CONFLICT(user_id, step_id) DO UPDATE SET "
-            "selected_option_id = excluded.selected_option_id, "
-            "is_correct = excluded.is_correct, "
-            "time_spent_seconds = excluded.time_spent_seconds, "
-            "completed_at = CURRENT_TIMESTAMP",
-            (user_id, step_id, body.selected_option_id, int(is_correct), time_spent),
-        )
-        conn.commit()
-
-        # Find correct option
-        correct_opt = conn.execute(
-            "SELECT * FROM options WHERE step_id = ? AND is_correct = 1 LIMIT 1",
-            (step_id,),
-        ).fetchone()
-
-        response = AnswerResponse(
-            is_correct=is_correct,
-            selected_feedback_md=selected["feedback_md"],
-            correct_option=OptionReveal(
-                id=correct_opt["id"],
-                label=correct_opt["label"],
-                content=correct_opt["content"],
-                feedback_md=correct_opt["feedback_md"],
-            ),
+    step = (await content_cache.aget(aconn)).steps.get(step_id)
+    if step is None:
+        raise HTTPException(status_code=404, detail="Step not found")
+
+    # ---- Reading step: just mark complete ----
+    if step.type == "reading":
+        time_spent = body.time_spent_seconds if body and body.time_spent_seconds else 0
+        await awrite(
+            aconn,
+            [
+                (SAVE_READING_SQL, (user_id, step_id, time_spent)),
+                (REFRESH_MODULE_ROLLUP_SQL, (user_id, step.module_id)),
+            ],
         )
         return JSONResponse(
-            content=response.model_dump(),
+            content={"completed": True},
             media_type="application/json; charset=utf-8",
         )
-    finally:
-        conn.close()
+
+    # ---- Quiz / Practice: require an option ----
+    if body is None or body.selected_option_id is None:
+        raise HTTPException(
+            status_code=422,
+            detail="selected_option_id is required for quiz/practice steps",
+        )
+
+    selected = step.option(body.selected_option_id)
+    if selected is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Option not found for this step",
+        )
+
+    is_correct = selected.is_correct
+
+    # UPSERT progress
+    time_spent = body.time_spent_seconds if body.time_spent_seconds else 0
+    await awrite(
+        aconn,
+        [
+            (
+                SAVE_ANSWER_SQL,
+                (user_id, step_id, body.selected_option_id, int(is_correct), time_spent),
+            ),
+            (REFRESH_MODULE_ROLLUP_SQL, (user_id, step.module_id)),
+        ],
+    )
+
+    correct_opt = step.correct_option
+
+    response = AnswerResponse(
+        is_correct=is_correct,
+        selected_feedback_md=selected.feedback_md,
+        correct_option=OptionReveal(
+            id=correct_opt.id,
+            label=correct_opt.label,
+            content=correct_opt.content,
+            feedback_md=correct_opt.feedback_md,
+        ),
+    )
+    return JSONResponse(
+        content=response.model_dump(),
+        media_type="application/json; charset=utf-8",
+    )
 
 
 @app.get("/api/progress", response_model=ProgressResponse)
-def get_progress(user_id: str = Depends(get_current_user_id)):
+async def get_progress(
+    user_id: str = Depends(get_current_user_id),
+    aconn=Depends(async_db_connection),
+):
     """Return overall progress summary across all stages."""
-    conn = get_db()
-    try:
-        stages = conn.execute(
-            "SELECT * FROM stages ORDER BY order_idx"
-        ).fetchall()
-
-        stage_list: list[StageProgress] = []
-        for s in stages:
-            modules = conn.execute(
-                "SELECT id FROM modules WHERE stage_id = ?", (s["id"],)
-            ).fetchall()
-            total_modules = len(modules)
-            completed_modules = sum(
-                1 for m in modules if _is_module_completed(m["id"], conn, user_id)
-            )
-
-            # Calculate score_pct from the evaluation module (last module)
-            score_pct = None
-            last_module = conn.execute(
-                "SELECT id FROM modules WHERE stage_id = ? ORDER BY order_idx DESC LIMIT 1",
-                (s["id"],),
-            ).fetchone()
-            if last_module:
-                quiz_steps = conn.execute(
-                    "SELECT id FROM steps WHERE module_id = ? AND type = 'quiz'",
-                    (last_module["id"],),
-                ).fetchall()
-                if quiz_steps:
-                    quiz_ids = [qs["id"] for qs in quiz_steps]
-                    placeholders = ",".join("?" * len(quiz_ids))
-                    answered = conn.execute(
-                        f"SELECT COUNT(*) AS cnt FROM user_progress "
-                        f"WHERE user_id = ? AND step_id IN ({placeholders})",
-                        [user_id, *quiz_ids],
-                    ).fetchone()["cnt"]
-                    if answered > 0:
-                        correct = conn.execute(
-                            f"SELECT COUNT(*) AS cnt FROM user_progress "
-                            f"WHERE user_id = ? AND step_id IN ({placeholders}) AND is_correct = 1",
-                            [user_id, *quiz_ids],
-                        ).fetchone()["cnt"]
-                        score_pct = round((correct / len(quiz_ids)) * 100, 1)
-
-            stage_list.append(
-                StageProgress(
-                    stage_id=s["id"],
-                    title=s["title"],
-                    is_unlocked=_is_stage_unlocked(s, conn, user_id),
-                    completed_modules=completed_modules,
-                    total_modules=total_modules,
-                    score_pct=score_pct,
-                )
-            )
-
-        return ProgressResponse(stages=stage_list)
-    finally:
-        conn.close()
+    structure = (await content_cache.aget(aconn)).structure
+    snapshot = await UserProgressSnapshot.aload(aconn, user_id, structure)
+    stage_list = [
+        StageProgress(
+            stage_id=s.id,
+            title=s.title,
+            is_unlocked=snapshot.is_stage_unlocked(s),
+            completed_modules=snapshot.completed_modules(s.id),
+            total_modules=snapshot.total_modules(s.id),
+            # score_pct comes from the evaluation module (last module)
+            score_pct=snapshot.score_pct(s.id),
+        )
+        for s in snapshot.structure.stages
+    ]
+    return ProgressResponse(stages=stage_list)
 
 
 @app.post("/api/stages/{stage_id}/evaluate", response_model=EvaluateResponse)
-def evaluate_stage(stage_id: int, user_id: str = Depends(get_current_user_id)):
+def evaluate_stage(
+    stage_id: int,
+    user_id: str = Depends(get_current_user_id),
+    conn=Depends(db_connection),
+):
     """Calculate evaluation score for a stage's final module quiz steps."""
-    conn = get_db()
-    try:
-        stage = conn.execute(
-            "SELECT * FROM stages WHERE id = ?", (stage_id,)
-        ).fetchone()
-        if not stage:
-            raise HTTPException(status_code=404, detail="Stage not found")
-
-        # Find the evaluation module (last module by order_idx)
-        eval_module = conn.execute(
-            "SELECT id FROM modules WHERE stage_id = ? ORDER BY order_idx DESC LIMIT 1",
-            (stage_id,),
-        ).fetchone()
-        if not eval_module:
-            raise HTTPException(
-                status_code=404, detail="No modules found for this stage"
-            )
-
-        # Get quiz steps in the eval module
-        quiz_steps = conn.execute(
-            "SELECT id FROM steps WHERE module_id = ? AND type = 'quiz'",
-            (eval_module["id"],),
-        ).fetchall()
-        total_questions = len(quiz_steps)
-        if total_questions == 0:
-            raise HTTPException(
-                status_code=404,
-                detail="No quiz steps in evaluation module",
-            )
-
-        quiz_ids = [qs["id"] for qs in quiz_steps]
-        placeholders = ",".join("?" * len(quiz_ids))
-
-        correct_answers = conn.execute(
-            f"SELECT COUNT(*) AS cnt FROM user_progress "
-            f"WHERE user_id = ? AND step_id IN ({placeholders}) AND is_correct = 1",
-            [user_id, *quiz_ids],
-        ).fetchone()["cnt"]
-
-        score_pct = round((correct_answers / total_questions) * 100, 1)
-        passed = score_pct >= 70
-
-        # Check if next stage is unlocked
-        unlocked_stage_id = None
-        if passed:
-            next_stage = conn.execute(
-                "SELECT id FROM stages WHERE order_idx > ? ORDER BY order_idx LIMIT 1",
-                (stage["order_idx"],),
-            ).fetchone()
-            if next_stage:
-                unlocked_stage_id = next_stage["id"]
-
-        return EvaluateResponse(
-            score_pct=score_pct,
-            passed=passed,
-            total_questions=total_questions,
-            correct_answers=correct_answers,
-            unlocked_stage_id=unlocked_stage_id,
+    snapshot = _load_snapshot(conn, user_id)
+    structure = snapshot.structure
+    if structure.stage(stage_id) is None:
+        raise HTTPException(status_code=404, detail="Stage not found")
+
+    # Find the evaluation module (last module by order_idx)
+    eval_module = structure.eval_module(stage_id)
+    if eval_module is None:
+        raise HTTPException(
+            status_code=404, detail="No modules found for this stage"
         )
-    finally:
-        conn.close()
+
+    total_questions, _, correct_answers = snapshot.eval_quiz_counts(stage_id)
+    if total_questions == 0:
+        raise HTTPException(
+            status_code=404,
+            detail="No quiz steps in evaluation module",
+        )
+
+    score_pct = round((correct_answers / total_questions) * 100, 1)
+    passed = score_pct >= 70
+
+    # Check if next stage is unlocked
+    unlocked_stage_id = structure.next_stage_id(stage_id) if passed else None
+
+    return EvaluateResponse(
+        score_pct=score_pct,
+        passed=passed,
+        total_questions=total_questions,
+        correct_answers=correct_answers,
+        unlocked_stage_id=unlocked_stage_id,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -634,62 +556,61 @@ def evaluate_stage(stage_id: int, user_id: str = Depends(get_current_user_id)):
 # ---------------------------------------------------------------------------
 
 
+BOOKMARK_LOOKUP_SQL = hot_query(
+    "SELECT id FROM user_bookmarks WHERE user_id = ? AND step_id = ?"
+)
+BOOKMARK_LIST_SQL = hot_query(
+    "SELECT b.step_id, s.title AS step_title, s.module_id, "
+    "m.title AS module_title, b.created_at "
+    "FROM user_bookmarks b "
+    "JOIN steps s ON b.step_id = s.id "
+    "JOIN modules m ON s.module_id = m.id "
+    "WHERE b.user_id = ? "
+    "ORDER BY b.created_at DESC"
+)
+
+
 @app.post("/api/bookmarks/{step_id}")
-def toggle_bookmark(step_id: int, user_id: str = Depends(get_current_user_id)):
+def toggle_bookmark(
+    step_id: int,
+    user_id: str = Depends(get_current_user_id),
+    conn=Depends(db_connection),
+):
     """Toggle bookmark on a step. Returns current bookmark state."""
-    conn = get_db()
-    try:
-        step = conn.execute("SELECT id FROM steps WHERE id = ?", (step_id,)).fetchone()
-        if not step:
-            raise HTTPException(status_code=404, detail="Step not found")
+    if step_id not in content_cache.get(conn).steps:
+        raise HTTPException(status_code=404, detail="Step not found")
 
-        existing = conn.execute(
-            "SELECT id FROM user_bookmarks WHERE user_id = ? AND step_id = ?",
+    def _toggle(wconn) -> bool:
+        existing = wconn.execute(BOOKMARK_LOOKUP_SQL, (user_id, step_id)).fetchone()
+        if existing:
+            wconn.execute("DELETE FROM user_bookmarks WHERE id = ?", (existing["id"],))
+            return False
+        wconn.execute(
+            "INSERT INTO user_bookmarks (user_id, step_id) VALUES (?, ?)",
             (user_id, step_id),
-        ).fetchone()
+        )
+        return True
 
-        if existing:
-            conn.execute("DELETE FROM user_bookmarks WHERE id = ?", (existing["id"],))
-            conn.commit()
-            return {"bookmarked": False, "step_id": step_id}
-        else:
-            conn.execute(
-                "INSERT INTO user_bookmarks (user_id, step_id) VALUES (?, ?)",
-                (user_id, step_id),
-            )
-            conn.commit()
-            return {"bookmarked": True, "step_id": step_id}
-    finally:
-        conn.close()
+    return {"bookmarked": write(conn, _toggle), "step_id": step_id}
 
 
 @app.get("/api/bookmarks")
-def list_bookmarks(user_id: str = Depends(get_current_user_id)):
+def list_bookmarks(
+    user_id: str = Depends(get_current_user_id),
+    conn=Depends(db_connection),
+):
     """Return all bookmarked steps for the current user."""
-    conn = get_db()
-    try:
-        rows = conn.execute(
-            "SELECT b.step_id, s.title AS step_title, s.module_id, "
-            "m.title AS module_title, b.created_at "
-            "FROM user_bookmarks b "
-            "JOIN steps s ON b.step_id = s.id "
-            "JOIN modules m ON s.module_id = m.id "
-            "WHERE b.user_id = ? "
-            "ORDER BY b.created_at DESC",
-            (user_id,),
-        ).fetchall()
-        return [
-            {
-                "step_id": r["step_id"],
-                "step_title": r["step_title"],
-                "module_id": r["module_id"],
-                "module_title": r["module_title"],
-                "created_at": r["created_at"],
-            }
-            for r in rows
-        ]
-    finally:
-        conn.close()
+    rows = conn.execute(BOOKMARK_LIST_SQL, (user_id,)).fetchall()
+    return [
+        {
+            "step_id": r["step_id"],
+            "step_title": r["step_title"],
+            "module_id": r["module_id"],
+            "module_title": r["module_title"],
+            "created_at": r["created_at"],
+        }
+        for r in rows
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -698,121 +619,58 @@ def list_bookmarks(user_id: str = Depends(get_current_user_id)):
 
 
 @app.get("/api/admin/stats", response_model=AdminStatsResponse)
-def admin_stats(user_id: str = Depends(get_current_user_id)):
+def admin_stats(
+    user_id: str = Depends(get_current_user_id),
+    conn=Depends(db_connection),
+):
     """Return learning statistics for the admin dashboard."""
-    conn = get_db()
-    try:
-        # 1. Total step count
-        total_steps = conn.execute(
-            "SELECT COUNT(*) AS cnt FROM steps"
-        ).fetchone()["cnt"]
-
-        # 2. Completed step count
-        total_completed = conn.execute(
-            "SELECT COUNT(*) AS cnt FROM user_progress WHERE user_id = ?",
-            (user_id,),
-        ).fetchone()["cnt"]
-
-        # 3. Overall accuracy (quiz/practice only, where is_correct IS NOT NULL)
-        quiz_progress = conn.execute(
-            "SELECT COUNT(*) AS total, "
-            "SUM(CASE WHEN is_correct = 1 THEN 1 ELSE 0 END) AS correct "
-            "FROM user_progress WHERE user_id = ? AND is_correct IS NOT NULL",
-            (user_id,),
-        ).fetchone()
-        overall_accuracy = None
-        if quiz_progress["total"] > 0:
-            overall_accuracy = round(
-                (quiz_progress["correct"] / quiz_progress["total"]) * 100, 1
-            )
-
-        # 4. Total learning time
-        total_time = conn.execute(
-            "SELECT COALESCE(SUM(time_spent_seconds), 0) AS total "
-            "FROM user_progress WHERE user_id = ?",
-            (user_id,),
-        ).fetchone()["total"]
-
-        # 5. Per-module statistics
-        modules = conn.execute(
-            "SELECT m.id, m.title, m.stage_id "
-            "FROM modules m ORDER BY m.stage_id, m.order_idx"
-        ).fetchall()
-
-        module_stats_list: list[ModuleStats] = []
-        for mod in modules:
-            # Total steps in module
-            mod_total = conn.execute(
-                "SELECT COUNT(*) AS cnt FROM steps WHERE module_id = ?",
-                (mod["id"],),
-            ).fetchone()["cnt"]
-
-            # Completed steps in module
-            mod_completed = conn.execute(
-                "SELECT COUNT(*) AS cnt FROM user_progress up "
-                "JOIN steps s ON up.step_id = s.id "
-                "WHERE s.module_id = ? AND up.user_id = ?",
-                (mod["id"], user_id),
-            ).fetchone()["cnt"]
-
-            # Quiz/practice accuracy in module
-            mod_quiz = conn.execute(
-                "SELECT COUNT(*) AS total, "
-                "SUM(CASE WHEN up.is_correct = 1 THEN 1 ELSE 0 END) AS correct, "
-                "SUM(CASE WHEN up.is_correct = 0 THEN 1 ELSE 0 END) AS wrong "
-                "FROM user_progress up "
-                "JOIN steps s ON up.step_id = s.id "
-                "WHERE s.module_id = ? AND up.user_id = ? AND up.is_correct IS NOT NULL",
-                (mod["id"], user_id),
-            ).fetchone()
-
-            accuracy = None
-            correct = mod_quiz["correct"] or 0
-            wrong = mod_quiz["wrong"] or 0
-            if mod_quiz["total"] > 0:
-                accuracy = round((correct / mod_quiz["total"]) * 100, 1)
-
-            # Average time per step in module
-            avg_time_row = conn.execute(
-                "SELECT AVG(up.time_spent_seconds) AS avg_time "
-                "FROM user_progress up "
-                "JOIN steps s ON up.step_id = s.id "
-                "WHERE s.module_id = ? AND up.user_id = ? AND up.time_spent_seconds > 0",
-                (mod["id"], user_id),
-            ).fetchone()
-            avg_time = (
-                round(avg_time_row["avg_time"], 1)
-                if avg_time_row["avg_time"]
-                else None
-            )
-
-            ms = ModuleStats(
-                module_id=mod["id"],
-                module_title=mod["title"],
-                stage_id=mod["stage_id"],
-                total_steps=mod_total,
-                completed_steps=mod_completed,
-                correct_answers=correct,
-                wrong_answers=wrong,
-                accuracy_pct=accuracy,
-                avg_time_seconds=avg_time,
-            )
-            module_stats_list.append(ms)
-
-        # 6. Weakest modules (lowest accuracy among those with scores, top 3)
-        scored = [m for m in module_stats_list if m.accuracy_pct is not None]
-        weakest = sorted(scored, key=lambda x: x.accuracy_pct)[:3]
-
-        return AdminStatsResponse(
-            total_steps_completed=total_completed,
-            total_steps=total_steps,
-            overall_accuracy_pct=overall_accuracy,
-            total_time_seconds=total_time,
-            modules=module_stats_list,
-            weakest_modules=weakest,
-        )
-    finally:
-        conn.close()
+    return compute_admin_stats(conn, [user_id])[user_id]
+
+
+@app.get("/api/admin/stats/cohort", response_model=CohortStatsResponse)
+def admin_cohort_stats(
+    _: str = Depends(require_admin),
+    conn=Depends(db_connection),
+):
+    """Return the admin statistics of every team account in one pass."""
+    user_ids = sorted(ALLOWED_USER_IDS, key=lambda u: int(u.rsplit("_", 1)[1]))
+    stats = compute_admin_stats(conn, user_ids)
+    return CohortStatsResponse(
+        users=[
+            UserStats(user_id=uid, **stats[uid].model_dump()) for uid in user_ids
+        ]
+    )
+
+
+@app.get("/api/admin/content", response_model=list[ModuleSteps])
+async def admin_content(
+    user_id: str = Depends(get_current_user_id),
+    aconn=Depends(async_db_connection),
+):
+    """Return the steps of every module in one response for the content viewer."""
+    content = await content_cache.aget(aconn)
+    snapshot = await UserProgressSnapshot.aload(
+        aconn, user_id, content.structure, include_steps=True
+    )
+    module_ids = [
+        m.id
+        for stage in content.structure.stages
+        for m in content.structure.stage_modules(stage.id)
+    ]
+    steps_by_module = build_step_responses(content, module_ids, snapshot.progress)
+    return [
+        ModuleSteps(module_id=module_id, steps=steps_by_module[module_id])
+        for module_id in module_ids
+    ]
+
+
+@app.get("/api/admin/metrics", response_model=MetricsResponse)
+def admin_metrics(_: str = Depends(require_admin)):
+    """Return in-process cache counters of this API worker."""
+    return MetricsResponse(
+        token_cache=TokenCacheStats(**token_cache.stats()),
+        queries=QueryStats(**query_stats()),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,33 @@
+-- Content version counter used to invalidate the in-process content cache.
+-- Any write to a content table bumps the version, whether it comes from
+-- apps/api/seed.py or from an ad-hoc SQL fix.
+CREATE TABLE IF NOT EXISTS content_version (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version BIGINT NOT NULL DEFAULT 1
+);
+
+INSERT INTO content_version (id, version) VALUES (1, 1)
+    ON CONFLICT (id) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION bump_content_version() RETURNS trigger AS '
+BEGIN
+    UPDATE content_version SET version = version + 1 WHERE id = 1;
+    RETURN NULL;
+END;
+' LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_stages_content_version
+    AFTER INSERT OR UPDATE OR DELETE ON stages
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_content_version();
+
+CREATE TRIGGER trg_modules_content_version
+    AFTER INSERT OR UPDATE OR DELETE ON modules
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_content_version();
+
+CREATE TRIGGER trg_steps_content_version
+    AFTER INSERT OR UPDATE OR DELETE ON steps
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_content_version();
+
+CREATE TRIGGER trg_options_content_version
+    AFTER INSERT OR UPDATE OR DELETE ON options
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_content_version();
@@ -0,0 +1,38 @@
+-- Content version counter used to invalidate the in-process content cache.
+-- Any write to a content table bumps the version, whether it comes from
+-- apps/api/seed.py or from an ad-hoc SQL fix.
+CREATE TABLE IF NOT EXISTS content_version (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL DEFAULT 1
+);
+
+INSERT INTO content_version (id, version) VALUES (1, 1)
+    ON CONFLICT(id) DO NOTHING;
+
+CREATE TRIGGER IF NOT EXISTS trg_stages_insert_content_version AFTER INSERT ON stages
+BEGIN UPDATE content_version SET version = version + 1 WHERE id = 1; END;
+CREATE TRIGGER IF NOT EXISTS trg_stages_update_content_version AFTER UPDATE ON stages
+BEGIN UPDATE content_version SET version = version + 1 WHERE id = 1; END;
+CREATE TRIGGER IF NOT EXISTS trg_stages_delete_content_version AFTER DELETE ON stages
+BEGIN UPDATE content_version SET version = version + 1 WHERE id = 1; END;
+
+CREATE TRIGGER IF NOT EXISTS trg_modules_insert_content_version AFTER INSERT ON modules
+BEGIN UPDATE content_version SET version = version + 1 WHERE id = 1; END;
+CREATE TRIGGER IF NOT EXISTS trg_modules_update_content_version AFTER UPDATE ON modules
+BEGIN UPDATE content_version SET version = version + 1 WHERE id = 1; END;
+CREATE TRIGGER IF NOT EXISTS trg_modules_delete_content_version AFTER DELETE ON modules
+BEGIN UPDATE content_version SET version = version + 1 WHERE id = 1; END;
+
+CREATE TRIGGER IF NOT EXISTS trg_steps_insert_content_version AFTER INSERT ON steps
+BEGIN UPDATE content_version SET version = version + 1 WHERE id = 1; END;
+CREATE TRIGGER IF NOT EXISTS trg_steps_update_content_version AFTER UPDATE ON steps
+BEGIN UPDATE content_version SET version = version + 1 WHERE id = 1; END;
+CREATE TRIGGER IF NOT EXISTS trg_steps_delete_content_version AFTER DELETE ON steps
+BEGIN UPDATE content_version SET version = version + 1 WHERE id = 1; END;
+
+CREATE TRIGGER IF NOT EXISTS trg_options_insert_content_version AFTER INSERT ON options
+BEGIN UPDATE content_version SET version = version + 1 WHERE id = 1; END;
+CREATE TRIGGER IF NOT EXISTS trg_options_update_content_version AFTER UPDATE ON options
+BEGIN UPDATE content_version SET version = version + 1 WHERE id = 1; END;
+CREATE TRIGGER IF NOT EXISTS trg_options_delete_content_version AFTER DELETE ON options
+BEGIN UPDATE content_version SET version = version + 1 WHERE id = 1; END;
@@ -0,0 +1,31 @@
+-- Per-user, per-module rollup of user_progress.
+-- submit_answer refreshes the affected row in the same transaction and
+-- seed rebuilds all rows, so stage and progress views read O(modules) rows.
+CREATE TABLE IF NOT EXISTS user_module_progress (
+    user_id TEXT NOT NULL,
+    module_id INTEGER NOT NULL REFERENCES modules(id),
+    completed_steps INTEGER NOT NULL DEFAULT 0,
+    quiz_answered INTEGER NOT NULL DEFAULT 0,
+    quiz_correct INTEGER NOT NULL DEFAULT 0,
+    correct_count INTEGER NOT NULL DEFAULT 0,
+    wrong_count INTEGER NOT NULL DEFAULT 0,
+    time_spent_seconds INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (user_id, module_id)
+);
+
+-- Backfill from existing progress rows.
+INSERT INTO user_module_progress (
+    user_id, module_id, completed_steps, quiz_answered, quiz_correct,
+    correct_count, wrong_count, time_spent_seconds
+)
+SELECT up.user_id, s.module_id,
+    COUNT(*),
+    SUM(CASE WHEN s.type = 'quiz' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN s.type = 'quiz' AND up.is_correct = 1 THEN 1 ELSE 0 END),
+    SUM(CASE WHEN up.is_correct = 1 THEN 1 ELSE 0 END),
+    SUM(CASE WHEN up.is_correct = 0 THEN 1 ELSE 0 END),
+    COALESCE(SUM(up.time_spent_seconds), 0)
+FROM user_progress up
+JOIN steps s ON s.id = up.step_id
+GROUP BY up.user_id, s.module_id;
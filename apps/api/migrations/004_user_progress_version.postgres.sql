@@ -0,0 +1,27 @@
+-- Per-user progress version used to build ETags for curriculum responses.
+-- Every write to user_progress bumps the owning user version, whether it
+-- comes from the API or from an ad-hoc SQL fix.
+CREATE TABLE IF NOT EXISTS user_progress_version (
+    user_id TEXT PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 1
+);
+
+CREATE OR REPLACE FUNCTION bump_user_progress_version() RETURNS trigger AS '
+DECLARE
+    target_user TEXT;
+BEGIN
+    IF TG_OP = ''DELETE'' THEN
+        target_user := OLD.user_id;
+    ELSE
+        target_user := NEW.user_id;
+    END IF;
+    INSERT INTO user_progress_version (user_id, version) VALUES (target_user, 1)
+        ON CONFLICT (user_id) DO UPDATE
+        SET version = user_progress_version.version + 1;
+    RETURN NULL;
+END;
+' LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_user_progress_version
+    AFTER INSERT OR UPDATE OR DELETE ON user_progress
+    FOR EACH ROW EXECUTE FUNCTION bump_user_progress_version();
@@ -0,0 +1,28 @@
+-- Per-user progress version used to build ETags for curriculum responses.
+-- Every write to user_progress bumps the owning user version, whether it
+-- comes from the API or from an ad-hoc SQL fix.
+CREATE TABLE IF NOT EXISTS user_progress_version (
+    user_id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 1
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_user_progress_version_insert
+AFTER INSERT ON user_progress
+BEGIN
+    INSERT INTO user_progress_version (user_id, version) VALUES (NEW.user_id, 1)
+        ON CONFLICT(user_id) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_user_progress_version_update
+AFTER UPDATE ON user_progress
+BEGIN
+    INSERT INTO user_progress_version (user_id, version) VALUES (NEW.user_id, 1)
+        ON CONFLICT(user_id) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_user_progress_version_delete
+AFTER DELETE ON user_progress
+BEGIN
+    INSERT INTO user_progress_version (user_id, version) VALUES (OLD.user_id, 1)
+        ON CONFLICT(user_id) DO UPDATE SET version = version + 1;
+END;
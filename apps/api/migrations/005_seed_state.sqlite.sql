@@ -0,0 +1,9 @@
+-- Hashes of the curriculum declared in apps/api/seed.py, recorded per stage
+-- (scope stage:N) and for the whole graph (scope all). content_version is
+-- the value right after seeding, so any later content write invalidates them.
+CREATE TABLE IF NOT EXISTS seed_state (
+    scope TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    content_version INTEGER NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
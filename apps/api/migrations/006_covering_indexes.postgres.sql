@@ -0,0 +1,14 @@
+-- Covering indexes for the per-user hot queries.
+-- user_progress reads (progress snapshot, rollup refresh, admin stats) only
+-- need (user_id, step_id, is_correct, time_spent_seconds), so they can be
+-- answered by index-only scans. The rollup refresh can be driven from this
+-- index and reach steps by primary key (the plan SQLite picks);
+-- steps(module_id, type) only serves a plan that starts from the module's
+-- steps instead. It also replaces idx_steps_module for module-scoped step
+-- lookups. Both replace narrower indexes from 001_init.
+CREATE INDEX IF NOT EXISTS idx_progress_user_step_cover
+    ON user_progress(user_id, step_id) INCLUDE (is_correct, time_spent_seconds);
+DROP INDEX IF EXISTS idx_progress_user_step;
+
+CREATE INDEX IF NOT EXISTS idx_steps_module_type ON steps(module_id, type);
+DROP INDEX IF EXISTS idx_steps_module;
@@ -78,6 +78,11 @@ class StepResponse(BaseModel):
     is_completed: bool = False
 
 
+class ModuleSteps(BaseModel):
+    module_id: int
+    steps: list[StepResponse]
+
+
 # ---------------------------------------------------------------------------
 # Answer
 # ---------------------------------------------------------------------------
@@ -168,3 +173,37 @@ class AdminStatsResponse(BaseModel):
     total_time_seconds: int
     modules: list[ModuleStats]
     weakest_modules: list[ModuleStats]
+
+
+class UserStats(AdminStatsResponse):
+    user_id: str
+
+
+class CohortStatsResponse(BaseModel):
+    users: list[UserStats]
+
+
+# ---------------------------------------------------------------------------
+# Admin Metrics
+# ---------------------------------------------------------------------------
+
+class TokenCacheStats(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_entries: int
+    hit_rate: float | None
+
+
+class QueryStats(BaseModel):
+    conversion_hits: int
+    conversion_misses: int
+    conversion_cache_size: int
+    statements_prepared: int
+    prepare_hits: int
+
+
+class MetricsResponse(BaseModel):
+    token_cache: TokenCacheStats
+    queries: QueryStats
@@ -0,0 +1,395 @@
+"""Per-request progress snapshot shared by the progress-related endpoints.
+
+``UserProgressSnapshot`` combines the curriculum structure with one user's
+``user_module_progress`` rollup rows (and, for step views, their
+``user_progress`` rows), then answers every progress question (module
+completion, evaluation module, quiz score, stage unlock) in memory. The
+number of queries is fixed regardless of curriculum size.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+
+from apps.api.database import hot_query
+
+DEFAULT_MIN_SCORE_PCT = 70
+
+
+# ---------------------------------------------------------------------------
+# Curriculum structure (ids, ordering and step types only)
+# ---------------------------------------------------------------------------
+
+STAGES_SQL = (
+    "SELECT id, title, description, order_idx, unlock_condition "
+    "FROM stages ORDER BY order_idx"
+)
+MODULES_SQL = (
+    "SELECT id, stage_id, title, description, order_idx "
+    "FROM modules ORDER BY stage_id, order_idx"
+)
+STEP_STRUCTURE_SQL = (
+    "SELECT id, module_id, type, order_idx "
+    "FROM steps ORDER BY module_id, order_idx"
+)
+USER_PROGRESS_SQL = hot_query(
+    "SELECT step_id, is_correct, time_spent_seconds "
+    "FROM user_progress WHERE user_id = ?"
+)
+MODULE_ROLLUP_SQL = hot_query(
+    "SELECT module_id, completed_steps, quiz_answered, quiz_correct "
+    "FROM user_module_progress WHERE user_id = ?"
+)
+
+
+@dataclass(frozen=True)
+class StageInfo:
+    id: int
+    title: str
+    description: str
+    order_idx: int
+    unlock_condition: str | None
+
+
+@dataclass(frozen=True)
+class ModuleInfo:
+    id: int
+    stage_id: int
+    title: str
+    description: str
+    order_idx: int
+
+
+@dataclass(frozen=True)
+class StepInfo:
+    id: int
+    module_id: int
+    type: str
+    order_idx: int
+
+
+@dataclass
+class CurriculumStructure:
+    """Ordered stage -> module -> step graph without markdown bodies."""
+
+    stages: list[StageInfo] = field(default_factory=list)
+    modules: dict[int, ModuleInfo] = field(default_factory=dict)
+    steps: dict[int, StepInfo] = field(default_factory=dict)
+    modules_by_stage: dict[int, list[ModuleInfo]] = field(default_factory=dict)
+    steps_by_module: dict[int, list[StepInfo]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, conn) -> "CurriculumStructure":
+        return cls.from_rows(
+            conn.execute(STAGES_SQL).fetchall(),
+            conn.execute(MODULES_SQL).fetchall(),
+            conn.execute(STEP_STRUCTURE_SQL).fetchall(),
+        )
+
+    @classmethod
+    async def aload(cls, aconn) -> "CurriculumStructure":
+        return cls.from_rows(
+            await aconn.fetchall(STAGES_SQL),
+            await aconn.fetchall(MODULES_SQL),
+            await aconn.fetchall(STEP_STRUCTURE_SQL),
+        )
+
+    @classmethod
+    def from_rows(cls, stage_rows, module_rows, step_rows) -> "CurriculumStructure":
+        structure = cls()
+        for row in stage_rows:
+            structure.stages.append(
+                StageInfo(
+                    id=row["id"],
+                    title=row["title"],
+                    description=row["description"],
+                    order_idx=row["order_idx"],
+                    unlock_condition=row["unlock_condition"],
+                )
+            )
+        for row in module_rows:
+            module = ModuleInfo(
+                id=row["id"],
+                stage_id=row["stage_id"],
+                title=row["title"],
+                description=row["description"],
+                order_idx=row["order_idx"],
+            )
+            structure.modules[module.id] = module
+            structure.modules_by_stage.setdefault(module.stage_id, []).append(module)
+        for row in step_rows:
+            step = StepInfo(
+                id=row["id"],
+                module_id=row["module_id"],
+                type=row["type"],
+                order_idx=row["order_idx"],
+            )
+            structure.steps[step.id] = step
+            structure.steps_by_module.setdefault(step.module_id, []).append(step)
+        return structure
+
+    def stage(self, stage_id: int) -> StageInfo | None:
+        return next((s for s in self.stages if s.id == stage_id), None)
+
+    def stage_modules(self, stage_id: int) -> list[ModuleInfo]:
+        return self.modules_by_stage.get(stage_id, [])
+
+    def module_steps(self, module_id: int) -> list[StepInfo]:
+        return self.steps_by_module.get(module_id, [])
+
+    def eval_module(self, stage_id: int) -> ModuleInfo | None:
+        """The evaluation module is the last module (highest order_idx)."""
+        modules = self.stage_modules(stage_id)
+        if not modules:
+            return None
+        return max(modules, key=lambda m: m.order_idx)
+
+    def quiz_step_ids(self, module_id: int) -> list[int]:
+        return [s.id for s in self.module_steps(module_id) if s.type == "quiz"]
+
+    def next_stage_id(self, stage_id: int) -> int | None:
+        stage = self.stage(stage_id)
+        if stage is None:
+            return None
+        following = [s for s in self.stages if s.order_idx > stage.order_idx]
+        if not following:
+            return None
+        return min(following, key=lambda s: s.order_idx).id
+
+
+# ---------------------------------------------------------------------------
+# user_module_progress rollup maintenance
+# ---------------------------------------------------------------------------
+
+_ROLLUP_COLUMNS = (
+    "user_id, module_id, completed_steps, quiz_answered, quiz_correct, "
+    "correct_count, wrong_count, time_spent_seconds"
+)
+_ROLLUP_SELECT = (
+    "SELECT up.user_id, s.module_id, "
+    "COUNT(*), "
+    "SUM(CASE WHEN s.type = 'quiz' THEN 1 ELSE 0 END), "
+    "SUM(CASE WHEN s.type = 'quiz' AND up.is_correct = 1 THEN 1 ELSE 0 END), "
+    "SUM(CASE WHEN up.is_correct = 1 THEN 1 ELSE 0 END), "
+    "SUM(CASE WHEN up.is_correct = 0 THEN 1 ELSE 0 END), "
+    "COALESCE(SUM(up.time_spent_seconds), 0) "
+    "FROM user_progress up "
+    "JOIN steps s ON s.id = up.step_id "
+)
+REFRESH_MODULE_ROLLUP_SQL = hot_query(
+    f"INSERT INTO user_module_progress ({_ROLLUP_COLUMNS}) "
+    + _ROLLUP_SELECT
+    + "WHERE up.user_id = ? AND s.module_id = ? "
+    "GROUP BY up.user_id, s.module_id "
+    "ON CONFLICT(user_id, module_id) DO UPDATE SET "
+    "completed_steps = excluded.completed_steps, "
+    "quiz_answered = excluded.quiz_answered, "
+    "quiz_correct = excluded.quiz_correct, "
+    "correct_count = excluded.correct_count, "
+    "wrong_count = excluded.wrong_count, "
+    "time_spent_seconds = excluded.time_spent_seconds, "
+    "updated_at = CURRENT_TIMESTAMP"
+)
+
+
+def refresh_module_rollup(conn, user_id: str, module_id: int) -> None:
+    """Recompute one user's rollup row for one module (caller commits).
+
+    Only the affected row is touched, and it is derived from
+    ``user_progress`` inside the caller's transaction, so repeated or
+    concurrent submissions cannot make it drift.
+    """
+    conn.execute(REFRESH_MODULE_ROLLUP_SQL, (user_id, module_id))
+
+
+async def arefresh_module_rollup(aconn, user_id: str, module_id: int) -> None:
+    await aconn.execute(REFRESH_MODULE_ROLLUP_SQL, (user_id, module_id))
+
+
+def rebuild_module_rollups(conn) -> None:
+    """Rebuild every rollup row, e.g. after seed changed step types (caller commits)."""
+    conn.execute("DELETE FROM user_module_progress")
+    conn.execute(
+        f"INSERT INTO user_module_progress ({_ROLLUP_COLUMNS}) "
+        + _ROLLUP_SELECT
+        + "GROUP BY up.user_id, s.module_id"
+    )
+
+
+# ---------------------------------------------------------------------------
+# User progress snapshot
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class StepProgress:
+    step_id: int
+    is_correct: int | None
+    time_spent_seconds: int
+
+
+@dataclass(frozen=True)
+class ModuleRollup:
+    module_id: int
+    completed_steps: int
+    quiz_answered: int
+    quiz_correct: int
+
+
+class UserProgressSnapshot:
+    """One user's progress plus the curriculum structure, held in memory.
+
+    Module-level questions are answered from ``user_module_progress`` rollup
+    rows (one per module). Per-step completion is only loaded when a view
+    needs it (``include_steps=True``).
+    """
+
+    def __init__(
+        self,
+        user_id: str,
+        structure: CurriculumStructure,
+        modules: dict[int, ModuleRollup],
+        progress: dict[int, StepProgress] | None = None,
+    ):
+        self.user_id = user_id
+        self.structure = structure
+        self.modules = modules
+        self._progress = progress
+
+    @classmethod
+    def load(
+        cls,
+        conn,
+        user_id: str,
+        structure: CurriculumStructure | None = None,
+        *,
+        include_steps: bool = False,
+    ) -> "UserProgressSnapshot":
+        if structure is None:
+            structure = CurriculumStructure.load(conn)
+        rollup_rows = conn.execute(MODULE_ROLLUP_SQL, (user_id,)).fetchall()
+        step_rows = None
+        if include_steps:
+            step_rows = conn.execute(USER_PROGRESS_SQL, (user_id,)).fetchall()
+        return cls.from_rows(user_id, structure, rollup_rows, step_rows)
+
+    @classmethod
+    async def aload(
+        cls,
+        aconn,
+        user_id: str,
+        structure: CurriculumStructure | None = None,
+        *,
+        include_steps: bool = False,
+    ) -> "UserProgressSnapshot":
+        if structure is None:
+            structure = await CurriculumStructure.aload(aconn)
+        rollup_rows = await aconn.fetchall(MODULE_ROLLUP_SQL, (user_id,))
+        step_rows = None
+        if include_steps:
+            step_rows = await aconn.fetchall(USER_PROGRESS_SQL, (user_id,))
+        return cls.from_rows(user_id, structure, rollup_rows, step_rows)
+
+    @classmethod
+    def from_rows(
+        cls, user_id: str, structure: CurriculumStructure, rollup_rows, step_rows=None
+    ) -> "UserProgressSnapshot":
+        modules = {
+            row["module_id"]: ModuleRollup(
+                module_id=row["module_id"],
+                completed_steps=row["completed_steps"],
+                quiz_answered=row["quiz_answered"],
+                quiz_correct=row["quiz_correct"],
+            )
+            for row in rollup_rows
+        }
+        progress = None
+        if step_rows is not None:
+            progress = {
+                row["step_id"]: StepProgress(
+                    step_id=row["step_id"],
+                    is_correct=row["is_correct"],
+                    time_spent_seconds=row["time_spent_seconds"] or 0,
+                )
+                for row in step_rows
+            }
+        return cls(user_id, structure, modules, progress)
+
+    # -- steps / modules ----------------------------------------------------
+
+    @property
+    def progress(self) -> dict[int, StepProgress]:
+        if self._progress is None:
+            raise RuntimeError("Snapshot was loaded without include_steps=True")
+        return self._progress
+
+    def is_step_completed(self, step_id: int) -> bool:
+        return step_id in self.progress
+
+    def _rollup(self, module_id: int) -> ModuleRollup:
+        return self.modules.get(module_id) or ModuleRollup(module_id, 0, 0, 0)
+
+    def module_completed_steps(self, module_id: int) -> tuple[int, int]:
+        """Return (completed_steps, total_steps) for a module."""
+        total = len(self.structure.module_steps(module_id))
+        return self._rollup(module_id).completed_steps, total
+
+    def is_module_completed(self, module_id: int) -> bool:
+        completed, total = self.module_completed_steps(module_id)
+        return total > 0 and completed >= total
+
+    def completed_modules(self, stage_id: int) -> int:
+        return sum(
+            1
+            for m in self.structure.stage_modules(stage_id)
+            if self.is_module_completed(m.id)
+        )
+
+    def total_modules(self, stage_id: int) -> int:
+        return len(self.structure.stage_modules(stage_id))
+
+    # -- quiz scoring -------------------------------------------------------
+
+    def eval_quiz_counts(self, stage_id: int) -> tuple[int, int, int] | None:
+        """Return (total_questions, answered, correct) for the eval module."""
+        module = self.structure.eval_module(stage_id)
+        if module is None:
+            return None
+        rollup = self._rollup(module.id)
+        total = len(self.structure.quiz_step_ids(module.id))
+        return total, rollup.quiz_answered, rollup.quiz_correct
+
+    def eval_score_pct(self, stage_id: int) -> float | None:
+        """Unrounded eval score, or None when there is no quiz to score."""
+        counts = self.eval_quiz_counts(stage_id)
+        if counts is None or counts[0] == 0:
+            return None
+        total, _, correct = counts
+        return (correct / total) * 100
+
+    def score_pct(self, stage_id: int) -> float | None:
+        """Rounded eval score for progress views (None until answered)."""
+        counts = self.eval_quiz_counts(stage_id)
+        if counts is None or counts[0] == 0 or counts[1] == 0:
+            return None
+        return round(self.eval_score_pct(stage_id), 1)
+
+    # -- unlock -------------------------------------------------------------
+
+    def is_stage_unlocked(self, stage: StageInfo) -> bool:
+        if stage.id == 1:
+            return True
+        if not stage.unlock_condition:
+            return True
+
+        condition = json.loads(stage.unlock_condition)
+        required_stage = condition.get("require_stage_complete")
+        min_score = condition.get("min_score_pct", DEFAULT_MIN_SCORE_PCT)
+        if required_stage is None:
+            return True
+
+        score_pct = self.eval_score_pct(required_stage)
+        if score_pct is None:
+            return False
+        return score_pct >= min_score
@@ -0,0 +1,125 @@
+"""Set-based learning statistics for the admin dashboard.
+
+Two grouped queries cover any number of users: one lists modules with their
+step totals, the other aggregates ``user_progress`` per (user, module).
+Global totals are sums over the per-module rows, so a single user and the
+whole cohort share the same code path.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from apps.api.models import AdminStatsResponse, ModuleStats
+
+_MODULE_TOTALS_SQL = (
+    "SELECT m.id AS module_id, m.title AS module_title, m.stage_id, "
+    "COUNT(s.id) AS total_steps "
+    "FROM modules m "
+    "LEFT JOIN steps s ON s.module_id = m.id "
+    "GROUP BY m.id, m.title, m.stage_id, m.order_idx "
+    "ORDER BY m.stage_id, m.order_idx"
+)
+
+_USER_MODULE_PROGRESS_SQL = (
+    "SELECT up.user_id, s.module_id, "
+    "COUNT(*) AS completed_steps, "
+    "COUNT(up.is_correct) AS answered, "
+    "SUM(CASE WHEN up.is_correct = 1 THEN 1 ELSE 0 END) AS correct, "
+    "SUM(CASE WHEN up.is_correct = 0 THEN 1 ELSE 0 END) AS wrong, "
+    "COALESCE(SUM(up.time_spent_seconds), 0) AS total_time, "
+    "AVG(CASE WHEN up.time_spent_seconds > 0 THEN up.time_spent_seconds END) "
+    "AS avg_time "
+    "FROM user_progress up "
+    "JOIN steps s ON s.id = up.step_id "
+    "WHERE up.user_id IN ({placeholders}) "
+    "GROUP BY up.user_id, s.module_id"
+)
+
+
+@dataclass(frozen=True)
+class _ModuleTotals:
+    module_id: int
+    module_title: str
+    stage_id: int
+    total_steps: int
+
+
+def _pct(part: int, whole: int) -> float | None:
+    if whole <= 0:
+        return None
+    return round((part / whole) * 100, 1)
+
+
+def compute_admin_stats(conn, user_ids: list[str]) -> dict[str, AdminStatsResponse]:
+    """Return ``AdminStatsResponse`` for each user id, keyed by user id."""
+    modules = [
+        _ModuleTotals(
+            module_id=row["module_id"],
+            module_title=row["module_title"],
+            stage_id=row["stage_id"],
+            total_steps=row["total_steps"],
+        )
+        for row in conn.execute(_MODULE_TOTALS_SQL).fetchall()
+    ]
+    total_steps = sum(m.total_steps for m in modules)
+
+    progress: dict[tuple[str, int], dict] = {}
+    if user_ids:
+        placeholders = ",".join("?" * len(user_ids))
+        rows = conn.execute(
+            _USER_MODULE_PROGRESS_SQL.format(placeholders=placeholders),
+            list(user_ids),
+        ).fetchall()
+        progress = {(row["user_id"], row["module_id"]): row for row in rows}
+
+    result: dict[str, AdminStatsResponse] = {}
+    for user_id in user_ids:
+        module_stats: list[ModuleStats] = []
+        total_completed = 0
+        total_answered = 0
+        total_correct = 0
+        total_time = 0
+        for m in modules:
+            row = progress.get((user_id, m.module_id))
+            completed = answered = correct = wrong = 0
+            avg_time = None
+            if row is not None:
+                completed = row["completed_steps"]
+                answered = row["answered"]
+                correct = row["correct"] or 0
+                wrong = row["wrong"] or 0
+                total_time += row["total_time"]
+                if row["avg_time"]:
+                    avg_time = round(float(row["avg_time"]), 1)
+            total_completed += completed
+            total_answered += answered
+            total_correct += correct
+
+            module_stats.append(
+                ModuleStats(
+                    module_id=m.module_id,
+                    module_title=m.module_title,
+                    stage_id=m.stage_id,
+                    total_steps=m.total_steps,
+                    completed_steps=completed,
+                    correct_answers=correct,
+                    wrong_answers=wrong,
+                    accuracy_pct=_pct(correct, answered),
+                    avg_time_seconds=avg_time,
+                )
+            )
+
+        # Weakest modules (lowest accuracy among those with scores, top 3)
+        scored = [m for m in module_stats if m.accuracy_pct is not None]
+        weakest = sorted(scored, key=lambda x: x.accuracy_pct)[:3]
+
+        result[user_id] = AdminStatsResponse(
+            total_steps_completed=total_completed,
+            total_steps=total_steps,
+            overall_accuracy_pct=_pct(total_correct, total_answered),
+            total_time_seconds=total_time,
+            modules=module_stats,
+            weakest_modules=weakest,
+        )
+    return result
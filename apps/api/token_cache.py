@@ -0,0 +1,103 @@
+"""Bounded LRU/TTL cache of verified access tokens.
+
+Access tokens are stateless (``payload.signature``), so every authenticated
+request used to recompute the HMAC and re-parse the payload. Bursty clients
+such as the admin content view send many parallel requests with the same
+token; this cache remembers the user id of tokens that already passed full
+verification. Entries are keyed by the sha256 digest of the token (the raw
+token is never stored), are served only until the token's own ``exp`` and
+for at most ``ttl_seconds`` after they were cached. A miss falls back to full
+signature verification in ``apps/api/main.py``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, NamedTuple
+
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "1024"))
+TOKEN_CACHE_TTL_SECONDS = int(os.getenv("TOKEN_CACHE_TTL_SECONDS", "300"))
+
+
+class _Entry(NamedTuple):
+    user_id: str
+    exp: int
+    cached_at: float
+
+
+def token_digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+class TokenCache:
+    """Thread-safe LRU of ``token digest -> user id`` with hit-rate counters."""
+
+    def __init__(
+        self,
+        max_entries: int = TOKEN_CACHE_SIZE,
+        ttl_seconds: float = TOKEN_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[bytes, _Entry] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, token: str) -> str | None:
+        """Return the cached user id, or ``None`` when the token must be verified."""
+        key = token_digest(token)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.exp < int(now) or now - entry.cached_at >= self.ttl_seconds:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.user_id
+
+    def put(self, token: str, user_id: str, exp: int) -> None:
+        if self.max_entries <= 0:
+            return
+        key = token_digest(token)
+        entry = _Entry(user_id, exp, self._clock())
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+
+token_cache = TokenCache()
@@ -0,0 +1,215 @@
+"""Single-writer queue with group commit for the SQLite backend.
+
+SQLite allows one writer at a time. When many learners submit answers at
+once, every request opening its own write transaction makes them queue on
+the file lock and, past ``busy_timeout``, fail with ``database is locked``.
+``SQLiteWriteQueue`` instead hands progress and bookmark writes to one
+dedicated thread that owns one connection. Jobs that queue up while the
+previous batch is committing (optionally widened by ``max_delay_seconds``)
+run inside a single ``BEGIN IMMEDIATE`` transaction, each under its own
+savepoint so a failing job does not undo its neighbours, and are committed
+together. Reads keep using pooled connections and, under WAL, never wait for
+the writer.
+
+The queue is per process and gives no cross-process guarantee. Each uvicorn
+worker (and any script writing to the same file) runs its own writer; those
+writers still contend for the SQLite file lock, and a commit waits for it up
+to ``busy_timeout`` (``SQLITE_BUSY_TIMEOUT_MS``) before failing with
+``database is locked``. Batching only keeps the number of such lock
+hand-offs low. PostgreSQL, or ``SQLITE_WRITE_QUEUE=false``, bypasses the
+queue and writes on the request's own connection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Iterable, Sequence
+
+from apps.api.database import (
+    _connect,
+    _env_float,
+    _env_int,
+    get_database_backend,
+    is_truthy_env,
+)
+
+Statement = tuple[str, Sequence]
+WriteJob = Callable[[Any], Any]
+
+
+def _execute_all(statements: Iterable[Statement], conn) -> None:
+    for query, params in statements:
+        conn.execute(query, params)
+
+
+class SQLiteWriteQueue:
+    """Dedicated writer thread executing queued jobs with group commit."""
+
+    def __init__(
+        self,
+        connect: Callable[[], Any] = _connect,
+        *,
+        max_batch: int = 64,
+        max_delay_seconds: float = 0.0,
+    ):
+        self._connect = connect
+        self.max_batch = max_batch
+        self.max_delay_seconds = max_delay_seconds
+        self._jobs: queue.Queue[tuple[WriteJob, Future] | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self.jobs = 0
+        self.batches = 0
+
+    @classmethod
+    def from_env(cls) -> "SQLiteWriteQueue":
+        return cls(
+            max_batch=_env_int("SQLITE_WRITE_BATCH_SIZE", 64),
+            max_delay_seconds=_env_float("SQLITE_WRITE_BATCH_MS", 0.0) / 1000,
+        )
+
+    def submit(self, job: WriteJob) -> Future:
+        """Queue ``job(conn)``; the future resolves once its batch committed."""
+        future: Future = Future()
+        with self._start_lock:
+            self._jobs.put((job, future))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="sqlite-writer", daemon=True
+                )
+                self._thread.start()
+        return future
+
+    def run(self, job: WriteJob) -> Any:
+        return self.submit(job).result()
+
+    async def arun(self, job: WriteJob) -> Any:
+        return await asyncio.wrap_future(self.submit(job))
+
+    def close(self) -> None:
+        with self._start_lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._jobs.put(None)
+            thread.join()
+
+    def _run(self) -> None:
+        try:
+            conn = self._connect()
+        except Exception as exc:
+            self._fail_queued(exc)
+            return
+        try:
+            stopping = False
+            while not stopping:
+                item = self._jobs.get()
+                if item is None:
+                    break
+                batch = [item]
+                deadline = time.monotonic() + self.max_delay_seconds
+                while len(batch) < self.max_batch:
+                    try:
+                        item = self._jobs.get(timeout=max(deadline - time.monotonic(), 0))
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        stopping = True
+                        break
+                    batch.append(item)
+                self._commit_batch(conn, batch)
+        finally:
+            conn.close()
+
+    def _fail_queued(self, exc: Exception) -> None:
+        """Fail every queued job and let the next ``submit`` start a new writer."""
+        with self._start_lock:
+            self._thread = None
+            while True:
+                try:
+                    item = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None and item[1].set_running_or_notify_cancel():
+                    item[1].set_exception(exc)
+
+    def _commit_batch(self, conn, batch: list[tuple[WriteJob, Future]]) -> None:
+        done: list[tuple[Future, Any]] = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for idx, (job, future) in enumerate(batch):
+                if not future.set_running_or_notify_cancel():
+                    continue
+                conn.execute(f"SAVEPOINT job_{idx}")
+                try:
+                    result = job(conn)
+                except Exception as exc:
+                    conn.execute(f"ROLLBACK TO job_{idx}")
+                    future.set_exception(exc)
+                    continue
+                conn.execute(f"RELEASE job_{idx}")
+                done.append((future, result))
+            conn.commit()
+        except Exception as exc:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        self.jobs += len(done)
+        self.batches += 1
+        for future, result in done:
+            future.set_result(result)
+
+
+_write_queue: SQLiteWriteQueue | None = None
+_write_queue_lock = threading.Lock()
+
+
+def get_write_queue() -> SQLiteWriteQueue | None:
+    """Return the process-wide writer, or ``None`` when writes go direct."""
+    global _write_queue
+    if get_database_backend() != "sqlite" or not is_truthy_env(
+        "SQLITE_WRITE_QUEUE", default=True
+    ):
+        return None
+    if _write_queue is None:
+        with _write_queue_lock:
+            if _write_queue is None:
+                _write_queue = SQLiteWriteQueue.from_env()
+    return _write_queue
+
+
+def close_write_queue() -> None:
+    global _write_queue
+    with _write_queue_lock:
+        writer, _write_queue = _write_queue, None
+    if writer is not None:
+        writer.close()
+
+
+def write(conn, job: WriteJob) -> Any:
+    """Run ``job(conn)`` and commit, through the writer queue when enabled."""
+    writer = get_write_queue()
+    if writer is None:
+        result = job(conn)
+        conn.commit()
+        return result
+    return writer.run(job)
+
+
+async def awrite(aconn, statements: list[Statement]) -> None:
+    """Execute ``statements`` in one transaction, through the writer queue when enabled."""
+    writer = get_write_queue()
+    if writer is None:
+        for query, params in statements:
+            await aconn.execute(query, params)
+        await aconn.commit()
+        return
+    await writer.arun(lambda conn: _execute_all(statements, conn))
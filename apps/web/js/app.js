@@ -14,6 +14,9 @@ let authState = {
   accessToken: null,
   userId: null,
 };
+// GET responses that carry an ETag, keyed by endpoint: { etag, body }.
+// Revalidated with If-None-Match; a 304 reuses the cached body.
+const etagCache = new Map();
 
 // ──────────────────────────────────────────
 // Dark Mode
@@ -112,6 +115,7 @@ function setSession(accessToken, userId) {
 function clearSession() {
   authState.accessToken = null;
   authState.userId = null;
+  etagCache.clear();
   localStorage.removeItem(AUTH_STORAGE_KEY);
   updateAuthUI();
 }
@@ -200,11 +204,20 @@ async function apiCall(endpoint, options = {}) {
     headers.Authorization = `Bearer ${authState.accessToken}`;
   }
 
+  const method = (fetchOptions.method || "GET").toUpperCase();
+  const cached = method === "GET" ? etagCache.get(endpoint) : undefined;
+  if (cached) {
+    headers["If-None-Match"] = cached.etag;
+  }
+
   try {
     const res = await fetch(`${API}${endpoint}`, {
       ...fetchOptions,
       headers,
     });
+    if (res.status === 304 && cached) {
+      return cached.body;
+    }
     if (!res.ok) {
       const err = new Error(`HTTP ${res.status}`);
       err.status = res.status;
@@ -217,7 +230,12 @@ async function apiCall(endpoint, options = {}) {
     if (res.status === 204) {
       return null;
     }
-    return await res.json();
+    const body = await res.json();
+    const etag = res.headers.get("ETag");
+    if (method === "GET" && etag) {
+      etagCache.set(endpoint, { etag, body });
+    }
+    return body;
   } catch (err) {
     console.error("API Error:", err);
     throw err;
@@ -271,6 +289,10 @@ async function fetchAdminStats() {
   return apiCall("/api/admin/stats");
 }
 
+async function fetchAdminContent() {
+  return apiCall("/api/admin/content");
+}
+
 async function evaluateStage(stageId) {
   return apiCall(`/api/stages/${stageId}/evaluate`, {
     method: "POST",
@@ -411,29 +433,16 @@ async function renderAdminContent() {
       return;
     }
 
-    // Fetch modules for all stages in parallel
-    const modulesPerStage = await Promise.all(
-      stages.map(stage => fetchModules(stage.id))
-    );
-
-    // Fetch steps for all modules in parallel
-    const allModuleIds = [];
-    const moduleStageMap = {};
-    modulesPerStage.forEach((modules, idx) => {
-      modules.forEach(mod => {
-        allModuleIds.push(mod.id);
-        moduleStageMap[mod.id] = stages[idx];
-      });
-    });
-
-    const stepsPerModule = await Promise.all(
-      allModuleIds.map(modId => fetchSteps(modId).catch(() => []))
-    );
+    // Fetch modules for all stages and the steps of every module in parallel
+    const [modulesPerStage, moduleSteps] = await Promise.all([
+      Promise.all(stages.map(stage => fetchModules(stage.id))),
+      fetchAdminContent().catch(() => []),
+    ]);
 
     // Build a map: moduleId -> steps
     const stepsMap = {};
-    allModuleIds.forEach((modId, idx) => {
-      stepsMap[modId] = stepsPerModule[idx] || [];
+    moduleSteps.forEach(entry => {
+      stepsMap[entry.module_id] = entry.steps || [];
     });
 
     // Calculate totals
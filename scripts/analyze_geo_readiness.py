@@ -6,21 +6,61 @@ Reads crawled JSON data from data/crawled/ and produces a GEO readiness
 scorecard scoring each page on 5 dimensions (Answerability, Proof, Fan-out,
 Crawlability, Trust) with 0-5 points each, for a total of 25.
 
+Page records are read lazily -- one {slug}.json file or one line of a
+crawler JSONL stream (--stream data/crawled/_pages.jsonl[.zst]) at a time --
+and scored in batches on a process pool, so scoring a large crawl is bounded
+by cores and memory stays flat.
+
+Scores are cached per URL in <input-dir>/_geo_score_cache.sqlite, keyed by a
+hash of the page record and SCORING_VERSION; only new or changed pages (or
+all pages after a rules change) are rescored. Each run writes
+_geo_score_diff.json with the score deltas since the previous run.
+
 Usage:
     python scripts/analyze_geo_readiness.py
     python scripts/analyze_geo_readiness.py --input-dir data/crawled
+    python scripts/analyze_geo_readiness.py --stream data/crawled/_pages.jsonl --workers 8
     python scripts/analyze_geo_readiness.py --output data/crawled/_geo_scorecard.json
+    python scripts/analyze_geo_readiness.py --rescore   # ignore cached scores
 """
 
 import argparse
+import hashlib
+import io
 import json
+import os
 import re
+import sqlite3
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
+DEFAULT_WORKERS = os.cpu_count() or 1
+BATCH_SIZE = 64  # page records per worker task
+MAX_PENDING_BATCHES_PER_WORKER = 2  # bounds how far reading runs ahead of scoring
+
+DIMENSIONS = ["answerability", "proof", "fan_out", "crawlability", "trust"]
+
+# Bump whenever a score_* function changes, so cached scores are recomputed.
+SCORING_VERSION = 2
+# Record fields that change on every crawl without changing the page
+VOLATILE_FIELDS = ("crawled_at",)
+CACHE_FILENAME = "_geo_score_cache.sqlite"
+DIFF_FILENAME = "_geo_score_diff.json"
+CACHE_WRITE_BATCH = 500
+
+# zstd-compressed JSONL streams (optional)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 
 # ---------------------------------------------------------------------------
 # Helpers to safely extract fields (handles both old and new JSON formats)
@@ -32,6 +72,13 @@ def _get(page: dict, key: str, default=None):
     return val if val is not None else default
 
 
+def _is_csr(record: dict) -> bool:
+    """True if a headless browser (any backend) rendered the page."""
+    if record.get("js_rendered"):
+        return True
+    return not _get(record, "rendered_with", "requests").startswith("requests")
+
+
 def _text_between_h1_and_first_h2(page: dict) -> str:
     """
     Fallback for answer_first_block: extract text between H1 and first H2
@@ -231,11 +278,11 @@ def score_trust(page: dict) -> tuple[int, list[str]]:
     score = 0
     details = []
 
-    rendered = _get(page, "rendered_with", "requests")
+    csr = _is_csr(page)
     text_len = _get(page, "text_length", 0)
-    if rendered != "selenium" or text_len > 500:
+    if not csr or text_len > 500:
         score += 1
-        details.append("SSR page" if rendered != "selenium" else "text > 500 despite CSR")
+        details.append("text > 500 despite CSR" if csr else "SSR page")
 
     text = _get(page, "text_content", "")
 
@@ -306,64 +353,240 @@ def analyze_page(page: dict) -> dict:
     }
 
 
-def compute_summary(results: list[dict]) -> dict:
-    """Compute aggregate summary across all scored pages."""
-    n = len(results)
-    if n == 0:
-        return {"by_dimension": {}, "top_issues": []}
-
-    dims = ["answerability", "proof", "fan_out", "crawlability", "trust"]
-    by_dim = {}
-    for dim in dims:
-        vals = [r["scores"][dim] for r in results]
-        by_dim[dim] = {
-            "avg": round(sum(vals) / n, 1),
-            "min": min(vals),
-            "max": max(vals),
+class SummaryAccumulator:
+    """Incremental ``compute_summary``: per-dimension totals and issue counters."""
+
+    def __init__(self):
+        self.n = 0
+        self.total_score = 0
+        self.dim_sum = {dim: 0 for dim in DIMENSIONS}
+        self.dim_min: dict[str, int] = {}
+        self.dim_max: dict[str, int] = {}
+        self.no_answer = 0
+        self.weak_proof = 0
+        self.low_fanout = 0
+        self.low_crawl = 0
+        self.csr_pages = 0
+        self.low_trust = 0
+        self.critical = 0
+
+    def add(self, result: dict) -> None:
+        scores = result["scores"]
+        self.n += 1
+        self.total_score += scores["total"]
+        for dim in DIMENSIONS:
+            val = scores[dim]
+            self.dim_sum[dim] += val
+            self.dim_min[dim] = min(self.dim_min.get(dim, val), val)
+            self.dim_max[dim] = max(self.dim_max.get(dim, val), val)
+        self.no_answer += scores["answerability"] < 3
+        self.weak_proof += scores["proof"] < 2
+        self.low_fanout += scores["fan_out"] < 2
+        self.low_crawl += scores["crawlability"] < 3
+        self.csr_pages += _is_csr(result)
+        self.low_trust += scores["trust"] < 2
+        self.critical += scores["total"] <= 8
+
+    @property
+    def average_score(self) -> float:
+        return round(self.total_score / self.n, 1) if self.n else 0.0
+
+    def summary(self) -> dict:
+        n = self.n
+        if n == 0:
+            return {"by_dimension": {}, "top_issues": []}
+
+        by_dim = {
+            dim: {
+                "avg": round(self.dim_sum[dim] / n, 1),
+                "min": self.dim_min[dim],
+                "max": self.dim_max[dim],
+            }
+            for dim in DIMENSIONS
         }
 
-    # Detect top issues
-    issues = []
+        # Detect top issues
+        issues = []
+        # Answerability: pages lacking answer-first block (score < 3 means no answer block)
+        if self.no_answer > 0:
+            issues.append(
+                f"{self.no_answer}/{n} pages lack Answer-first block (answerability < 3)"
+            )
+        # Proof: pages with < 3 external links
+        if self.weak_proof > 0:
+            issues.append(f"{self.weak_proof}/{n} pages have weak Proof (score < 2)")
+        # Fan-out: low subheading/FAQ
+        if self.low_fanout > 0:
+            issues.append(f"{self.low_fanout}/{n} pages have low Fan-out (score < 2)")
+        # Crawlability: missing basic SEO
+        if self.low_crawl > 0:
+            issues.append(f"{self.low_crawl}/{n} pages have low Crawlability (score < 3)")
+        # CSR pages
+        if self.csr_pages > 0:
+            issues.append(f"{self.csr_pages}/{n} pages are CSR-rendered (headless browser)")
+        # Trust: low trust
+        if self.low_trust > 0:
+            issues.append(f"{self.low_trust}/{n} pages have low Trust (score < 2)")
+        # Pages with very low total
+        if self.critical > 0:
+            issues.append(f"{self.critical}/{n} pages score <= 8/25 (critical)")
+
+        return {
+            "by_dimension": by_dim,
+            "top_issues": issues,
+        }
 
-    # Answerability: pages lacking answer-first block (score < 3 means no answer block)
-    no_answer = sum(1 for r in results if r["scores"]["answerability"] < 3)
-    if no_answer > 0:
-        issues.append(f"{no_answer}/{n} pages lack Answer-first block (answerability < 3)")
 
-    # Proof: pages with < 3 external links
-    weak_proof = sum(1 for r in results if r["scores"]["proof"] < 2)
-    if weak_proof > 0:
-        issues.append(f"{weak_proof}/{n} pages have weak Proof (score < 2)")
+def compute_summary(results: Iterable[dict]) -> dict:
+    """Compute aggregate summary across all scored pages."""
+    acc = SummaryAccumulator()
+    for r in results:
+        acc.add(r)
+    return acc.summary()
 
-    # Fan-out: low subheading/FAQ
-    low_fanout = sum(1 for r in results if r["scores"]["fan_out"] < 2)
-    if low_fanout > 0:
-        issues.append(f"{low_fanout}/{n} pages have low Fan-out (score < 2)")
 
-    # Crawlability: missing basic SEO
-    low_crawl = sum(1 for r in results if r["scores"]["crawlability"] < 3)
-    if low_crawl > 0:
-        issues.append(f"{low_crawl}/{n} pages have low Crawlability (score < 3)")
+# ---------------------------------------------------------------------------
+# Streaming input and parallel scoring
+# ---------------------------------------------------------------------------
 
-    # CSR pages
-    csr_pages = sum(1 for r in results if r["rendered_with"] == "selenium")
-    if csr_pages > 0:
-        issues.append(f"{csr_pages}/{n} pages are CSR-rendered (selenium)")
+def iter_page_sources(
+    input_dir: Path | None, stream: Path | None
+) -> Iterator[tuple[str, str]]:
+    """Yield ``(name, raw JSON text)`` per page without parsing it.
 
-    # Trust: low trust
-    low_trust = sum(1 for r in results if r["scores"]["trust"] < 2)
-    if low_trust > 0:
-        issues.append(f"{low_trust}/{n} pages have low Trust (score < 2)")
+    Reads either every ``*.json`` file in ``input_dir`` (skipping ``_*``), one
+    file at a time, or every line of a crawler JSONL stream (``.zst`` needs
+    the ``zstandard`` package).
+    """
+    if stream is not None:
+        raw = open(stream, "rb")
+        if stream.suffix == ".zst":
+            if zstandard is None:
+                raw.close()
+                raise RuntimeError(
+                    "zstandard package not installed. Install with: pip install zstandard"
+                )
+            raw = zstandard.ZstdDecompressor().stream_reader(
+                raw, read_across_frames=True, closefd=True
+            )
+        with io.TextIOWrapper(raw, encoding="utf-8") as lines:
+            for lineno, line in enumerate(lines, 1):
+                if line.strip():
+                    yield f"{stream.name}:{lineno}", line
+        return
 
-    # Pages with very low total
-    critical = sum(1 for r in results if r["scores"]["total"] <= 8)
-    if critical > 0:
-        issues.append(f"{critical}/{n} pages score <= 8/25 (critical)")
+    for path in sorted(input_dir.glob("*.json")):
+        if path.name.startswith("_"):
+            continue
+        try:
+            yield path.name, path.read_text(encoding="utf-8")
+        except OSError as exc:
+            print(f"  WARNING: Skipping {path.name}: {exc}", file=sys.stderr)
+
+
+class ScoredPage(NamedTuple):
+    name: str
+    result: dict | None
+    error: str | None = None
+    record_hash: str | None = None
+    cached: bool = False
+    previous: dict | None = None  # previous run's scores when rescored
+
+
+def page_hash(page: dict) -> str:
+    """Hash of a page record, ignoring VOLATILE_FIELDS."""
+    stable = {k: v for k, v in page.items() if k not in VOLATILE_FIELDS}
+    raw = json.dumps(stable, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+_score_cache: sqlite3.Connection | None = None
+_reuse_cached = False
+
+
+def init_scorer(cache_path: str | None, reuse_cached: bool = True) -> None:
+    """Per-process setup: open the score cache read-only (pool initializer)."""
+    global _score_cache, _reuse_cached
+    _score_cache = (
+        sqlite3.connect(f"file:{cache_path}?mode=ro", uri=True) if cache_path else None
+    )
+    _reuse_cached = reuse_cached
+
+
+def score_batch(batch: list[tuple[str, str]]) -> list[ScoredPage]:
+    """Parse raw page records and score them, reusing cached scores when the
+    record hash and SCORING_VERSION match."""
+    scored = []
+    for name, raw in batch:
+        try:
+            page = json.loads(raw)
+        except json.JSONDecodeError as exc:
+            scored.append(ScoredPage(name, None, str(exc)))
+            continue
+
+        record_hash = page_hash(page)
+        row = None
+        if _score_cache is not None:
+            row = _score_cache.execute(
+                "SELECT record_hash, scoring_version, result_json "
+                "FROM page_scores WHERE url = ?",
+                (page.get("url", ""),),
+            ).fetchone()
+        if (
+            row is not None
+            and _reuse_cached
+            and row[0] == record_hash
+            and row[1] == SCORING_VERSION
+        ):
+            scored.append(
+                ScoredPage(name, json.loads(row[2]), None, record_hash, cached=True)
+            )
+            continue
+
+        previous = json.loads(row[2])["scores"] if row is not None else None
+        scored.append(
+            ScoredPage(name, analyze_page(page), None, record_hash, previous=previous)
+        )
+    return scored
+
+
+def _batches(items: Iterable, size: int) -> Iterator[list]:
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
 
-    return {
-        "by_dimension": by_dim,
-        "top_issues": issues,
-    }
+
+def score_pages(
+    sources: Iterable[tuple[str, str]],
+    workers: int = DEFAULT_WORKERS,
+    batch_size: int = BATCH_SIZE,
+    cache_path: Path | None = None,
+    reuse_cached: bool = True,
+) -> Iterator[ScoredPage]:
+    """Score page records in input order, fanning batches out over processes.
+
+    At most ``workers * MAX_PENDING_BATCHES_PER_WORKER`` batches are in flight,
+    so only a bounded window of raw records is ever held in memory.
+    """
+    batches = _batches(sources, batch_size)
+    init_args = (str(cache_path) if cache_path else None, reuse_cached)
+    if workers <= 1:
+        init_scorer(*init_args)
+        for batch in batches:
+            yield from score_batch(batch)
+        return
+
+    max_pending = workers * MAX_PENDING_BATCHES_PER_WORKER
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_scorer, initargs=init_args
+    ) as pool:
+        pending: deque = deque()
+        for batch in batches:
+            pending.append(pool.submit(score_batch, batch))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
 
 
 def print_report(results: list[dict], summary: dict) -> None:
@@ -392,7 +615,7 @@ def print_report(results: list[dict], summary: dict) -> None:
 
         s = r["scores"]
         flag = ""
-        if r["rendered_with"] == "selenium":
+        if _is_csr(r):
             flag = "  [CSR]"
         elif s["total"] <= 8:
             flag = "  [!]"
@@ -419,6 +642,137 @@ def print_report(results: list[dict], summary: dict) -> None:
     print()
 
 
+# ---------------------------------------------------------------------------
+# Score cache and run-to-run diff
+# ---------------------------------------------------------------------------
+
+class ScoreCache:
+    """Writer side of the per-URL score cache (workers read it read-only)."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS page_scores ("
+            "url TEXT PRIMARY KEY, "
+            "record_hash TEXT NOT NULL, "
+            "scoring_version INTEGER NOT NULL, "
+            "result_json TEXT NOT NULL, "
+            "scored_at TEXT NOT NULL)"
+        )
+        self.conn.commit()
+        self._pending: list[tuple] = []
+
+    def put(self, result: dict, record_hash: str) -> None:
+        self._pending.append(
+            (
+                result["url"],
+                record_hash,
+                SCORING_VERSION,
+                json.dumps(result, ensure_ascii=False),
+                datetime.now(timezone.utc).isoformat(),
+            )
+        )
+        if len(self._pending) >= CACHE_WRITE_BATCH:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        self.conn.executemany(
+            "INSERT INTO page_scores "
+            "(url, record_hash, scoring_version, result_json, scored_at) "
+            "VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(url) DO UPDATE SET "
+            "record_hash = excluded.record_hash, "
+            "scoring_version = excluded.scoring_version, "
+            "result_json = excluded.result_json, "
+            "scored_at = excluded.scored_at",
+            self._pending,
+        )
+        self.conn.commit()
+        self._pending.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self.conn.close()
+
+
+class ScoreDiff:
+    """Collects per-page score changes against the previous run."""
+
+    def __init__(self):
+        self.rescored = 0
+        self.cached = 0
+        self.new_pages: list[dict] = []
+        self.changed: list[dict] = []
+
+    def add(self, scored: ScoredPage) -> None:
+        if scored.cached:
+            self.cached += 1
+            return
+        self.rescored += 1
+        result = scored.result
+        scores = result["scores"]
+        if scored.previous is None:
+            self.new_pages.append(
+                {"url": result["url"], "slug": result["slug"], "total": scores["total"]}
+            )
+            return
+        deltas = {
+            dim: scores[dim] - scored.previous.get(dim, 0)
+            for dim in (*DIMENSIONS, "total")
+        }
+        if any(deltas.values()):
+            self.changed.append(
+                {
+                    "url": result["url"],
+                    "slug": result["slug"],
+                    "previous_total": scored.previous.get("total", 0),
+                    "total": scores["total"],
+                    "delta": deltas.pop("total"),
+                    "dimension_deltas": {d: v for d, v in deltas.items() if v},
+                }
+            )
+
+    def report(self) -> dict:
+        changed = sorted(self.changed, key=lambda c: (c["delta"], c["url"]))
+        return {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "scoring_version": SCORING_VERSION,
+            "rescored_pages": self.rescored,
+            "cached_pages": self.cached,
+            "new_pages": self.new_pages,
+            "regressions": [c for c in changed if c["delta"] < 0],
+            "improvements": [c for c in reversed(changed) if c["delta"] > 0],
+            "dimension_only_changes": [c for c in changed if c["delta"] == 0],
+        }
+
+
+def print_diff(diff: dict, limit: int = 10) -> None:
+    print(
+        f"Rescored {diff['rescored_pages']} page(s), "
+        f"{diff['cached_pages']} unchanged (cached)."
+    )
+    if diff["new_pages"]:
+        print(f"New pages: {len(diff['new_pages'])}")
+    for label, key in (("Regressions", "regressions"), ("Improvements", "improvements")):
+        entries = diff[key]
+        if not entries:
+            continue
+        print(f"{label} since last run: {len(entries)}")
+        for c in entries[:limit]:
+            dims = ", ".join(f"{d} {v:+d}" for d, v in c["dimension_deltas"].items())
+            print(
+                f"  {c['delta']:+3d}  {c['previous_total']:>2} -> {c['total']:>2}  "
+                f"{c['url']}  ({dims})"
+            )
+        if len(entries) > limit:
+            print(f"  ... and {len(entries) - limit} more")
+    print()
+
+
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
@@ -433,45 +787,77 @@ def main():
         default=PROJECT_ROOT / "data" / "crawled",
         help="Directory containing crawled JSON files (default: data/crawled/)",
     )
+    parser.add_argument(
+        "--stream",
+        type=Path,
+        default=None,
+        help="Score a crawler JSONL stream (_pages.jsonl[.zst]) instead of --input-dir",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Scoring processes (default: {DEFAULT_WORKERS}; 1 scores inline)",
+    )
     parser.add_argument(
         "--output",
         type=Path,
         default=None,
         help="Output JSON path (default: <input-dir>/_geo_scorecard.json)",
     )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=None,
+        help=f"Score cache path (default: <input-dir>/{CACHE_FILENAME})",
+    )
+    parser.add_argument(
+        "--rescore",
+        action="store_true",
+        help="Rescore every page even if its cached score is current",
+    )
     args = parser.parse_args()
 
     input_dir = args.input_dir.resolve()
+    stream = args.stream.resolve() if args.stream else None
     output_path = (args.output or (input_dir / "_geo_scorecard.json")).resolve()
 
-    if not input_dir.is_dir():
+    if stream is not None:
+        if not stream.is_file():
+            print(f"ERROR: Stream file not found: {stream}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Scoring page records from {stream}")
+    elif not input_dir.is_dir():
         print(f"ERROR: Input directory not found: {input_dir}", file=sys.stderr)
         sys.exit(1)
+    else:
+        print(f"Scoring page files in {input_dir}")
 
-    # Collect JSON files, skip those starting with _
-    json_files = sorted(
-        f for f in input_dir.glob("*.json")
-        if not f.name.startswith("_")
-    )
-
-    if not json_files:
-        print(f"ERROR: No JSON files found in {input_dir}", file=sys.stderr)
-        sys.exit(1)
-
-    print(f"Found {len(json_files)} page file(s) in {input_dir}")
+    cache_path = (args.cache or (input_dir / CACHE_FILENAME)).resolve()
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache = ScoreCache(cache_path)
 
-    # Load and score each page
+    # Stream, score in parallel (reusing cached scores) and summarize incrementally
     results = []
-    for jf in json_files:
-        try:
-            with open(jf, "r", encoding="utf-8") as fh:
-                page = json.load(fh)
-        except (json.JSONDecodeError, OSError) as exc:
-            print(f"  WARNING: Skipping {jf.name}: {exc}", file=sys.stderr)
-            continue
-
-        result = analyze_page(page)
-        results.append(result)
+    acc = SummaryAccumulator()
+    diff = ScoreDiff()
+    try:
+        for scored in score_pages(
+            iter_page_sources(input_dir, stream),
+            workers=args.workers,
+            cache_path=cache_path,
+            reuse_cached=not args.rescore,
+        ):
+            if scored.error is not None:
+                print(f"  WARNING: Skipping {scored.name}: {scored.error}", file=sys.stderr)
+                continue
+            if not scored.cached:
+                cache.put(scored.result, scored.record_hash)
+            diff.add(scored)
+            results.append(scored.result)
+            acc.add(scored.result)
+    finally:
+        cache.close()
 
     if not results:
         print("ERROR: No valid pages could be analyzed.", file=sys.stderr)
@@ -484,9 +870,8 @@ def main():
     for rank, r in enumerate(results, 1):
         r["priority_rank"] = rank
 
-    # Compute summary
-    summary = compute_summary(results)
-    avg_score = round(sum(r["scores"]["total"] for r in results) / len(results), 1)
+    summary = acc.summary()
+    avg_score = acc.average_score
 
     # Build output JSON
     output_data = {
@@ -504,6 +889,13 @@ def main():
 
     print(f"Scorecard written to: {output_path}")
 
+    diff_report = diff.report()
+    diff_path = output_path.parent / DIFF_FILENAME
+    with open(diff_path, "w", encoding="utf-8") as fh:
+        json.dump(diff_report, fh, ensure_ascii=False, indent=2)
+    print(f"Score diff written to: {diff_path}")
+    print_diff(diff_report)
+
     # Print console report
     print_report(results, summary)
 
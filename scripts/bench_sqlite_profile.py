@@ -0,0 +1,164 @@
+"""Benchmark SQLite read/write concurrency with and without the performance profile.
+
+Seeds a throwaway database per mode, then runs reader threads (the
+progress/ETag queries behind the step views) next to writer threads (the
+``submit_answer`` upsert plus rollup refresh) against the same file, the way
+several uvicorn workers share one SQLite file in production.
+
+Usage:
+  python scripts/bench_sqlite_profile.py [--seconds 5] [--readers 4] [--writers 2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from apps.api.database import get_db  # noqa: E402
+from apps.api.etag import PROGRESS_VERSION_SQL  # noqa: E402
+from apps.api.main import SAVE_ANSWER_SQL  # noqa: E402
+from apps.api.progress import (  # noqa: E402
+    MODULE_ROLLUP_SQL,
+    REFRESH_MODULE_ROLLUP_SQL,
+    USER_PROGRESS_SQL,
+)
+from apps.api.seed import seed  # noqa: E402
+
+USER_IDS = [f"b2b_mkt_{idx}" for idx in range(1, 11)]
+
+
+def _quiz_answers(conn) -> list[tuple[int, int, int, int]]:
+    """(step_id, module_id, option_id, is_correct) for every quiz option."""
+    rows = conn.execute(
+        "SELECT s.id, s.module_id, o.id, o.is_correct FROM steps s "
+        "JOIN options o ON o.step_id = s.id WHERE s.type = 'quiz' "
+        "ORDER BY s.id, o.id"
+    ).fetchall()
+    return [tuple(row) for row in rows]
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def run_mode(profile: bool, seconds: float, readers: int, writers: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["SQLITE_PATH"] = str(Path(tmp) / "bench.db")
+        os.environ["SQLITE_PERFORMANCE_PROFILE"] = "true" if profile else "false"
+        seed()
+        conn = get_db()
+        answers = _quiz_answers(conn)
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
+
+        stop = threading.Event()
+        lock = threading.Lock()
+        read_latencies: list[float] = []
+        write_latencies: list[float] = []
+        errors = {"locked": 0}
+
+        def reader(idx: int) -> None:
+            conn = get_db()
+            user_id = USER_IDS[idx % len(USER_IDS)]
+            local: list[float] = []
+            try:
+                while not stop.is_set():
+                    started = time.perf_counter()
+                    try:
+                        conn.execute(PROGRESS_VERSION_SQL, (user_id,)).fetchone()
+                        conn.execute(MODULE_ROLLUP_SQL, (user_id,)).fetchall()
+                        conn.execute(USER_PROGRESS_SQL, (user_id,)).fetchall()
+                        conn.commit()
+                    except sqlite3.OperationalError:
+                        with lock:
+                            errors["locked"] += 1
+                        continue
+                    local.append(time.perf_counter() - started)
+            finally:
+                conn.close()
+                with lock:
+                    read_latencies.extend(local)
+
+        def writer(idx: int) -> None:
+            conn = get_db()
+            local: list[float] = []
+            n = idx
+            try:
+                while not stop.is_set():
+                    user_id = USER_IDS[n % len(USER_IDS)]
+                    step_id, module_id, option_id, is_correct = answers[n % len(answers)]
+                    n += writers
+                    started = time.perf_counter()
+                    try:
+                        conn.execute(
+                            SAVE_ANSWER_SQL, (user_id, step_id, option_id, is_correct, 5)
+                        )
+                        conn.execute(REFRESH_MODULE_ROLLUP_SQL, (user_id, module_id))
+                        conn.commit()
+                    except sqlite3.OperationalError:
+                        conn.rollback()
+                        with lock:
+                            errors["locked"] += 1
+                        continue
+                    local.append(time.perf_counter() - started)
+            finally:
+                conn.close()
+                with lock:
+                    write_latencies.extend(local)
+
+        threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+        threads += [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    return {
+        "journal_mode": journal_mode,
+        "reads_per_s": len(read_latencies) / seconds,
+        "writes_per_s": len(write_latencies) / seconds,
+        "read_p95_ms": _percentile(read_latencies, 0.95) * 1000,
+        "write_p95_ms": _percentile(write_latencies, 0.95) * 1000,
+        "lock_errors": errors["locked"],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=2)
+    args = parser.parse_args()
+
+    print(
+        f"{'profile':<8} {'journal':<8} {'reads/s':>9} {'writes/s':>9} "
+        f"{'read p95':>9} {'write p95':>10} {'locked':>7}"
+    )
+    for profile in (False, True):
+        r = run_mode(profile, args.seconds, args.readers, args.writers)
+        print(
+            f"{'on' if profile else 'off':<8} {r['journal_mode']:<8} "
+            f"{r['reads_per_s']:>9.0f} {r['writes_per_s']:>9.0f} "
+            f"{r['read_p95_ms']:>7.2f}ms {r['write_p95_ms']:>8.2f}ms "
+            f"{r['lock_errors']:>7}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,44 +1,87 @@
 """
 Enhanced crawl of b2b.fastcampus.co.kr with robots.txt/sitemap parsing,
-Selenium fallback for JS-rendered pages, and extended data collection.
+headless-browser fallback for JS-rendered pages, and extended data collection.
 
 Extends scripts/crawl_b2b.py with:
   - Pre-crawl robots.txt and sitemap.xml collection
   - 16 seed URLs (original 6 + 10 strategy/high-score additions)
-  - Selenium headless fallback for JS-rendered pages
+  - Headless rendering fallback (pool of Selenium or Playwright contexts)
   - Additional per-page fields (meta_robots, answer_first_block, img_alt_coverage, etc.)
 
 Usage:
     python scripts/crawl_b2b_enhanced.py
     python scripts/crawl_b2b_enhanced.py --max-pages 25
     python scripts/crawl_b2b_enhanced.py --no-selenium
+    python scripts/crawl_b2b_enhanced.py --include-sitemap --max-pages 400 --concurrency 8
+    python scripts/crawl_b2b_enhanced.py --full   # ignore the crawl state store
+    python scripts/crawl_b2b_enhanced.py --render-backend playwright --render-workers 4
+    python scripts/crawl_b2b_enhanced.py --resume   # continue an interrupted crawl
+
+Pages are fetched by an asyncio worker pool (httpx) from a deduplicating,
+depth-limited frontier. Requests to one host are spaced by the robots.txt
+Crawl-delay (or DELAY_BETWEEN_REQUESTS), so politeness no longer depends on
+crawling one page at a time.
+
+Pages the JS heuristic flags are queued to a pool of reusable headless browser
+contexts (one per render worker), started only when the first such page shows
+up. Chrome is located via $CHROME_BINARY, then PATH, then the Windows default.
+
+Page records stream to an append-only JSONL store as they are crawled, and the
+frontier/visited set is checkpointed every CHECKPOINT_EVERY pages, so a crashed
+crawl continues with --resume. The summary and report are computed from the
+stream rather than from an in-memory list of every page.
+
+Re-crawls are conditional: data/crawled/_crawl_state.sqlite keeps each URL's
+ETag/Last-Modified, body hash and last parsed record. Pages answering 304, or
+returning a byte-identical body, reuse that record without re-parsing.
 
 Output:
     data/crawled/{slug}.json            -- per-page structured data (overwrites originals)
+    data/crawled/_pages.jsonl[.zst]     -- every page record, one per line (this run)
+    data/crawled/_crawl_checkpoint.json -- resumable frontier checkpoint (while crawling)
     data/crawled/_robots_analysis.json  -- robots.txt analysis
     data/crawled/_sitemap_urls.json     -- sitemap URL listing
     data/crawled/_enhanced_summary.json -- crawl summary with GEO scores
     data/crawled/_enhanced_report.md    -- human-readable analysis report
+    data/crawled/_crawl_state.sqlite    -- validators/hashes for conditional re-crawls
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import hashlib
+import heapq
+import io
+import itertools
 import json
+import os
 import re
+import shutil
+import sqlite3
 import time
 import xml.etree.ElementTree as ET
-from copy import copy
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 from urllib.parse import urljoin, urlparse
 
+import httpx
 import requests
-from bs4 import BeautifulSoup, Comment, Tag
-
-# Chrome binary path for Selenium
-CHROME_BINARY_PATH = "C:/Program Files/Google/Chrome/Application/chrome.exe"
+from bs4 import BeautifulSoup, CData, NavigableString, PageElement, Tag
+
+# Chrome binary for Selenium: $CHROME_BINARY, else the first browser on PATH,
+# else the default Windows install location (else Selenium Manager decides)
+CHROME_BINARY_ENV = "CHROME_BINARY"
+CHROME_BINARY_NAMES = (
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+)
+WINDOWS_CHROME_PATH = "C:/Program Files/Google/Chrome/Application/chrome.exe"
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -81,15 +124,29 @@ HEADERS = {
 
 REQUEST_TIMEOUT = 15  # seconds
 SELENIUM_TIMEOUT = 20  # seconds
-SELENIUM_WAIT = 3  # seconds to wait after page load for JS rendering
-DELAY_BETWEEN_REQUESTS = 1.5  # seconds
+RENDER_MAX_WAIT = 3  # seconds, max wait for the DOM to settle after page load
+RENDER_POLL_INTERVAL = 0.25  # seconds between DOM settle checks
+DEFAULT_RENDER_WORKERS = max(1, min(8, (os.cpu_count() or 2) // 2))
+DELAY_BETWEEN_REQUESTS = 1.5  # seconds, per host, when robots.txt sets no Crawl-delay
+DEFAULT_CONCURRENCY = 4  # crawl workers
+DEFAULT_MAX_DEPTH = 3  # link hops from a seed URL
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 OUTPUT_DIR = PROJECT_ROOT / "data" / "crawled"
+CRAWL_STATE_PATH = OUTPUT_DIR / "_crawl_state.sqlite"
+PAGE_STORE_PATH = OUTPUT_DIR / "_pages.jsonl"
+CHECKPOINT_PATH = OUTPUT_DIR / "_crawl_checkpoint.json"
+CHECKPOINT_EVERY = 25  # pages between frontier checkpoints
+ZSTD_LEVEL = 10
 
 # Tags to remove when extracting text content
 REMOVE_TAGS = {"script", "style", "noscript", "svg", "iframe", "head"}
 
+# Attribute patterns used by the page extractor
+META_ROBOTS_NAME = re.compile(r"^robots$", re.IGNORECASE)
+OG_PROPERTY = re.compile(r"^og:")
+FAQ_CLASS = re.compile(r"faq|accordion|qa", re.IGNORECASE)
+
 # AI/search bot user-agents to look for in robots.txt
 AI_BOT_AGENTS = [
     "OAI-SearchBot",
@@ -116,7 +173,33 @@ FAQ_PATTERNS = [
 ]
 
 # ---------------------------------------------------------------------------
-# Selenium support (optional)
+# HTML parser (lxml when available, ~5-10x faster than html.parser)
+# ---------------------------------------------------------------------------
+
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# ---------------------------------------------------------------------------
+# zstd page store compression (optional)
+# ---------------------------------------------------------------------------
+
+ZSTD_AVAILABLE = False
+ZSTD_ERRORS: tuple[type[Exception], ...] = ()
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+    ZSTD_ERRORS = (zstandard.ZstdError,)
+except ImportError:
+    pass
+
+# ---------------------------------------------------------------------------
+# Headless rendering backends (optional: selenium, playwright)
 # ---------------------------------------------------------------------------
 
 SELENIUM_AVAILABLE = False
@@ -124,12 +207,41 @@ SELENIUM_AVAILABLE = False
 try:
     from selenium import webdriver
     from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.chrome.service import Service
 
     SELENIUM_AVAILABLE = True
 except ImportError:
     pass
 
+PLAYWRIGHT_AVAILABLE = False
+
+try:
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+    from playwright.async_api import async_playwright
+
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    pass
+
+# Size of the rendered DOM once the document has loaded, else -1
+DOM_SIZE_JS = (
+    "return document.readyState === 'complete' && document.body"
+    " ? document.body.innerHTML.length : -1;"
+)
+
+
+def find_chrome_binary() -> str | None:
+    """Locate a Chrome/Chromium binary for Selenium, or None to let it decide."""
+    configured = os.environ.get(CHROME_BINARY_ENV)
+    if configured:
+        return configured
+    for name in CHROME_BINARY_NAMES:
+        path = shutil.which(name)
+        if path:
+            return path
+    if Path(WINDOWS_CHROME_PATH).exists():
+        return WINDOWS_CHROME_PATH
+    return None
+
 
 def get_selenium_driver():
     """Create a headless Chrome Selenium driver."""
@@ -140,26 +252,135 @@ def get_selenium_driver():
     options.add_argument("--disable-gpu")
     options.add_argument("--window-size=1920,1080")
     options.add_argument(f"user-agent={HEADERS['User-Agent']}")
-    # Set Chrome binary location
-    if Path(CHROME_BINARY_PATH).exists():
-        options.binary_location = CHROME_BINARY_PATH
+    chrome_binary = find_chrome_binary()
+    if chrome_binary:
+        options.binary_location = chrome_binary
     driver = webdriver.Chrome(options=options)
     driver.set_page_load_timeout(SELENIUM_TIMEOUT)
     return driver
 
 
+def wait_for_render(driver, max_wait: float = RENDER_MAX_WAIT) -> None:
+    """Return once the loaded DOM stops changing size, or after ``max_wait``."""
+    deadline = time.monotonic() + max_wait
+    last_size = None
+    while time.monotonic() < deadline:
+        size = driver.execute_script(DOM_SIZE_JS)
+        if size >= 0 and size == last_size:
+            return
+        last_size = size
+        time.sleep(RENDER_POLL_INTERVAL)
+
+
 def fetch_with_selenium(url: str, driver) -> str | None:
     """Fetch a page using Selenium and return the rendered page source."""
     try:
         driver.get(url)
-        # Wait for JS rendering
-        time.sleep(SELENIUM_WAIT)
+        wait_for_render(driver)
         return driver.page_source
     except Exception as e:
         print(f"    [SELENIUM ERROR] {e}")
         return None
 
 
+class RenderBackend(ABC):
+    """A headless browser rendering pages in reusable per-worker contexts."""
+
+    name = "browser"
+
+    async def start(self) -> None:
+        pass
+
+    @abstractmethod
+    async def open_context(self):
+        """Open one worker's context (driver, page, ...)."""
+
+    @abstractmethod
+    async def render(self, context, url: str) -> str | None:
+        """Return the rendered HTML of ``url``, or None on failure."""
+
+    async def close_context(self, context) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+class SeleniumBackend(RenderBackend):
+    """One headless Chrome driver per context; blocking calls run in threads."""
+
+    name = "selenium"
+
+    async def open_context(self):
+        return await asyncio.to_thread(get_selenium_driver)
+
+    async def render(self, context, url: str) -> str | None:
+        return await asyncio.to_thread(fetch_with_selenium, url, context)
+
+    async def close_context(self, context) -> None:
+        await asyncio.to_thread(context.quit)
+
+
+class PlaywrightBackend(RenderBackend):
+    """One Chromium process; an isolated browser context (and page) per worker."""
+
+    name = "playwright"
+
+    def __init__(self):
+        self._playwright = None
+        self._browser = None
+
+    async def start(self) -> None:
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=True)
+
+    async def open_context(self):
+        context = await self._browser.new_context(
+            user_agent=HEADERS["User-Agent"],
+            viewport={"width": 1920, "height": 1080},
+        )
+        return await context.new_page()
+
+    async def render(self, context, url: str) -> str | None:
+        try:
+            await context.goto(url, wait_until="load", timeout=SELENIUM_TIMEOUT * 1000)
+            try:
+                await context.wait_for_load_state(
+                    "networkidle", timeout=RENDER_MAX_WAIT * 1000
+                )
+            except PlaywrightTimeoutError:
+                pass
+            return await context.content()
+        except Exception as e:
+            print(f"    [PLAYWRIGHT ERROR] {e}")
+            return None
+
+    async def close_context(self, context) -> None:
+        await context.context.close()
+
+    async def stop(self) -> None:
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+
+
+RENDER_BACKENDS = {"selenium": SeleniumBackend, "playwright": PlaywrightBackend}
+
+
+def make_render_backend(name: str) -> RenderBackend | None:
+    """Instantiate backend ``name``, or None if its package is not installed."""
+    available = PLAYWRIGHT_AVAILABLE if name == "playwright" else SELENIUM_AVAILABLE
+    if not available:
+        print(
+            f"[Render] WARNING: {name} package not installed. "
+            f"Install with: pip install {name}"
+        )
+        print("[Render] Falling back to requests-only mode.")
+        return None
+    return RENDER_BACKENDS[name]()
+
+
 # ---------------------------------------------------------------------------
 # Helpers (same as original)
 # ---------------------------------------------------------------------------
@@ -205,28 +426,6 @@ def normalize_url(href: str, page_url: str) -> str | None:
     return clean
 
 
-def extract_text_content(soup: BeautifulSoup) -> str:
-    """Extract cleaned main text content from page, removing scripts/styles."""
-    body = soup.find("body")
-    if not body:
-        return ""
-
-    body_copy = copy(body)
-
-    for tag_name in REMOVE_TAGS:
-        for tag in body_copy.find_all(tag_name):
-            tag.decompose()
-
-    for comment in body_copy.find_all(
-        string=lambda text: isinstance(text, Comment)
-    ):
-        comment.extract()
-
-    text = body_copy.get_text(separator="\n", strip=True)
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    return text.strip()
-
-
 # ---------------------------------------------------------------------------
 # Robots.txt and Sitemap parsers
 # ---------------------------------------------------------------------------
@@ -431,32 +630,12 @@ def fetch_sitemap(
 # ---------------------------------------------------------------------------
 
 
-def extract_meta_robots(soup: BeautifulSoup) -> str | None:
-    """Extract <meta name='robots' content='...'> value."""
-    tag = soup.find("meta", attrs={"name": re.compile(r"^robots$", re.IGNORECASE)})
-    if tag:
-        return tag.get("content", "").strip() or None
-    return None
-
-
-def extract_hreflang_tags(soup: BeautifulSoup) -> list[dict]:
-    """Extract hreflang link tags."""
-    tags = []
-    for link in soup.find_all("link", attrs={"rel": "alternate", "hreflang": True}):
-        lang = link.get("hreflang", "").strip()
-        href = link.get("href", "").strip()
-        if lang and href:
-            tags.append({"lang": lang, "url": href})
-    return tags
-
-
-def extract_answer_first_block(soup: BeautifulSoup) -> str | None:
+def extract_answer_first_block(h1: Tag | None) -> str | None:
     """
     Extract the text content between the first H1 and the next heading
     (H2/H3) -- up to 500 characters max.
     This represents the 'Answer-first' zone for GEO strategy.
     """
-    h1 = soup.find("h1")
     if not h1:
         return None
 
@@ -542,19 +721,12 @@ def count_words(text: str) -> int:
     return len(tokens)
 
 
-def count_faq_patterns(text: str, soup: BeautifulSoup) -> int:
-    """Count FAQ-like patterns in the page text and structure."""
-    count = 0
+def count_faq_patterns(text: str, faq_elements: int) -> int:
+    """Count FAQ-like patterns in the page text plus FAQ-structured elements
+    (<dt> and elements with faq/accordion/qa class names)."""
+    count = faq_elements
     for pattern in FAQ_PATTERNS:
         count += len(pattern.findall(text))
-
-    # Also check for FAQ-structured elements (dl/dt/dd, accordion patterns)
-    for dt in soup.find_all("dt"):
-        count += 1
-    # Check for elements with FAQ-related class names
-    for el in soup.find_all(attrs={"class": re.compile(r"faq|accordion|qa", re.IGNORECASE)}):
-        count += 1
-
     return count
 
 
@@ -564,156 +736,543 @@ def count_subheadings(headings: list[dict]) -> int:
 
 
 # ---------------------------------------------------------------------------
-# Page Crawler (enhanced)
+# Single-pass page extraction
 # ---------------------------------------------------------------------------
 
 
-def crawl_page(
-    url: str,
-    session: requests.Session,
-    selenium_driver=None,
-    use_selenium: bool = True,
-) -> dict[str, Any] | None:
-    """Crawl a single page and return structured data, or None on failure.
+def _attr_equals(value: Any, expected: str) -> bool:
+    """Match an attribute value like BeautifulSoup's ``attrs={name: expected}``."""
+    if value is None:
+        return False
+    if isinstance(value, (list, tuple)):
+        return expected in value or " ".join(value) == expected
+    return value == expected
 
-    First tries with requests. If the page appears JS-rendered (no title and
-    text_length < 300), retries with Selenium if available.
+
+def _attr_search(value: Any, pattern: re.Pattern) -> bool:
+    """Match an attribute value like BeautifulSoup's ``attrs={name: pattern}``."""
+    if value is None:
+        return False
+    if isinstance(value, (list, tuple)):
+        return any(pattern.search(v) for v in value) or bool(
+            pattern.search(" ".join(value))
+        )
+    return pattern.search(value) is not None
+
+
+@dataclass
+class PageExtract:
+    """Everything ``parse_page`` reads from a document, gathered in one walk."""
+
+    title_tag: Tag | None = None
+    meta_description_tag: Tag | None = None
+    meta_keywords_tag: Tag | None = None
+    meta_robots_tag: Tag | None = None
+    canonical_tag: Tag | None = None
+    first_h1: Tag | None = None
+    h1_count: int = 0
+    og_tags: dict[str, str] = field(default_factory=dict)
+    hreflang_tags: list[dict] = field(default_factory=list)
+    headings: list[dict] = field(default_factory=list)
+    json_ld: list[Any] = field(default_factory=list)
+    schema_microdata: list[str] = field(default_factory=list)
+    rdfa_types: list[str] = field(default_factory=list)
+    anchors: list[Tag] = field(default_factory=list)
+    nav_anchors: list[Tag] = field(default_factory=list)
+    header_anchors: list[Tag] = field(default_factory=list)
+    images: list[Tag] = field(default_factory=list)
+    faq_elements: int = 0
+    text: str = ""
+
+    @property
+    def title(self) -> str | None:
+        return self.title_tag.get_text(strip=True) if self.title_tag else None
+
+
+def extract_page(soup: BeautifulSoup) -> PageExtract:
+    """Collect every per-page field in a single depth-first walk.
+
+    Replaces a dozen ``find_all`` scans plus a copy-and-decompose of <body>.
+    Nodes are visited in document order, so "first match" and list ordering
+    are the same as the equivalent ``find``/``find_all`` calls. Body text
+    skips REMOVE_TAGS subtrees and non-text strings (comments, script data),
+    matching ``get_text(separator="\\n", strip=True)`` on a cleaned copy.
     """
-    print(f"  Fetching: {url}")
-    rendered_with = "requests"
-    js_rendered = False
-    resp_headers_dict: dict[str, str | None] = {
-        "Last-Modified": None,
-        "Cache-Control": None,
-        "Content-Type": None,
-        "X-Frame-Options": None,
-    }
-    x_robots_tag: str | None = None
-    status_code: int | None = None
+    page = PageExtract()
+    headings_by_level: dict[int, list[dict]] = {level: [] for level in range(1, 7)}
+    body: Tag | None = None
+    text_types: tuple[type, ...] = (NavigableString, CData)
+    text_parts: list[str] = []
+
+    # (node, collects body text, inside <nav>, inside <header>)
+    stack: list[tuple[PageElement, bool, bool, bool]] = [(soup, False, False, False)]
+    while stack:
+        node, in_text, in_nav, in_header = stack.pop()
+        if not isinstance(node, Tag):
+            if in_text and type(node) in text_types:
+                text = node.strip()
+                if text:
+                    text_parts.append(text)
+            continue
 
-    # --- Attempt with requests first ---
-    html_text: str | None = None
-    try:
-        resp = session.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
-        resp.raise_for_status()
-        status_code = resp.status_code
+        name = node.name
+        attrs = node.attrs
+        child_in_text = in_text
+        if body is None and name == "body":
+            body = node
+            child_in_text = True
+            types = node.interesting_string_types
+            text_types = (types,) if isinstance(types, type) else tuple(types)
+        elif in_text and name in REMOVE_TAGS:
+            child_in_text = False
+
+        if name == "a":
+            if attrs.get("href") is not None:
+                page.anchors.append(node)
+                if in_nav:
+                    page.nav_anchors.append(node)
+                if in_header:
+                    page.header_anchors.append(node)
+        elif name == "img":
+            page.images.append(node)
+        elif len(name) == 2 and name[0] == "h" and name[1] in "123456":
+            level = int(name[1])
+            if level == 1:
+                page.h1_count += 1
+                if page.first_h1 is None:
+                    page.first_h1 = node
+            text = node.get_text(strip=True)
+            if text:
+                headings_by_level[level].append(
+                    {"level": level, "tag": name, "text": text}
+                )
+        elif name == "meta":
+            meta_name = attrs.get("name")
+            if page.meta_description_tag is None and _attr_equals(
+                meta_name, "description"
+            ):
+                page.meta_description_tag = node
+            if page.meta_keywords_tag is None and _attr_equals(meta_name, "keywords"):
+                page.meta_keywords_tag = node
+            if page.meta_robots_tag is None and _attr_search(
+                meta_name, META_ROBOTS_NAME
+            ):
+                page.meta_robots_tag = node
+            if _attr_search(attrs.get("property"), OG_PROPERTY):
+                prop = node.get("property", "")
+                content = node.get("content", "")
+                if prop and content:
+                    page.og_tags[prop] = content
+        elif name == "link":
+            rel = attrs.get("rel")
+            if page.canonical_tag is None and _attr_equals(rel, "canonical"):
+                page.canonical_tag = node
+            if _attr_equals(rel, "alternate") and attrs.get("hreflang") is not None:
+                lang = node.get("hreflang", "").strip()
+                href = node.get("href", "").strip()
+                if lang and href:
+                    page.hreflang_tags.append({"lang": lang, "url": href})
+        elif name == "script":
+            if _attr_equals(attrs.get("type"), "application/ld+json"):
+                try:
+                    page.json_ld.append(json.loads(node.string or ""))
+                except (json.JSONDecodeError, TypeError):
+                    pass
+        elif name == "title":
+            if page.title_tag is None:
+                page.title_tag = node
+        elif name == "dt":
+            page.faq_elements += 1
+
+        if attrs:
+            if attrs.get("itemscope") is not None:
+                item_type = node.get("itemtype", "")
+                if item_type:
+                    page.schema_microdata.append(item_type)
+            if attrs.get("typeof") is not None:
+                page.rdfa_types.append(node.get("typeof", ""))
+            if _attr_search(attrs.get("class"), FAQ_CLASS):
+                page.faq_elements += 1
+
+        if node.contents:
+            child_in_nav = in_nav or name == "nav"
+            child_in_header = in_header or name == "header"
+            stack.extend(
+                (child, child_in_text, child_in_nav, child_in_header)
+                for child in reversed(node.contents)
+            )
+
+    for level in range(1, 7):
+        page.headings.extend(headings_by_level[level])
+    if body is not None:
+        text = "\n".join(text_parts)
+        page.text = re.sub(r"\n{3,}", "\n\n", text).strip()
+    return page
 
-        content_type = resp.headers.get("Content-Type", "")
-        if "text/html" not in content_type and "application/xhtml" not in content_type:
-            print(f"    [SKIP] Non-HTML content type: {content_type}")
+
+# ---------------------------------------------------------------------------
+# Crawl state store (conditional re-crawl)
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class CrawlState:
+    url: str
+    etag: str | None
+    last_modified: str | None
+    content_hash: str
+    result: dict[str, Any]
+
+
+class CrawlStateStore:
+    """SQLite store of per-URL validators, body hash and last parsed record."""
+
+    def __init__(self, path: Path = CRAWL_STATE_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS crawl_state ("
+            "url TEXT PRIMARY KEY, "
+            "etag TEXT, "
+            "last_modified TEXT, "
+            "content_hash TEXT NOT NULL, "
+            "result_json TEXT NOT NULL, "
+            "fetched_at TEXT NOT NULL)"
+        )
+        self.conn.commit()
+
+    def get(self, url: str) -> CrawlState | None:
+        row = self.conn.execute(
+            "SELECT url, etag, last_modified, content_hash, result_json "
+            "FROM crawl_state WHERE url = ?",
+            (url,),
+        ).fetchone()
+        if row is None:
             return None
+        return CrawlState(row[0], row[1], row[2], row[3], json.loads(row[4]))
+
+    def put(
+        self,
+        url: str,
+        *,
+        etag: str | None,
+        last_modified: str | None,
+        content_hash: str,
+        result: dict[str, Any],
+    ) -> None:
+        self.conn.execute(
+            "INSERT INTO crawl_state "
+            "(url, etag, last_modified, content_hash, result_json, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(url) DO UPDATE SET "
+            "etag = excluded.etag, "
+            "last_modified = excluded.last_modified, "
+            "content_hash = excluded.content_hash, "
+            "result_json = excluded.result_json, "
+            "fetched_at = excluded.fetched_at",
+            (
+                url,
+                etag,
+                last_modified,
+                content_hash,
+                json.dumps(result, ensure_ascii=False),
+                datetime.now(timezone.utc).isoformat(),
+            ),
+        )
+        self.conn.commit()
 
-        html_text = resp.text
-        resp_headers_dict = {
-            "Last-Modified": resp.headers.get("Last-Modified"),
-            "Cache-Control": resp.headers.get("Cache-Control"),
-            "Content-Type": resp.headers.get("Content-Type"),
-            "X-Frame-Options": resp.headers.get("X-Frame-Options"),
-        }
-        x_robots_tag = resp.headers.get("X-Robots-Tag")
+    def close(self) -> None:
+        self.conn.close()
+
+
+def content_hash(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
+
+
+@dataclass
+class FetchedPage:
+    url: str
+    status_code: int
+    html: str
+    body_hash: str
+    etag: str | None
+    headers: dict[str, str | None]
+    x_robots_tag: str | None
+    not_modified: bool = False
 
-    except requests.exceptions.Timeout:
+
+async def fetch_page(
+    client: httpx.AsyncClient, url: str, previous: CrawlState | None = None
+) -> FetchedPage | None:
+    """GET an HTML page, or return None (non-HTML, HTTP error, network error).
+
+    With ``previous`` state the request is conditional; a 304 comes back as
+    ``FetchedPage(not_modified=True)`` with an empty body.
+    """
+    request_headers = dict(HEADERS)
+    if previous is not None:
+        if previous.etag:
+            request_headers["If-None-Match"] = previous.etag
+        if previous.last_modified:
+            request_headers["If-Modified-Since"] = previous.last_modified
+
+    try:
+        resp = await client.get(url, headers=request_headers, timeout=REQUEST_TIMEOUT)
+        if resp.status_code == 304 and previous is not None:
+            return FetchedPage(
+                url=url,
+                status_code=304,
+                html="",
+                body_hash=previous.content_hash,
+                etag=resp.headers.get("ETag") or previous.etag,
+                headers={
+                    **previous.result.get("response_headers", {}),
+                    "Last-Modified": resp.headers.get("Last-Modified")
+                    or previous.last_modified,
+                },
+                x_robots_tag=previous.result.get("x_robots_tag"),
+                not_modified=True,
+            )
+        resp.raise_for_status()
+    except httpx.TimeoutException:
         print(f"    [ERROR] Timeout for {url}")
         return None
-    except requests.exceptions.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         print(f"    [ERROR] HTTP {e.response.status_code} for {url}")
         return None
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"    [ERROR] Request failed for {url}: {e}")
         return None
 
-    # --- Check if Selenium fallback is needed ---
-    soup = BeautifulSoup(html_text, "html.parser")
-    title_tag = soup.find("title")
-    title_text = title_tag.get_text(strip=True) if title_tag else None
-    h1_tags = soup.find_all("h1")
-    preliminary_text = extract_text_content(soup)
-    preliminary_len = len(preliminary_text)
-
-    # Trigger Selenium if: no title OR no H1, OR text_length < 500
-    needs_selenium = (not title_text) or (len(h1_tags) == 0) or (preliminary_len < 500)
-
-    if needs_selenium and use_selenium and selenium_driver is not None:
-        print("    [INFO] Page appears JS-rendered. Retrying with Selenium...")
-        selenium_html = fetch_with_selenium(url, selenium_driver)
-        if selenium_html:
-            html_text = selenium_html
-            soup = BeautifulSoup(html_text, "html.parser")
-            rendered_with = "selenium"
+    content_type = resp.headers.get("Content-Type", "")
+    if "text/html" not in content_type and "application/xhtml" not in content_type:
+        print(f"    [SKIP] Non-HTML content type: {content_type}")
+        return None
+
+    return FetchedPage(
+        url=url,
+        status_code=resp.status_code,
+        html=resp.text,
+        body_hash=content_hash(resp.content),
+        etag=resp.headers.get("ETag"),
+        headers={
+            "Last-Modified": resp.headers.get("Last-Modified"),
+            "Cache-Control": resp.headers.get("Cache-Control"),
+            "Content-Type": resp.headers.get("Content-Type"),
+            "X-Frame-Options": resp.headers.get("X-Frame-Options"),
+        },
+        x_robots_tag=resp.headers.get("X-Robots-Tag"),
+    )
+
+
+def needs_js_rendering(page: PageExtract) -> bool:
+    """Heuristic: no title, no H1, or under 500 chars of text."""
+    return (not page.title) or page.h1_count == 0 or len(page.text) < 500
+
+
+class RenderPool:
+    """Render-if-needed queue served by ``workers`` reusable browser contexts.
+
+    ``crawl_page`` submits only the pages ``needs_js_rendering`` flags. The
+    backend and its contexts start on the first submission, so crawling
+    server-rendered pages never launches a browser. If no context can be
+    opened, every queued and future request resolves to None.
+    """
+
+    def __init__(self, backend: RenderBackend, workers: int = DEFAULT_RENDER_WORKERS):
+        self.backend = backend
+        self.workers = max(1, workers)
+        self.failed = False
+        self._queue: asyncio.Queue | None = None
+        self._ready: asyncio.Task | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._live = 0
+
+    @property
+    def name(self) -> str:
+        return self.backend.name
+
+    async def render(self, url: str) -> str | None:
+        if self.failed:
+            return None
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._ready = asyncio.create_task(self.backend.start())
+            self._live = self.workers
+            self._tasks = [
+                asyncio.create_task(self._worker()) for _ in range(self.workers)
+            ]
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((url, future))
+        return await future
+
+    async def _worker(self) -> None:
+        try:
+            await self._ready
+            context = await self.backend.open_context()
+        except Exception as e:
+            print(f"    [RENDER ERROR] Could not start {self.name} context: {e}")
+            self._live -= 1
+            if self._live == 0:
+                self._fail_pending()
+            return
+
+        try:
+            while True:
+                url, future = await self._queue.get()
+                html = None
+                try:
+                    html = await self.backend.render(context, url)
+                except Exception as e:
+                    print(f"    [RENDER ERROR] {url}: {e}")
+                if not future.done():
+                    future.set_result(html)
+        finally:
+            try:
+                await self.backend.close_context(context)
+            except Exception:
+                pass
+
+    def _fail_pending(self) -> None:
+        self.failed = True
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_result(None)
+
+    async def close(self) -> None:
+        """Cancel the workers, close their contexts and stop the backend."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._ready is not None:
+            try:
+                await self._ready
+            except Exception:
+                return
+            await self.backend.stop()
+            print(f"[Render] {self.name} pool closed.")
+
+
+@dataclass
+class PageOutcome:
+    result: dict[str, Any]
+    changed: bool
+
+
+async def crawl_page(
+    url: str,
+    client: httpx.AsyncClient,
+    renderer: RenderPool | None = None,
+    use_selenium: bool = True,
+    state_store: CrawlStateStore | None = None,
+) -> PageOutcome | None:
+    """Crawl a single page and return structured data, or None on failure.
+
+    First tries with httpx. If the page appears JS-rendered (no title, no H1
+    or text_length < 500), queues it on the headless render pool. With a
+    ``state_store``, unchanged pages (304 or same body hash) reuse the stored
+    record instead of being parsed again. Only records from a plain fetch are
+    reused: a JS-rendered page's shell rarely changes while its rendered
+    content does, and a failed render must be retried, so those are fetched
+    and rendered again.
+    """
+    print(f"  Fetching: {url}")
+    previous = state_store.get(url) if state_store is not None else None
+    if previous is not None and previous.result.get("rendered_with") != "requests":
+        previous = None
+    fetched = await fetch_page(client, url, previous)
+    if fetched is None:
+        return None
+
+    if previous is not None and (
+        fetched.not_modified or fetched.body_hash == previous.content_hash
+    ):
+        reason = "304 Not Modified" if fetched.not_modified else "body unchanged"
+        print(f"    [CACHE] {url}: {reason}; reusing stored result.")
+        state_store.put(
+            url,
+            etag=fetched.etag,
+            last_modified=fetched.headers.get("Last-Modified"),
+            content_hash=previous.content_hash,
+            result=previous.result,
+        )
+        return PageOutcome(previous.result, changed=False)
+
+    rendered_with = "requests"
+    js_rendered = False
+    page = extract_page(BeautifulSoup(fetched.html, HTML_PARSER))
+
+    needs_selenium = needs_js_rendering(page)
+    if needs_selenium and use_selenium and renderer is not None:
+        print(f"    [INFO] {url} appears JS-rendered. Queued for {renderer.name}...")
+        rendered_html = await renderer.render(url)
+        if rendered_html:
+            page = extract_page(BeautifulSoup(rendered_html, HTML_PARSER))
+            rendered_with = renderer.name
             js_rendered = True
-            print("    [INFO] Using Selenium-rendered content.")
+            print(f"    [INFO] Using {renderer.name}-rendered content.")
         else:
             rendered_with = "requests_only"
-            js_rendered = False
-            print("    [WARN] Selenium fallback failed. Using requests content.")
-    elif needs_selenium and use_selenium and selenium_driver is None:
+            print("    [WARN] Headless render failed. Using requests content.")
+    elif needs_selenium and use_selenium and renderer is None:
         rendered_with = "requests_only"
-        js_rendered = False
-        print("    [INFO] Selenium not available, using requests-only data.")
+        print("    [INFO] No headless renderer available, using requests-only data.")
+
+    result = parse_page(
+        url,
+        page,
+        status_code=fetched.status_code,
+        resp_headers_dict=fetched.headers,
+        x_robots_tag=fetched.x_robots_tag,
+        rendered_with=rendered_with,
+        js_rendered=js_rendered,
+    )
+    if state_store is not None:
+        state_store.put(
+            url,
+            etag=fetched.etag,
+            last_modified=fetched.headers.get("Last-Modified"),
+            content_hash=fetched.body_hash,
+            result=result,
+        )
+    return PageOutcome(result, changed=True)
 
-    # --- Parse page content ---
 
-    # Title
-    title_tag = soup.find("title")
-    title = title_tag.get_text(strip=True) if title_tag else None
+def parse_page(
+    url: str,
+    page: PageExtract,
+    *,
+    status_code: int | None,
+    resp_headers_dict: dict[str, str | None],
+    x_robots_tag: str | None,
+    rendered_with: str,
+    js_rendered: bool,
+) -> dict[str, Any]:
+    """Build the per-page record written to data/crawled/{slug}.json."""
+    title = page.title
 
-    # Meta description
-    meta_desc_tag = soup.find("meta", attrs={"name": "description"})
     meta_description = (
-        meta_desc_tag.get("content", "").strip() if meta_desc_tag else None
+        page.meta_description_tag.get("content", "").strip()
+        if page.meta_description_tag
+        else None
     )
-
-    # Meta keywords
-    meta_kw_tag = soup.find("meta", attrs={"name": "keywords"})
-    meta_keywords = meta_kw_tag.get("content", "").strip() if meta_kw_tag else None
-
-    # Meta robots
-    meta_robots = extract_meta_robots(soup)
-
-    # OG tags
-    og_tags = {}
-    for og in soup.find_all("meta", attrs={"property": re.compile(r"^og:")}):
-        prop = og.get("property", "")
-        content = og.get("content", "")
-        if prop and content:
-            og_tags[prop] = content
-
-    # Canonical URL
-    canonical_tag = soup.find("link", attrs={"rel": "canonical"})
-    canonical = canonical_tag.get("href", "").strip() if canonical_tag else None
-
-    # Hreflang tags
-    hreflang_tags = extract_hreflang_tags(soup)
-
-    # Headings
-    headings = []
-    for level in range(1, 7):
-        tag_name = f"h{level}"
-        for h in soup.find_all(tag_name):
-            text = h.get_text(strip=True)
-            if text:
-                headings.append({"level": level, "tag": tag_name, "text": text})
-
-    # JSON-LD structured data
-    json_ld_scripts = []
-    for script in soup.find_all("script", attrs={"type": "application/ld+json"}):
-        try:
-            data = json.loads(script.string or "")
-            json_ld_scripts.append(data)
-        except (json.JSONDecodeError, TypeError):
-            pass
-
-    # Schema.org microdata (itemscope)
-    schema_microdata = []
-    for el in soup.find_all(attrs={"itemscope": True}):
-        item_type = el.get("itemtype", "")
-        if item_type:
-            schema_microdata.append(item_type)
-
-    # RDFa schema.org
-    rdfa_types = []
-    for el in soup.find_all(attrs={"typeof": True}):
-        rdfa_types.append(el.get("typeof", ""))
+    meta_keywords = (
+        page.meta_keywords_tag.get("content", "").strip()
+        if page.meta_keywords_tag
+        else None
+    )
+    meta_robots = (
+        page.meta_robots_tag.get("content", "").strip() or None
+        if page.meta_robots_tag
+        else None
+    )
+    canonical = (
+        page.canonical_tag.get("href", "").strip() if page.canonical_tag else None
+    )
+    headings = page.headings
+    json_ld_scripts = page.json_ld
+    schema_microdata = page.schema_microdata
 
     # Links
     internal_links = []
@@ -721,7 +1280,7 @@ def crawl_page(
     seen_internal: set[str] = set()
     seen_external: set[str] = set()
 
-    for a in soup.find_all("a", href=True):
+    for a in page.anchors:
         href = a.get("href", "").strip()
         normalized = normalize_url(href, url)
         if not normalized:
@@ -741,33 +1300,23 @@ def crawl_page(
 
     # Images
     images = []
-    for img in soup.find_all("img"):
+    for img in page.images:
         src = img.get("src", "").strip()
         alt = img.get("alt", "").strip()
         if src:
             abs_src = normalize_url(src, url) or src
             images.append({"src": abs_src, "alt": alt})
 
-    # Main text content
-    text_content = extract_text_content(soup)
+    text_content = page.text
 
-    # Nav elements
+    # Links inside <nav>, then inside <header>
     nav_links = []
-    for nav in soup.find_all("nav"):
-        for a in nav.find_all("a", href=True):
-            href = a.get("href", "").strip()
-            normalized = normalize_url(href, url)
-            if normalized and is_internal_link(href):
-                link_text = a.get_text(strip=True)
-                nav_links.append({"url": normalized, "text": link_text})
-
-    for header in soup.find_all("header"):
-        for a in header.find_all("a", href=True):
-            href = a.get("href", "").strip()
-            normalized = normalize_url(href, url)
-            if normalized and is_internal_link(href):
-                link_text = a.get_text(strip=True)
-                nav_links.append({"url": normalized, "text": link_text})
+    for a in page.nav_anchors + page.header_anchors:
+        href = a.get("href", "").strip()
+        normalized = normalize_url(href, url)
+        if normalized and is_internal_link(href):
+            link_text = a.get_text(strip=True)
+            nav_links.append({"url": normalized, "text": link_text})
 
     # Deduplicate nav_links
     seen_nav: set[str] = set()
@@ -779,10 +1328,10 @@ def crawl_page(
     nav_links = unique_nav
 
     # --- Enhanced fields ---
-    answer_first_block = extract_answer_first_block(soup)
+    answer_first_block = extract_answer_first_block(page.first_h1)
     img_alt_coverage = compute_img_alt_coverage(images)
     word_count = count_words(text_content)
-    faq_count = count_faq_patterns(text_content, soup)
+    faq_count = count_faq_patterns(text_content, page.faq_elements)
     subheading_count = count_subheadings(headings)
 
     result = {
@@ -795,11 +1344,11 @@ def crawl_page(
         "meta_description": meta_description,
         "meta_keywords": meta_keywords,
         "canonical": canonical,
-        "og_tags": og_tags,
+        "og_tags": page.og_tags,
         "headings": headings,
         "json_ld": json_ld_scripts,
         "schema_microdata": schema_microdata,
-        "rdfa_types": rdfa_types,
+        "rdfa_types": page.rdfa_types,
         "internal_links": internal_links,
         "external_links": external_links,
         "nav_links": nav_links,
@@ -814,7 +1363,7 @@ def crawl_page(
         "meta_robots": meta_robots,
         "x_robots_tag": x_robots_tag,
         "response_headers": resp_headers_dict,
-        "hreflang": hreflang_tags,
+        "hreflang": page.hreflang_tags,
         "answer_first_block": answer_first_block,
         "img_alt_coverage": img_alt_coverage,
         "word_count": word_count,
@@ -862,195 +1411,625 @@ def discover_urls_from_results(results: list[dict]) -> list[str]:
 
 
 # ---------------------------------------------------------------------------
-# Report Generation (enhanced)
+# Async crawl scheduler
 # ---------------------------------------------------------------------------
 
 
-def generate_enhanced_summary(
-    results: list[dict],
-    all_discovered: list[str],
-    robots_analysis: dict,
-    sitemap_urls: list[str],
-) -> dict:
-    """Generate _enhanced_summary.json content."""
-    total_internal = sum(len(r.get("internal_links", [])) for r in results)
-    total_external = sum(len(r.get("external_links", [])) for r in results)
+def robots_crawl_delay(robots_analysis: dict, agent: str = "*") -> float | None:
+    """Return the Crawl-delay (seconds) robots.txt declares for ``agent``."""
+    for rule in robots_analysis.get("user_agent_blocks", {}).get(agent, []):
+        if rule.get("directive") == "Crawl-delay":
+            try:
+                return float(rule["value"])
+            except (TypeError, ValueError):
+                return None
+    return None
 
-    nav_structure = {}
-    for r in results:
-        for nl in r.get("nav_links", []):
-            nav_structure[nl["url"]] = nl.get("text", "")
 
-    # Per-page GEO scores
-    page_scores = []
-    for r in results:
-        score = 0
-        issues = []
+@dataclass(order=True)
+class FrontierItem:
+    depth: int
+    seq: int
+    url: str = field(compare=False)
 
-        # Title
-        if r.get("title"):
-            score += 10
-        else:
-            issues.append("Missing title")
 
-        # Meta description
-        if r.get("meta_description"):
-            score += 10
-        else:
-            issues.append("Missing meta description")
+class CrawlFrontier:
+    """Deduplicating, depth-limited frontier that yields shallow URLs first."""
 
-        # H1
-        if r.get("h1_count") == 1:
-            score += 10
-        elif r.get("h1_count", 0) > 1:
-            score += 5
-            issues.append(f"Multiple H1 ({r['h1_count']})")
-        else:
-            issues.append("Missing H1")
+    def __init__(self, max_depth: int):
+        self.max_depth = max_depth
+        self.seen: set[str] = set()
+        self._heap: list[FrontierItem] = []
+        self._seq = itertools.count()
 
-        # Structured data
-        if r.get("has_structured_data"):
-            score += 15
-        else:
-            issues.append("No structured data")
+    def add(self, url: str, depth: int) -> bool:
+        if depth > self.max_depth or url in self.seen:
+            return False
+        self.seen.add(url)
+        heapq.heappush(self._heap, FrontierItem(depth, next(self._seq), url))
+        return True
 
-        # Canonical
-        if r.get("canonical"):
-            score += 5
-        else:
-            issues.append("Missing canonical")
+    def pop(self) -> FrontierItem | None:
+        return heapq.heappop(self._heap) if self._heap else None
+
+    def pending(self) -> list[FrontierItem]:
+        return sorted(self._heap)
+
+    @classmethod
+    def restore(
+        cls, max_depth: int, items: list[list], seen: Iterable[str]
+    ) -> "CrawlFrontier":
+        """Rebuild a frontier from checkpointed ``[depth, seq, url]`` items."""
+        frontier = cls(max_depth)
+        frontier.seen = set(seen)
+        frontier._heap = [FrontierItem(depth, seq, url) for depth, seq, url in items]
+        heapq.heapify(frontier._heap)
+        next_seq = max((item.seq for item in frontier._heap), default=-1) + 1
+        frontier._seq = itertools.count(next_seq)
+        return frontier
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class HostThrottle:
+    """Spaces request starts to the same host by its crawl delay."""
+
+    def __init__(self, default_delay: float, delays: dict[str, float] | None = None):
+        self.default_delay = default_delay
+        self.delays = dict(delays or {})
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._next_allowed: dict[str, float] = {}
+
+    async def wait(self, url: str) -> None:
+        host = urlparse(url).netloc
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            delay = self._next_allowed.get(host, 0.0) - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_allowed[host] = time.monotonic() + self.delays.get(
+                host, self.default_delay
+            )
 
-        # OG tags
-        if r.get("og_tags"):
-            score += 5
-        else:
-            issues.append("Missing OG tags")
 
-        # Answer-first block
-        if r.get("answer_first_block"):
-            score += 15
-        else:
-            issues.append("No answer-first block after H1")
+class CrawlScheduler:
+    """Bounded worker pool draining a ``CrawlFrontier``.
 
-        # Word count (prefer substantial content)
-        wc = r.get("word_count", 0)
-        if wc >= 500:
-            score += 10
-        elif wc >= 200:
-            score += 5
-        else:
-            issues.append(f"Low word count ({wc})")
+    Up to ``max_pages`` successful pages are crawled; failed fetches, and
+    pages whose processing raised, free their slot. Links found on a page are
+    queued one level deeper. Each page record goes to
+    ``on_result(result, changed)`` and is not kept; every ``checkpoint_every``
+    pages ``on_checkpoint`` receives a ``snapshot()``.
+    """
 
-        # Image alt coverage
-        alt_cov = r.get("img_alt_coverage", {})
-        if alt_cov.get("total", 0) > 0:
-            ratio = alt_cov.get("ratio", 0)
-            if ratio >= 0.8:
-                score += 10
-            elif ratio >= 0.5:
-                score += 5
-            else:
-                issues.append(f"Low image alt coverage ({ratio:.0%})")
-        else:
-            score += 5  # No images = neutral
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        frontier: CrawlFrontier,
+        throttle: HostThrottle,
+        *,
+        max_pages: int,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        renderer: RenderPool | None = None,
+        use_selenium: bool = True,
+        state_store: CrawlStateStore | None = None,
+        on_result=None,
+        on_checkpoint=None,
+        checkpoint_every: int = CHECKPOINT_EVERY,
+        pages_done: int = 0,
+        discovered: set[str] | None = None,
+    ):
+        self.client = client
+        self.frontier = frontier
+        self.throttle = throttle
+        self.max_pages = max_pages
+        self.concurrency = max(1, concurrency)
+        self.renderer = renderer
+        self.use_selenium = use_selenium
+        self.state_store = state_store
+        self.on_result = on_result
+        self.on_checkpoint = on_checkpoint
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.pages_done = pages_done
+        self.unchanged = 0
+        self.discovered: set[str] = set(frontier.seen) | set(discovered or ())
+        self._active: dict[int, FrontierItem] = {}
+        self._claimed = pages_done
+        self._in_flight = 0
+        self._cond: asyncio.Condition | None = None
+
+    async def run(self) -> int:
+        """Crawl until the frontier drains or ``max_pages`` is reached.
+
+        Returns the number of pages crawled, including resumed ones.
+        """
+        self._cond = asyncio.Condition()
+        await asyncio.gather(*(self._worker() for _ in range(self.concurrency)))
+        return self.pages_done
+
+    def snapshot(self) -> dict[str, Any]:
+        """Resumable state; in-flight pages go back into the frontier."""
+        pending = sorted([*self.frontier.pending(), *self._active.values()])
+        return {
+            "pages_done": self.pages_done,
+            "unchanged": self.unchanged,
+            "frontier": [[item.depth, item.seq, item.url] for item in pending],
+            "seen": sorted(self.frontier.seen),
+            "discovered": sorted(self.discovered),
+        }
 
-        # Subheadings (content structure)
-        if r.get("subheading_count", 0) >= 3:
-            score += 5
-        elif r.get("subheading_count", 0) >= 1:
-            score += 3
-        else:
-            issues.append("Few/no subheadings")
+    async def _next_item(self) -> FrontierItem | None:
+        async with self._cond:
+            while True:
+                if self._claimed >= self.max_pages:
+                    return None
+                item = self.frontier.pop()
+                if item is not None:
+                    self._claimed += 1
+                    self._in_flight += 1
+                    self._active[item.seq] = item
+                    return item
+                if self._in_flight == 0:
+                    return None
+                await self._cond.wait()
+
+    async def _worker(self) -> None:
+        while (item := await self._next_item()) is not None:
+            result = None
+            try:
+                await self.throttle.wait(item.url)
+                outcome = await crawl_page(
+                    item.url,
+                    self.client,
+                    renderer=self.renderer,
+                    use_selenium=self.use_selenium,
+                    state_store=self.state_store,
+                )
+                if outcome:
+                    result = outcome.result
+                    del self._active[item.seq]
+                    self.pages_done += 1
+                    if not outcome.changed:
+                        self.unchanged += 1
+                    if self.on_result is not None:
+                        self.on_result(result, outcome.changed)
+                    for url in discover_urls_from_results([result]):
+                        self.discovered.add(url)
+                        self.frontier.add(url, item.depth + 1)
+                    if (
+                        self.on_checkpoint is not None
+                        and self.pages_done % self.checkpoint_every == 0
+                    ):
+                        self.on_checkpoint(self.snapshot())
+            except Exception as e:
+                print(f"    [CRAWL ERROR] {item.url}: {e}")
+            finally:
+                self._active.pop(item.seq, None)
+                async with self._cond:
+                    self._in_flight -= 1
+                    if not result:
+                        self._claimed -= 1
+                    self._cond.notify_all()
+
+
+def save_page_result(result: dict) -> None:
+    out_path = OUTPUT_DIR / f"{result['slug']}.json"
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(f"    Saved: {out_path.name}")
 
-        # FAQ presence
-        if r.get("faq_count", 0) > 0:
-            score += 5
+
+# ---------------------------------------------------------------------------
+# Streaming page store and checkpoints
+# ---------------------------------------------------------------------------
+
+
+class PageStore:
+    """Append-only JSONL store of page records (zstd-compressed for ``.zst``).
+
+    ``flush`` makes everything written so far durable (ending a zstd frame)
+    and returns the byte offset a checkpoint records. Reopening with
+    ``truncate_to`` drops records written after that checkpoint, so a resumed
+    crawl never stores a page twice.
+    """
+
+    def __init__(self, path: Path, *, truncate_to: int | None = None):
+        self.path = path
+        self.compressed = path.suffix == ".zst"
+        if self.compressed and not ZSTD_AVAILABLE:
+            raise RuntimeError(
+                "zstandard package not installed. Install with: pip install zstandard"
+            )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if truncate_to is not None and path.exists():
+            self._file = open(path, "r+b")
+            self._file.truncate(truncate_to)
+            self._file.seek(truncate_to)
         else:
-            issues.append("No FAQ content detected")
+            self._file = open(path, "wb")
+        self._writer = (
+            zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(
+                self._file, closefd=False
+            )
+            if self.compressed
+            else None
+        )
+
+    def append(self, record: dict) -> None:
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        (self._writer or self._file).write(line.encode("utf-8"))
 
-        page_scores.append(
+    def flush(self) -> int:
+        if self._writer is not None:
+            self._writer.flush(zstandard.FLUSH_FRAME)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def close(self) -> None:
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+        self._file.close()
+
+
+def iter_page_records(path: Path) -> Iterator[dict]:
+    """Yield page records from a JSONL (or ``.jsonl.zst``) store, lazily.
+
+    A torn final record from an interrupted write is skipped.
+    """
+    if path.suffix == ".zst" and not ZSTD_AVAILABLE:
+        raise RuntimeError(
+            "zstandard package not installed. Install with: pip install zstandard"
+        )
+    raw = open(path, "rb")
+    if path.suffix == ".zst":
+        raw = zstandard.ZstdDecompressor().stream_reader(
+            raw, read_across_frames=True, closefd=True
+        )
+    with io.TextIOWrapper(raw, encoding="utf-8") as lines:
+        try:
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+        except ZSTD_ERRORS:
+            return
+
+
+class PageStream:
+    """Re-iterable view over a page store; every pass re-reads the file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter_page_records(self.path)
+
+
+def write_checkpoint(path: Path, state: dict[str, Any]) -> None:
+    """Write ``state`` atomically (a crash never leaves a partial checkpoint)."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def read_checkpoint(path: Path) -> dict[str, Any] | None:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+async def run_crawl(
+    seed_urls: list[str],
+    *,
+    max_pages: int,
+    max_depth: int,
+    concurrency: int,
+    crawl_delay: float,
+    store: PageStore,
+    render_backend: RenderBackend | None = None,
+    render_workers: int = DEFAULT_RENDER_WORKERS,
+    use_selenium: bool = True,
+    state_store: CrawlStateStore | None = None,
+    write_page_files: bool = True,
+    checkpoint_path: Path | None = CHECKPOINT_PATH,
+    checkpoint_every: int = CHECKPOINT_EVERY,
+    resume: dict[str, Any] | None = None,
+) -> tuple[int, set[str]]:
+    """Crawl into ``store``; return (pages crawled, every discovered URL).
+
+    With ``resume`` (a checkpoint), the frontier, visited set and page budget
+    continue from it and ``seed_urls`` is ignored. The checkpoint file is
+    removed once the crawl completes.
+    """
+    if resume is not None:
+        frontier = CrawlFrontier.restore(max_depth, resume["frontier"], resume["seen"])
+    else:
+        frontier = CrawlFrontier(max_depth)
+        for url in seed_urls:
+            frontier.add(url, 0)
+    throttle = HostThrottle(crawl_delay)
+    renderer = None
+    if render_backend is not None:
+        renderer = RenderPool(render_backend, render_workers)
+
+    def on_result(result: dict, changed: bool) -> None:
+        store.append(result)
+        if changed and write_page_files:
+            save_page_result(result)
+
+    def on_checkpoint(snapshot: dict[str, Any]) -> None:
+        write_checkpoint(
+            checkpoint_path,
             {
-                "url": r["url"],
-                "slug": r["slug"],
-                "score": score,
-                "max_score": 100,
-                "grade": (
-                    "A" if score >= 80 else
-                    "B" if score >= 60 else
-                    "C" if score >= 40 else
-                    "D" if score >= 20 else
-                    "F"
-                ),
-                "issues": issues,
-            }
+                **snapshot,
+                "saved_at": datetime.now(timezone.utc).isoformat(),
+                "max_depth": max_depth,
+                "store_path": str(store.path),
+                "store_offset": store.flush(),
+            },
+        )
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(
+        headers=HEADERS, follow_redirects=True, limits=limits
+    ) as client:
+        scheduler = CrawlScheduler(
+            client,
+            frontier,
+            throttle,
+            max_pages=max_pages,
+            concurrency=concurrency,
+            renderer=renderer,
+            use_selenium=use_selenium,
+            state_store=state_store,
+            on_result=on_result,
+            on_checkpoint=on_checkpoint if checkpoint_path is not None else None,
+            checkpoint_every=checkpoint_every,
+            pages_done=resume["pages_done"] if resume else 0,
+            discovered=set(resume["discovered"]) if resume else None,
         )
+        if checkpoint_path is not None:
+            on_checkpoint(scheduler.snapshot())
+        try:
+            pages = await scheduler.run()
+        finally:
+            if renderer is not None:
+                await renderer.close()
+    store.flush()
+    if checkpoint_path is not None:
+        checkpoint_path.unlink(missing_ok=True)
+    if scheduler.unchanged:
+        print(f"  {scheduler.unchanged} page(s) unchanged since the last crawl.")
+    return pages, scheduler.discovered
+
+
+# ---------------------------------------------------------------------------
+# Report Generation (enhanced)
+# ---------------------------------------------------------------------------
+
+
+def score_page_geo(r: dict) -> dict:
+    """Score one page record for the summary's ``page_geo_scores``."""
+    score = 0
+    issues = []
+
+    # Title
+    if r.get("title"):
+        score += 10
+    else:
+        issues.append("Missing title")
+
+    # Meta description
+    if r.get("meta_description"):
+        score += 10
+    else:
+        issues.append("Missing meta description")
+
+    # H1
+    if r.get("h1_count") == 1:
+        score += 10
+    elif r.get("h1_count", 0) > 1:
+        score += 5
+        issues.append(f"Multiple H1 ({r['h1_count']})")
+    else:
+        issues.append("Missing H1")
+
+    # Structured data
+    if r.get("has_structured_data"):
+        score += 15
+    else:
+        issues.append("No structured data")
+
+    # Canonical
+    if r.get("canonical"):
+        score += 5
+    else:
+        issues.append("Missing canonical")
+
+    # OG tags
+    if r.get("og_tags"):
+        score += 5
+    else:
+        issues.append("Missing OG tags")
 
-    # Selenium rendering summary
-    selenium_pages = [r["url"] for r in results if r.get("rendered_with") == "selenium"]
-    requests_pages = [r["url"] for r in results if r.get("rendered_with") == "requests"]
-    pages_needing_selenium = [
-        r["url"] for r in results
-        if r.get("rendered_with") in ("selenium", "requests_only")
-    ]
-    pages_selenium_failed = [
-        r["url"] for r in results
-        if r.get("rendered_with") == "requests_only"
-    ]
+    # Answer-first block
+    if r.get("answer_first_block"):
+        score += 15
+    else:
+        issues.append("No answer-first block after H1")
+
+    # Word count (prefer substantial content)
+    wc = r.get("word_count", 0)
+    if wc >= 500:
+        score += 10
+    elif wc >= 200:
+        score += 5
+    else:
+        issues.append(f"Low word count ({wc})")
+
+    # Image alt coverage
+    alt_cov = r.get("img_alt_coverage", {})
+    if alt_cov.get("total", 0) > 0:
+        ratio = alt_cov.get("ratio", 0)
+        if ratio >= 0.8:
+            score += 10
+        elif ratio >= 0.5:
+            score += 5
+        else:
+            issues.append(f"Low image alt coverage ({ratio:.0%})")
+    else:
+        score += 5  # No images = neutral
+
+    # Subheadings (content structure)
+    if r.get("subheading_count", 0) >= 3:
+        score += 5
+    elif r.get("subheading_count", 0) >= 1:
+        score += 3
+    else:
+        issues.append("Few/no subheadings")
+
+    # FAQ presence
+    if r.get("faq_count", 0) > 0:
+        score += 5
+    else:
+        issues.append("No FAQ content detected")
 
     return {
-        "crawl_timestamp": datetime.now(timezone.utc).isoformat(),
-        "base_domain": BASE_DOMAIN,
-        "page_count": len(results),
-        "crawled_urls": [r["url"] for r in results],
-        "total_internal_links": total_internal,
-        "total_external_links": total_external,
-        "discovered_urls_not_crawled": [
-            u for u in all_discovered if u not in {r["url"] for r in results}
-        ],
-        "navigation_structure": nav_structure,
-        "pages_with_structured_data": [
-            r["url"] for r in results if r.get("has_structured_data")
-        ],
-        "pages_without_structured_data": [
-            r["url"] for r in results if not r.get("has_structured_data")
-        ],
-        "robots_txt": {
-            "raw": robots_analysis.get("raw_content"),
-            "parsed_rules": robots_analysis.get("user_agent_blocks", {}),
-            "ai_bot_summary": robots_analysis.get("ai_bot_summary", {}),
-            "sitemaps_found": robots_analysis.get("sitemaps", []),
-            "status": robots_analysis.get("status"),
-        },
-        "sitemap_urls": sitemap_urls if isinstance(sitemap_urls, list) else [],
-        "sitemap_url_count": len(sitemap_urls),
-        "sitemap_urls_in_crawl": [
-            u for u in sitemap_urls if u in {r["url"] for r in results}
-        ],
-        "sitemap_urls_not_crawled": [
-            u for u in sitemap_urls if u not in {r["url"] for r in results}
-        ],
-        "pages_needing_selenium": pages_needing_selenium,
-        "pages_selenium_failed": pages_selenium_failed,
-        "rendering_summary": {
-            "selenium_rendered": selenium_pages,
-            "requests_only": requests_pages,
-        },
-        "page_geo_scores": page_scores,
-        "average_geo_score": (
-            round(sum(ps["score"] for ps in page_scores) / len(page_scores), 1)
-            if page_scores
-            else 0
+        "url": r["url"],
+        "slug": r["slug"],
+        "score": score,
+        "max_score": 100,
+        "grade": (
+            "A" if score >= 80 else
+            "B" if score >= 60 else
+            "C" if score >= 40 else
+            "D" if score >= 20 else
+            "F"
         ),
+        "issues": issues,
     }
 
 
+class EnhancedSummary:
+    """Builds _enhanced_summary.json one page record at a time.
+
+    Only URLs, link counts and per-page scores are retained, so the summary
+    of a large crawl can be computed straight from the page stream.
+    """
+
+    def __init__(self):
+        self.crawled_urls: list[str] = []
+        self.total_internal = 0
+        self.total_external = 0
+        self.nav_structure: dict[str, str] = {}
+        self.page_scores: list[dict] = []
+        self.with_structured_data: list[str] = []
+        self.without_structured_data: list[str] = []
+        self.selenium_pages: list[str] = []
+        self.requests_pages: list[str] = []
+        self.pages_needing_selenium: list[str] = []
+        self.pages_selenium_failed: list[str] = []
+
+    def add(self, r: dict) -> None:
+        url = r["url"]
+        self.crawled_urls.append(url)
+        self.total_internal += len(r.get("internal_links", []))
+        self.total_external += len(r.get("external_links", []))
+        for nl in r.get("nav_links", []):
+            self.nav_structure[nl["url"]] = nl.get("text", "")
+        self.page_scores.append(score_page_geo(r))
+        if r.get("has_structured_data"):
+            self.with_structured_data.append(url)
+        else:
+            self.without_structured_data.append(url)
+
+        # Headless rendering summary (any backend)
+        if r.get("js_rendered"):
+            self.selenium_pages.append(url)
+        if r.get("rendered_with") == "requests":
+            self.requests_pages.append(url)
+        if r.get("js_rendered") or r.get("rendered_with") == "requests_only":
+            self.pages_needing_selenium.append(url)
+        if r.get("rendered_with") == "requests_only":
+            self.pages_selenium_failed.append(url)
+
+    def build(
+        self,
+        all_discovered: list[str],
+        robots_analysis: dict,
+        sitemap_urls: list[str],
+    ) -> dict:
+        crawled = set(self.crawled_urls)
+        page_scores = self.page_scores
+        return {
+            "crawl_timestamp": datetime.now(timezone.utc).isoformat(),
+            "base_domain": BASE_DOMAIN,
+            "page_count": len(self.crawled_urls),
+            "crawled_urls": self.crawled_urls,
+            "total_internal_links": self.total_internal,
+            "total_external_links": self.total_external,
+            "discovered_urls_not_crawled": [
+                u for u in all_discovered if u not in crawled
+            ],
+            "navigation_structure": self.nav_structure,
+            "pages_with_structured_data": self.with_structured_data,
+            "pages_without_structured_data": self.without_structured_data,
+            "robots_txt": {
+                "raw": robots_analysis.get("raw_content"),
+                "parsed_rules": robots_analysis.get("user_agent_blocks", {}),
+                "ai_bot_summary": robots_analysis.get("ai_bot_summary", {}),
+                "sitemaps_found": robots_analysis.get("sitemaps", []),
+                "status": robots_analysis.get("status"),
+            },
+            "sitemap_urls": sitemap_urls if isinstance(sitemap_urls, list) else [],
+            "sitemap_url_count": len(sitemap_urls),
+            "sitemap_urls_in_crawl": [u for u in sitemap_urls if u in crawled],
+            "sitemap_urls_not_crawled": [u for u in sitemap_urls if u not in crawled],
+            "pages_needing_selenium": self.pages_needing_selenium,
+            "pages_selenium_failed": self.pages_selenium_failed,
+            "rendering_summary": {
+                "selenium_rendered": self.selenium_pages,
+                "requests_only": self.requests_pages,
+            },
+            "page_geo_scores": page_scores,
+            "average_geo_score": (
+                round(sum(ps["score"] for ps in page_scores) / len(page_scores), 1)
+                if page_scores
+                else 0
+            ),
+        }
+
+
+def generate_enhanced_summary(
+    results: Iterable[dict],
+    all_discovered: list[str],
+    robots_analysis: dict,
+    sitemap_urls: list[str],
+) -> dict:
+    """Generate _enhanced_summary.json content in one pass over ``results``."""
+    summary = EnhancedSummary()
+    for r in results:
+        summary.add(r)
+    return summary.build(all_discovered, robots_analysis, sitemap_urls)
+
+
 def generate_enhanced_report(
-    results: list[dict],
+    results: Iterable[dict],
     summary: dict,
     robots_analysis: dict,
     sitemap_urls: list[str],
 ) -> str:
-    """Generate _enhanced_report.md content."""
+    """Generate _enhanced_report.md content.
+
+    ``results`` is iterated once per section, so a ``PageStream`` works
+    without loading every record at once.
+    """
     lines: list[str] = []
     lines.append("# b2b.fastcampus.co.kr Enhanced Crawl Report (GEO Analysis)")
     lines.append("")
@@ -1120,7 +2099,7 @@ def generate_enhanced_report(
 
     if sitemap_urls:
         lines.append(f"**Total URLs in sitemap:** {len(sitemap_urls)}")
-        crawled_set = {r["url"] for r in results}
+        crawled_set = set(summary["crawled_urls"])
         in_crawl = [u for u in sitemap_urls if u in crawled_set]
         not_crawled = [u for u in sitemap_urls if u not in crawled_set]
         lines.append(f"**Crawled from sitemap:** {len(in_crawl)}")
@@ -1193,8 +2172,19 @@ def generate_enhanced_report(
     )
     lines.append("")
 
-    has_answer = [r for r in results if r.get("answer_first_block")]
-    no_answer = [r for r in results if not r.get("answer_first_block")]
+    has_answer = []
+    no_answer = []
+    for r in results:
+        if r.get("answer_first_block"):
+            has_answer.append(
+                {
+                    "url": r["url"],
+                    "title": r.get("title", r["url"]),
+                    "answer_first_block": r["answer_first_block"],
+                }
+            )
+        else:
+            no_answer.append({"url": r["url"], "title": r.get("title", "(no title)")})
 
     lines.append(f"**Pages WITH answer-first block:** {len(has_answer)}")
     lines.append(f"**Pages WITHOUT answer-first block:** {len(no_answer)}")
@@ -1206,7 +2196,7 @@ def generate_enhanced_report(
         for r in has_answer:
             block = r["answer_first_block"]
             preview = block[:150] + "..." if len(block) > 150 else block
-            lines.append(f"**{r.get('title', r['url'])}**")
+            lines.append(f"**{r['title']}**")
             lines.append(f"> {preview}")
             lines.append("")
 
@@ -1214,7 +2204,7 @@ def generate_enhanced_report(
         lines.append("### Pages Missing Answer-first Content (ACTION NEEDED)")
         lines.append("")
         for r in no_answer:
-            lines.append(f"- [ ] {r['url']} -- {r.get('title', '(no title)')}")
+            lines.append(f"- [ ] {r['url']} -- {r['title']}")
         lines.append("")
 
     lines.append("---")
@@ -1476,7 +2466,59 @@ def main():
     parser.add_argument(
         "--no-selenium",
         action="store_true",
-        help="Skip Selenium JS rendering even if available",
+        help="Skip headless JS rendering even if available",
+    )
+    parser.add_argument(
+        "--render-backend",
+        choices=sorted(RENDER_BACKENDS),
+        default="selenium",
+        help="Headless browser used for JS-rendered pages (default: selenium)",
+    )
+    parser.add_argument(
+        "--render-workers",
+        type=int,
+        default=DEFAULT_RENDER_WORKERS,
+        help=(
+            "Reusable browser contexts rendering in parallel "
+            f"(default: {DEFAULT_RENDER_WORKERS})"
+        ),
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Number of concurrent crawl workers (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--max-depth",
+        type=int,
+        default=DEFAULT_MAX_DEPTH,
+        help=f"Maximum link depth from seed URLs (default: {DEFAULT_MAX_DEPTH})",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Refetch and reparse every page, ignoring the crawl state store",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the crawl recorded in _crawl_checkpoint.json",
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Write the page stream as zstd-compressed _pages.jsonl.zst",
+    )
+    parser.add_argument(
+        "--no-page-files",
+        action="store_true",
+        help="Only write the page stream, not one {slug}.json file per page",
+    )
+    parser.add_argument(
+        "--include-sitemap",
+        action="store_true",
+        help="Also seed the frontier with every sitemap.xml URL",
     )
     args = parser.parse_args()
 
@@ -1485,8 +2527,13 @@ def main():
 
     print("=== b2b.fastcampus.co.kr Enhanced Crawler (GEO) ===")
     print(f"Max pages: {max_pages}")
-    print(f"Selenium: {'enabled' if use_selenium else 'disabled'}")
-    print(f"Selenium available: {SELENIUM_AVAILABLE}")
+    print(f"Concurrency: {args.concurrency}, max depth: {args.max_depth}")
+    print(f"Headless rendering: {'enabled' if use_selenium else 'disabled'}")
+    print(
+        f"Render backend: {args.render_backend} x {args.render_workers} worker(s) "
+        f"(selenium available: {SELENIUM_AVAILABLE}, "
+        f"playwright available: {PLAYWRIGHT_AVAILABLE})"
+    )
     print(f"Output directory: {OUTPUT_DIR}")
     print()
 
@@ -1538,106 +2585,80 @@ def main():
     print(f"  Saved: {sitemap_path.name} ({len(all_sitemap_urls)} URLs)")
     print()
 
-    # --- Setup Selenium driver (if needed) ---
-    selenium_driver = None
-    if use_selenium and SELENIUM_AVAILABLE:
-        try:
-            selenium_driver = get_selenium_driver()
-            print("[Selenium] ChromeDriver initialized successfully.")
-        except Exception as e:
-            print(f"[Selenium] WARNING: Failed to initialize ChromeDriver: {e}")
-            print("[Selenium] Falling back to requests-only mode.")
-            selenium_driver = None
-    elif use_selenium and not SELENIUM_AVAILABLE:
-        print(
-            "[Selenium] WARNING: selenium package not installed. "
-            "Install with: pip install selenium"
-        )
-        print("[Selenium] Falling back to requests-only mode.")
+    # --- Headless render backend (contexts start on first JS-rendered page) ---
+    render_backend = make_render_backend(args.render_backend) if use_selenium else None
     print()
 
-    # --- Phase 1: Crawl seed URLs ---
-    results: list[dict] = []
-    crawled_urls: set[str] = set()
-    queue: list[str] = list(SEED_URLS)
-    all_discovered: set[str] = set(SEED_URLS)
-
-    print("[Phase 1] Crawling seed URLs...")
+    # --- Phase 1+2: Crawl seeds and discovered pages concurrently ---
+    seed_urls = list(SEED_URLS)
+    if args.include_sitemap:
+        seed_urls += [
+            u for u in all_sitemap_urls if urlparse(u).netloc == BASE_DOMAIN
+        ]
+    crawl_delay = robots_crawl_delay(robots_analysis)
+    if crawl_delay is None:
+        crawl_delay = DELAY_BETWEEN_REQUESTS
+    print(
+        f"[Phase 1+2] Crawling {len(seed_urls)} seed URL(s) and discovered links "
+        f"(crawl delay {crawl_delay}s per host)..."
+    )
     print()
 
-    while queue and len(results) < max_pages:
-        url = queue.pop(0)
-        if url in crawled_urls:
-            continue
-
-        crawled_urls.add(url)
-        result = crawl_page(
-            url, session, selenium_driver=selenium_driver, use_selenium=use_selenium
+    checkpoint = read_checkpoint(CHECKPOINT_PATH) if args.resume else None
+    if checkpoint is not None:
+        store = PageStore(
+            Path(checkpoint["store_path"]), truncate_to=checkpoint["store_offset"]
         )
-
-        if result:
-            results.append(result)
-            slug = result["slug"]
-            out_path = OUTPUT_DIR / f"{slug}.json"
-            with open(out_path, "w", encoding="utf-8") as f:
-                json.dump(result, f, ensure_ascii=False, indent=2)
-            print(f"    Saved: {out_path.name}")
-
-        print()
-        time.sleep(DELAY_BETWEEN_REQUESTS)
-
-    # --- Phase 2: Discover and crawl additional pages ---
-    print("[Phase 2] Discovering additional pages from navigation...")
-    discovered = discover_urls_from_results(results)
-    new_urls = [u for u in discovered if u not in crawled_urls]
-    all_discovered.update(discovered)
-
-    if new_urls:
-        print(f"  Found {len(new_urls)} new internal URLs from navigation/links.")
-        print()
-
-        for url in new_urls:
-            if len(results) >= max_pages:
-                print(f"  Reached max-pages limit ({max_pages}). Stopping.")
-                break
-            if url in crawled_urls:
-                continue
-
-            crawled_urls.add(url)
-            result = crawl_page(
-                url,
-                session,
-                selenium_driver=selenium_driver,
+        max_depth = checkpoint["max_depth"]
+        print(
+            f"  Resuming from {CHECKPOINT_PATH.name}: "
+            f"{checkpoint['pages_done']} page(s) done, "
+            f"{len(checkpoint['frontier'])} queued."
+        )
+    else:
+        if args.resume:
+            print(f"  No {CHECKPOINT_PATH.name} found; starting a fresh crawl.")
+        store_path = PAGE_STORE_PATH
+        if args.compress:
+            store_path = store_path.with_name(store_path.name + ".zst")
+        store = PageStore(store_path)
+        max_depth = args.max_depth
+
+    state_store = CrawlStateStore()
+    if args.full and checkpoint is None:
+        state_store.conn.execute("DELETE FROM crawl_state")
+        state_store.conn.commit()
+    started = time.monotonic()
+    try:
+        page_count, all_discovered = asyncio.run(
+            run_crawl(
+                seed_urls,
+                max_pages=max_pages,
+                max_depth=max_depth,
+                concurrency=args.concurrency,
+                crawl_delay=crawl_delay,
+                store=store,
+                render_backend=render_backend,
+                render_workers=args.render_workers,
                 use_selenium=use_selenium,
+                state_store=state_store,
+                write_page_files=not args.no_page_files,
+                resume=checkpoint,
             )
-
-            if result:
-                results.append(result)
-                slug = result["slug"]
-                out_path = OUTPUT_DIR / f"{slug}.json"
-                with open(out_path, "w", encoding="utf-8") as f:
-                    json.dump(result, f, ensure_ascii=False, indent=2)
-                print(f"    Saved: {out_path.name}")
-
-                # Discover more URLs from this page
-                new_discovered = discover_urls_from_results([result])
-                for nd in new_discovered:
-                    if nd not in all_discovered:
-                        all_discovered.add(nd)
-                        if nd not in crawled_urls:
-                            new_urls.append(nd)
-
-            print()
-            time.sleep(DELAY_BETWEEN_REQUESTS)
-    else:
-        print("  No additional pages discovered.")
+        )
+    finally:
+        state_store.close()
+        store.close()
+    print(f"  Crawled {page_count} page(s) in {time.monotonic() - started:.1f}s.")
+    print(f"  Saved: {store.path.name}")
     print()
 
-    # --- Phase 3: Generate enhanced summary and report ---
+    # --- Phase 3: Generate enhanced summary and report (streamed) ---
     print("[Phase 3] Generating enhanced summary and report...")
 
+    pages = PageStream(store.path)
     summary = generate_enhanced_summary(
-        results, sorted(all_discovered), robots_analysis, all_sitemap_urls
+        pages, sorted(all_discovered), robots_analysis, all_sitemap_urls
     )
 
     summary_path = OUTPUT_DIR / "_enhanced_summary.json"
@@ -1646,25 +2667,17 @@ def main():
     print(f"  Saved: {summary_path.name}")
 
     report_md = generate_enhanced_report(
-        results, summary, robots_analysis, all_sitemap_urls
+        pages, summary, robots_analysis, all_sitemap_urls
     )
     report_path = OUTPUT_DIR / "_enhanced_report.md"
     with open(report_path, "w", encoding="utf-8") as f:
         f.write(report_md)
     print(f"  Saved: {report_path.name}")
 
-    # --- Cleanup Selenium ---
-    if selenium_driver is not None:
-        try:
-            selenium_driver.quit()
-            print("[Selenium] Driver closed.")
-        except Exception:
-            pass
-
     # --- Final summary ---
     print()
     print("=== Enhanced Crawl Complete ===")
-    print(f"Pages crawled: {len(results)}")
+    print(f"Pages crawled: {summary['page_count']}")
     print(f"Total internal links: {summary['total_internal_links']}")
     print(f"Total external links: {summary['total_external_links']}")
     print(f"Pages with structured data: {len(summary['pages_with_structured_data'])}")
@@ -0,0 +1,587 @@
+"""Offline tests for the enhanced crawler (scripts/crawl_b2b_enhanced.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+from bs4 import BeautifulSoup
+
+from scripts import crawl_b2b_enhanced
+from scripts.crawl_b2b_enhanced import (
+    BASE_URL,
+    ZSTD_AVAILABLE,
+    CrawlFrontier,
+    CrawlScheduler,
+    CrawlStateStore,
+    HostThrottle,
+    PageStore,
+    PlaywrightBackend,
+    RenderBackend,
+    RenderPool,
+    SeleniumBackend,
+    crawl_page,
+    extract_page,
+    iter_page_records,
+    make_render_backend,
+    needs_js_rendering,
+    parse_page,
+    read_checkpoint,
+    robots_crawl_delay,
+    run_crawl,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _html(title: str, links: list[str] = ()) -> str:
+    anchors = "".join(f'<a href="{href}">{href}</a>' for href in links)
+    body = f"<p>{title} body text. " + "Lorem ipsum dolor sit amet. " * 30 + "</p>"
+    return (
+        f"<html><head><title>{title}</title></head>"
+        f"<body><h1>{title}</h1>{body}{anchors}</body></html>"
+    )
+
+
+def _client(pages: dict[str, str]) -> httpx.AsyncClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        if url not in pages:
+            return httpx.Response(404)
+        return httpx.Response(
+            200, text=pages[url], headers={"Content-Type": "text/html; charset=utf-8"}
+        )
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+# ---------------------------------------------------------------------------
+# Frontier and throttle
+# ---------------------------------------------------------------------------
+
+
+def test_frontier_dedupes_and_enforces_max_depth():
+    frontier = CrawlFrontier(max_depth=1)
+    assert frontier.add(f"{BASE_URL}/a", 0)
+    assert not frontier.add(f"{BASE_URL}/a", 1)  # already seen
+    assert frontier.add(f"{BASE_URL}/b", 1)
+    assert not frontier.add(f"{BASE_URL}/c", 2)  # too deep
+    assert f"{BASE_URL}/c" not in frontier.seen
+    assert len(frontier) == 2
+
+
+def test_frontier_pops_shallow_urls_first_and_restores():
+    frontier = CrawlFrontier(max_depth=3)
+    frontier.add(f"{BASE_URL}/deep", 2)
+    frontier.add(f"{BASE_URL}/seed", 0)
+    frontier.add(f"{BASE_URL}/mid", 1)
+    first = frontier.pop()
+    assert first.url == f"{BASE_URL}/seed"
+
+    items = [[item.depth, item.seq, item.url] for item in frontier.pending()]
+    restored = CrawlFrontier.restore(3, items, frontier.seen)
+    assert [restored.pop().url for _ in range(2)] == [
+        f"{BASE_URL}/mid",
+        f"{BASE_URL}/deep",
+    ]
+    assert restored.pop() is None
+    # Restored URLs stay deduplicated and new items sort after the old ones
+    assert not restored.add(f"{BASE_URL}/seed", 0)
+    assert restored.add(f"{BASE_URL}/new", 1)
+    assert restored.pop().seq > max(seq for _, seq, _ in items)
+
+
+def test_robots_crawl_delay_parses_directive():
+    robots = {
+        "user_agent_blocks": {
+            "*": [
+                {"directive": "Disallow", "value": "/admin"},
+                {"directive": "Crawl-delay", "value": "2.5"},
+            ],
+            "GPTBot": [{"directive": "Crawl-delay", "value": "soon"}],
+        }
+    }
+    assert robots_crawl_delay(robots) == 2.5
+    assert robots_crawl_delay(robots, "GPTBot") is None
+    assert robots_crawl_delay({}) is None
+
+
+def test_host_throttle_spaces_requests_per_host():
+    throttle = HostThrottle(0.0, delays={"slow.example": 0.1})
+
+    async def starts(urls: list[str]) -> list[float]:
+        stamps: list[float] = []
+
+        async def hit(url: str) -> None:
+            await throttle.wait(url)
+            stamps.append(time.monotonic())
+
+        await asyncio.gather(*(hit(url) for url in urls))
+        return sorted(stamps)
+
+    slow = asyncio.run(starts(["https://slow.example/1", "https://slow.example/2"] * 2))
+    gaps = [b - a for a, b in zip(slow, slow[1:])]
+    assert all(gap >= 0.09 for gap in gaps), gaps
+
+    # Other hosts fall back to the default delay and are not held back
+    started = time.monotonic()
+    asyncio.run(starts([f"https://fast.example/{i}" for i in range(5)]))
+    assert time.monotonic() - started < 0.1
+
+
+# ---------------------------------------------------------------------------
+# Scheduler
+# ---------------------------------------------------------------------------
+
+
+def _run_scheduler(pages: dict[str, str], *, max_pages: int, max_depth: int, **kwargs):
+    async def run():
+        frontier = CrawlFrontier(max_depth)
+        frontier.add(f"{BASE_URL}/", 0)
+        async with _client(pages) as client:
+            scheduler = CrawlScheduler(
+                client,
+                frontier,
+                HostThrottle(0.0),
+                max_pages=max_pages,
+                concurrency=3,
+                use_selenium=False,
+                **kwargs,
+            )
+            crawled = await scheduler.run()
+        return scheduler, crawled
+
+    return asyncio.run(run())
+
+
+def test_scheduler_follows_links_within_depth_and_budget():
+    pages = {
+        f"{BASE_URL}/": _html("Home", ["/a", "/b", "/missing"]),
+        f"{BASE_URL}/a": _html("A", ["/", "/a/deep"]),
+        f"{BASE_URL}/b": _html("B", ["/a"]),
+        f"{BASE_URL}/a/deep": _html("Deep"),
+    }
+    seen: list[str] = []
+    scheduler, crawled = _run_scheduler(
+        pages,
+        max_pages=10,
+        max_depth=1,
+        on_result=lambda result, changed: seen.append(result["url"]),
+    )
+    # /missing 404s and frees its slot; /a/deep is beyond max_depth
+    assert crawled == 3
+    assert sorted(seen) == [f"{BASE_URL}/", f"{BASE_URL}/a", f"{BASE_URL}/b"]
+    assert f"{BASE_URL}/a/deep" in scheduler.discovered
+
+    _, crawled = _run_scheduler(pages, max_pages=2, max_depth=3)
+    assert crawled == 2
+
+
+def test_scheduler_worker_survives_page_errors(capsys):
+    pages = {
+        f"{BASE_URL}/": _html("Home", ["/a", "/b", "/c"]),
+        f"{BASE_URL}/a": _html("A"),
+        f"{BASE_URL}/b": _html("B"),
+        f"{BASE_URL}/c": _html("C"),
+    }
+    stored: list[str] = []
+
+    def on_result(result: dict, changed: bool) -> None:
+        if result["url"] == f"{BASE_URL}/b":
+            raise ValueError("disk full")
+        stored.append(result["url"])
+
+    scheduler, crawled = _run_scheduler(
+        pages, max_pages=10, max_depth=1, on_result=on_result
+    )
+    assert sorted(stored) == [f"{BASE_URL}/", f"{BASE_URL}/a", f"{BASE_URL}/c"]
+    assert f"[CRAWL ERROR] {BASE_URL}/b: disk full" in capsys.readouterr().out
+    assert not scheduler._active
+    assert scheduler._in_flight == 0
+
+
+# ---------------------------------------------------------------------------
+# Conditional re-crawls
+# ---------------------------------------------------------------------------
+
+
+def test_state_store_reuses_record_on_304_and_unchanged_body(tmp_path):
+    url = f"{BASE_URL}/service_online"
+    site = {"html": _html("Online"), "etag": '"v1"'}
+    conditional: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent = request.headers.get("If-None-Match")
+        conditional.append(sent)
+        if site["etag"] and sent == site["etag"]:
+            return httpx.Response(304, headers={"ETag": site["etag"]})
+        headers = {"Content-Type": "text/html"}
+        if site["etag"]:
+            headers["ETag"] = site["etag"]
+        return httpx.Response(200, text=site["html"], headers=headers)
+
+    store = CrawlStateStore(tmp_path / "state.sqlite")
+
+    async def crawl():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await crawl_page(url, client, use_selenium=False, state_store=store)
+
+    try:
+        first = asyncio.run(crawl())
+        assert first.changed
+        assert conditional == [None]
+        assert store.get(url).etag == '"v1"'
+
+        # Validator matches: 304, stored record reused
+        second = asyncio.run(crawl())
+        assert conditional[-1] == '"v1"'
+        assert not second.changed
+        assert second.result == first.result
+
+        # No validators, same bytes: the body hash short-circuits parsing
+        site["etag"] = None
+        third = asyncio.run(crawl())
+        assert not third.changed
+        assert third.result == first.result
+
+        # New bytes are parsed and replace the stored record
+        site["html"] = _html("Online v2")
+        fourth = asyncio.run(crawl())
+        assert fourth.changed
+        assert fourth.result["title"] == "Online v2"
+        assert store.get(url).result["title"] == "Online v2"
+    finally:
+        store.close()
+
+
+SPA_SHELL = '<html><head></head><body><div id="app"></div></body></html>'
+
+
+class _StubRenderer:
+    """Stands in for a RenderPool; returns the queued HTML (None = failed)."""
+
+    name = "stub"
+
+    def __init__(self, *html: str | None):
+        self.html = list(html)
+        self.calls = 0
+
+    async def render(self, url: str) -> str | None:
+        self.calls += 1
+        return self.html.pop(0)
+
+
+def _crawl_shell(store: CrawlStateStore, renderer: _StubRenderer):
+    url = f"{BASE_URL}/spa"
+
+    async def crawl():
+        async with _client({url: SPA_SHELL}) as client:
+            return await crawl_page(url, client, renderer=renderer, state_store=store)
+
+    return asyncio.run(crawl())
+
+
+def test_unchanged_shell_of_rendered_page_is_rendered_again(tmp_path):
+    store = CrawlStateStore(tmp_path / "state.sqlite")
+    renderer = _StubRenderer(_html("Rendered v1"), _html("Rendered v2"))
+    try:
+        first = _crawl_shell(store, renderer)
+        assert first.result["js_rendered"] is True
+        assert first.result["title"] == "Rendered v1"
+
+        # Same shell bytes, but the rendered content moved on
+        second = _crawl_shell(store, renderer)
+        assert renderer.calls == 2
+        assert second.changed
+        assert second.result["title"] == "Rendered v2"
+    finally:
+        store.close()
+
+
+def test_failed_render_is_retried_on_the_next_crawl(tmp_path):
+    store = CrawlStateStore(tmp_path / "state.sqlite")
+    renderer = _StubRenderer(None, _html("Rendered"))
+    try:
+        first = _crawl_shell(store, renderer)
+        assert first.result["rendered_with"] == "requests_only"
+
+        second = _crawl_shell(store, renderer)
+        assert renderer.calls == 2
+        assert second.changed
+        assert second.result["rendered_with"] == "stub"
+        assert second.result["title"] == "Rendered"
+        assert store.get(f"{BASE_URL}/spa").result["rendered_with"] == "stub"
+    finally:
+        store.close()
+
+
+# ---------------------------------------------------------------------------
+# Headless render pool
+# ---------------------------------------------------------------------------
+
+
+class _FakeBackend(RenderBackend):
+    """Records context use and render concurrency; ``fail`` URLs raise."""
+
+    name = "fake"
+
+    def __init__(self, *, fail: set[str] = frozenset(), broken: bool = False):
+        self.fail = fail
+        self.broken = broken
+        self.started = self.stopped = 0
+        self.contexts: list[dict] = []
+        self.active = self.peak = 0
+
+    async def start(self) -> None:
+        self.started += 1
+
+    async def open_context(self):
+        if self.broken:
+            raise RuntimeError("no browser")
+        context = {"id": len(self.contexts), "renders": 0, "closed": False}
+        self.contexts.append(context)
+        return context
+
+    async def render(self, context, url: str) -> str | None:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if url in self.fail:
+                raise RuntimeError("tab crashed")
+            context["renders"] += 1
+            return _html(f"Rendered {url.rsplit('/', 1)[-1]}")
+        finally:
+            self.active -= 1
+
+    async def close_context(self, context) -> None:
+        context["closed"] = True
+
+    async def stop(self) -> None:
+        self.stopped += 1
+
+
+def test_render_backends_are_abstract():
+    with pytest.raises(TypeError):
+        RenderBackend()
+    assert issubclass(SeleniumBackend, RenderBackend)
+    assert issubclass(PlaywrightBackend, RenderBackend)
+
+
+def test_make_render_backend_falls_back_when_package_missing(monkeypatch):
+    monkeypatch.setattr(crawl_b2b_enhanced, "SELENIUM_AVAILABLE", False)
+    monkeypatch.setattr(crawl_b2b_enhanced, "PLAYWRIGHT_AVAILABLE", True)
+    assert make_render_backend("selenium") is None
+    assert isinstance(make_render_backend("playwright"), PlaywrightBackend)
+
+
+def test_render_pool_reuses_a_bounded_set_of_contexts():
+    backend = _FakeBackend()
+
+    async def run():
+        pool = RenderPool(backend, workers=2)
+        try:
+            return await asyncio.gather(
+                *(pool.render(f"{BASE_URL}/p{i}") for i in range(6))
+            )
+        finally:
+            await pool.close()
+
+    html = asyncio.run(run())
+    assert all(f"Rendered p{i}" in h for i, h in enumerate(html))
+    assert backend.started == backend.stopped == 1
+    assert len(backend.contexts) == 2  # opened once per worker, then reused
+    assert sum(c["renders"] for c in backend.contexts) == 6
+    assert backend.peak == 2
+    assert all(c["closed"] for c in backend.contexts)
+
+
+def test_render_pool_that_cannot_open_a_context_resolves_to_none():
+    backend = _FakeBackend(broken=True)
+
+    async def run():
+        pool = RenderPool(backend, workers=2)
+        try:
+            first = await asyncio.gather(pool.render("a"), pool.render("b"))
+            return first, await pool.render("c"), pool.failed
+        finally:
+            await pool.close()
+
+    assert asyncio.run(run()) == ([None, None], None, True)
+
+
+def test_failed_render_falls_back_to_requests_content():
+    shell = f"{BASE_URL}/spa"
+    broken = f"{BASE_URL}/spa-broken"
+    backend = _FakeBackend(fail={broken})
+
+    async def run():
+        pool = RenderPool(backend, workers=1)
+        try:
+            async with _client({shell: SPA_SHELL, broken: SPA_SHELL}) as client:
+                return [
+                    await crawl_page(url, client, renderer=pool)
+                    for url in (shell, broken)
+                ]
+        finally:
+            await pool.close()
+
+    rendered, fallback = asyncio.run(run())
+    assert rendered.result["rendered_with"] == "fake"
+    assert rendered.result["js_rendered"] is True
+    assert rendered.result["title"] == "Rendered spa"
+    assert fallback.result["rendered_with"] == "requests_only"
+    assert fallback.result["js_rendered"] is False
+
+
+# ---------------------------------------------------------------------------
+# Single-pass extraction
+# ---------------------------------------------------------------------------
+
+
+def test_single_pass_extraction_matches_legacy_parse_page():
+    # crawl_page_expected.json was produced by the multi-pass parse_page that
+    # extract_page replaced, run on the same fixture with html.parser.
+    html = (FIXTURES / "crawl_page.html").read_text(encoding="utf-8")
+    expected = json.loads(
+        (FIXTURES / "crawl_page_expected.json").read_text(encoding="utf-8")
+    )
+
+    page = extract_page(BeautifulSoup(html, "html.parser"))
+    result = parse_page(
+        f"{BASE_URL}/service_online",
+        page,
+        status_code=200,
+        resp_headers_dict={"Content-Type": "text/html"},
+        x_robots_tag=None,
+        rendered_with="requests",
+        js_rendered=False,
+    )
+    result.pop("crawled_at")
+    assert result == expected
+    # Under 500 characters of text: both versions queue the page for rendering
+    assert needs_js_rendering(page)
+
+
+# ---------------------------------------------------------------------------
+# Page store and checkpoints
+# ---------------------------------------------------------------------------
+
+STORE_SUFFIXES = [
+    ".jsonl",
+    pytest.param(
+        ".jsonl.zst",
+        marks=pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard not installed"),
+    ),
+]
+
+
+@pytest.mark.parametrize("suffix", STORE_SUFFIXES)
+def test_page_store_skips_torn_record_and_truncates_to_checkpoint(tmp_path, suffix):
+    path = tmp_path / f"pages{suffix}"
+    store = PageStore(path)
+    store.append({"url": "/1"})
+    store.append({"url": "/2", "title": "두 번째"})
+    offset = store.flush()
+    store.append({"url": "/3"})
+    store.close()
+
+    # An interrupted append leaves half a record (half a zstd frame) behind
+    torn = b'{"url": "/4", "title": "cut'
+    if suffix.endswith(".zst"):
+        import zstandard
+
+        torn = zstandard.ZstdCompressor().compress(torn + b'"}\n')[:-4]
+    with open(path, "ab") as f:
+        f.write(torn)
+    assert [r["url"] for r in iter_page_records(path)] == ["/1", "/2", "/3"]
+
+    # Reopening at the checkpoint offset drops everything written after it
+    store = PageStore(path, truncate_to=offset)
+    store.append({"url": "/3b"})
+    store.close()
+    assert [r["url"] for r in iter_page_records(path)] == ["/1", "/2", "/3b"]
+
+
+def test_zst_store_requires_zstandard(tmp_path, monkeypatch):
+    monkeypatch.setattr(crawl_b2b_enhanced, "ZSTD_AVAILABLE", False)
+    path = tmp_path / "pages.jsonl.zst"
+    with pytest.raises(RuntimeError, match="zstandard package not installed"):
+        PageStore(path)
+    path.write_bytes(b"")
+    with pytest.raises(RuntimeError, match="zstandard package not installed"):
+        list(iter_page_records(path))
+
+
+class _Crash(BaseException):
+    """Stands in for the process dying mid-crawl."""
+
+
+@pytest.mark.parametrize("suffix", STORE_SUFFIXES)
+def test_checkpoint_resume_round_trip(tmp_path, monkeypatch, suffix):
+    names = ["a", "b", "c", "d", "e"]
+    pages = {f"{BASE_URL}/": _html("Home", [f"/{name}" for name in names])}
+    pages.update({f"{BASE_URL}/{name}": _html(name.upper()) for name in names})
+    crash_at = [f"{BASE_URL}/e"]
+    fetched: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        if url in crash_at:
+            raise _Crash(url)
+        fetched.append(url)
+        return httpx.Response(
+            200, text=pages[url], headers={"Content-Type": "text/html"}
+        )
+
+    monkeypatch.setattr(
+        httpx,
+        "AsyncClient",
+        functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler)),
+    )
+    store_path = tmp_path / f"pages{suffix}"
+    checkpoint_path = tmp_path / "checkpoint.json"
+    options = dict(
+        max_pages=10,
+        max_depth=1,
+        concurrency=1,
+        crawl_delay=0.0,
+        use_selenium=False,
+        write_page_files=False,
+        checkpoint_path=checkpoint_path,
+        checkpoint_every=2,
+    )
+
+    # First run: /, /a../d are stored, the checkpoint after /c is the last one
+    store = PageStore(store_path)
+    with pytest.raises(_Crash):
+        asyncio.run(run_crawl([f"{BASE_URL}/"], store=store, **options))
+    store.flush()  # /d reached the file but is newer than the checkpoint
+    checkpoint = read_checkpoint(checkpoint_path)
+    assert checkpoint["pages_done"] == 4
+    pending = [url for _, _, url in checkpoint["frontier"]]
+    assert pending == [f"{BASE_URL}/d", f"{BASE_URL}/e"]
+    assert len(list(iter_page_records(store_path))) == 5
+
+    # Resume: the store is cut back to the checkpoint and crawling continues
+    crash_at.clear()
+    fetched.clear()
+    store = PageStore(
+        Path(checkpoint["store_path"]), truncate_to=checkpoint["store_offset"]
+    )
+    crawled, discovered = asyncio.run(
+        run_crawl([], store=store, resume=checkpoint, **options)
+    )
+    store.close()
+
+    assert crawled == 6
+    assert fetched == [f"{BASE_URL}/d", f"{BASE_URL}/e"]
+    urls = [record["url"] for record in iter_page_records(store_path)]
+    assert sorted(urls) == sorted(pages)  # every page exactly once
+    assert discovered == set(pages)
+    assert not checkpoint_path.exists()
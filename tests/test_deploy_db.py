@@ -5,14 +5,42 @@ These tests verify migration/seed behavior needed for Railway operation.
 
 from __future__ import annotations
 
-from apps.api.database import get_db, init_db
-from apps.api.seed import seed
+import asyncio
+import multiprocessing
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from apps.api.async_database import AsyncConnectionPool
+from apps.api.content import read_content_version
+from apps.api.curriculum import (
+    BUNDLE_PATH,
+    SeedPlan,
+    compile_bundle,
+    load_plan,
+    read_source,
+)
+from apps.api.database import (
+    ConnectionPool,
+    PoolClosed,
+    PoolTimeout,
+    PostgresConnection,
+    get_db,
+    hot_query,
+    init_db,
+    query_stats,
+)
+from apps.api.seed import apply_plan, build_plan, changed_stages, seed
+from apps.api.write_queue import SQLiteWriteQueue
 
 
 CONTENT_TABLES = ("options", "steps", "modules", "stages")
 RESET_TABLES = (
     "user_bookmarks",
     "user_progress",
+    "user_module_progress",
     "options",
     "steps",
     "modules",
@@ -103,6 +131,78 @@ def test_seed_preserves_user_progress_rows():
         conn.close()
 
 
+def test_seed_restores_drifted_content_in_place():
+    _clear_all()
+    seed(run_migrations=False)
+
+    conn = get_db()
+    try:
+        step = conn.execute(
+            "SELECT id, title FROM steps ORDER BY id LIMIT 1"
+        ).fetchone()
+        conn.execute("UPDATE steps SET title = 'drifted' WHERE id = ?", (step["id"],))
+        conn.commit()
+        before = read_content_version(conn)
+    finally:
+        conn.close()
+
+    seed(run_migrations=False)
+
+    conn = get_db()
+    try:
+        row = conn.execute(
+            "SELECT title FROM steps WHERE id = ?", (step["id"],)
+        ).fetchone()
+        assert row["title"] == step["title"]
+        assert read_content_version(conn) > before
+    finally:
+        conn.close()
+
+
+def test_seed_is_skipped_when_content_hash_matches():
+    _clear_all()
+    seed(run_migrations=False)
+
+    conn = get_db()
+    try:
+        version = read_content_version(conn)
+        assert apply_plan(conn, build_plan()) is None
+        assert read_content_version(conn) == version
+    finally:
+        conn.close()
+
+
+def test_seed_reapplies_only_changed_stages():
+    _clear_all()
+    seed(run_migrations=False)
+
+    plan = build_plan()
+    step_key = next(key for key in plan.steps if key[0][0] == 2)
+    step_type, title, content_md, extension_md = plan.steps[step_key]
+    plan.steps[step_key] = (step_type, title + " (rev)", content_md, extension_md)
+
+    conn = get_db()
+    try:
+        assert changed_stages(conn, plan.stage_hashes()) == {2}
+        assert apply_plan(conn, plan) is not None
+        conn.commit()
+        row = conn.execute(
+            "SELECT s.title FROM steps s JOIN modules m ON m.id = s.module_id "
+            "WHERE m.stage_id = ? AND m.order_idx = ? AND s.order_idx = ?",
+            (2, step_key[0][1], step_key[1]),
+        ).fetchone()
+        assert row["title"] == title + " (rev)"
+        assert changed_stages(conn, plan.stage_hashes()) == set()
+    finally:
+        conn.close()
+
+
+def test_curriculum_bundle_matches_source():
+    documents = read_source()
+    assert BUNDLE_PATH.read_bytes() == compile_bundle(documents)
+    assert load_plan().stage_hashes() == SeedPlan.from_documents(documents).stage_hashes()
+
+
 def test_seed_balances_quiz_answer_labels():
     _clear_all()
     seed(run_migrations=False)
@@ -140,3 +240,306 @@ def test_seed_balances_quiz_answer_labels():
             assert sum(1 for opt in options if opt["is_correct"] == 1) == 1
     finally:
         conn.close()
+
+
+def test_content_writes_bump_content_version():
+    _clear_all()
+    seed(run_migrations=False)
+
+    conn = get_db()
+    try:
+        before = read_content_version(conn)
+        conn.execute("UPDATE steps SET title = title WHERE id = (SELECT MIN(id) FROM steps)")
+        conn.commit()
+        assert read_content_version(conn) > before
+    finally:
+        conn.close()
+
+
+def test_pool_reuses_released_connections():
+    pool = ConnectionPool(min_size=1, max_size=2)
+    pool.open()
+    try:
+        with pool.connection() as first:
+            first.execute("SELECT 1").fetchone()
+        with pool.connection() as second:
+            assert second is first
+        assert pool.size == 1
+    finally:
+        pool.close()
+
+
+def test_pool_times_out_when_exhausted():
+    pool = ConnectionPool(min_size=0, max_size=1, timeout_seconds=0.05)
+    try:
+        with pool.connection():
+            with pytest.raises(PoolTimeout):
+                pool.acquire()
+    finally:
+        pool.close()
+
+
+def test_pool_recycles_connections_past_max_lifetime():
+    pool = ConnectionPool(min_size=0, max_size=1, max_lifetime_seconds=0.01)
+    try:
+        with pool.connection() as first:
+            time.sleep(0.02)
+        with pool.connection() as second:
+            assert second is not first
+            assert second.execute("SELECT 1 AS ok").fetchone()["ok"] == 1
+    finally:
+        pool.close()
+
+
+def test_async_pool_serves_concurrent_queries_with_bounded_connections():
+    init_db()
+    pool = AsyncConnectionPool(max_size=2)
+
+    async def _query(idx: int) -> int:
+        async with pool.connection() as conn:
+            row = await conn.fetchone("SELECT ? AS value", (idx,))
+            return row["value"]
+
+    async def _run() -> list[int]:
+        try:
+            return await asyncio.gather(*(_query(i) for i in range(20)))
+        finally:
+            await pool.close()
+
+    assert asyncio.run(_run()) == list(range(20))
+    assert pool.size == 0
+
+
+def test_closed_pool_rejects_waiters_and_closes_released_connections():
+    pool = ConnectionPool(min_size=0, max_size=1, timeout_seconds=5)
+    conn = pool.acquire()
+    errors: list[Exception] = []
+
+    def wait_for_connection() -> None:
+        try:
+            pool.acquire()
+        except Exception as exc:
+            errors.append(exc)
+
+    waiter = threading.Thread(target=wait_for_connection)
+    waiter.start()
+    time.sleep(0.05)
+    started = time.monotonic()
+    pool.close()
+    waiter.join(timeout=5)
+    assert time.monotonic() - started < 1  # woken, not timed out
+    assert [type(exc) for exc in errors] == [PoolClosed]
+
+    pool.release(conn)
+    assert pool.size == 0
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+    with pytest.raises(PoolClosed):
+        pool.acquire()
+
+
+def test_closed_async_pool_rejects_waiters_and_closes_released_connections():
+    init_db()
+    pool = AsyncConnectionPool(max_size=1, timeout_seconds=5)
+
+    async def _run():
+        conn = await pool.acquire()
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.05)
+        started = time.monotonic()
+        await pool.close()
+        with pytest.raises(PoolClosed):
+            await waiter
+        assert time.monotonic() - started < 1
+
+        await pool.release(conn)
+        assert pool.size == 0
+        # Its dedicated executor thread was shut down with it
+        with pytest.raises(RuntimeError, match="shutdown"):
+            await conn.fetchone("SELECT 1")
+        with pytest.raises(PoolClosed):
+            await pool.acquire()
+
+    asyncio.run(_run())
+
+
+class _RecordingPsycopgConnection:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, bool | None]] = []
+
+    def execute(self, query, params=None, *, prepare=None):
+        self.calls.append((query, prepare))
+
+
+def test_postgres_connection_prepares_hot_queries_once_per_session():
+    hot = hot_query("SELECT version FROM user_progress_version WHERE user_id = ?")
+    raw = _RecordingPsycopgConnection()
+    conn = PostgresConnection(raw, prepare=True)
+    before = query_stats()
+
+    conn.execute(hot, ("b2b_mkt_1",))
+    conn.execute(hot, ("b2b_mkt_2",))
+    conn.execute("SELECT 'a?' WHERE 1 = ?", (1,))
+
+    assert raw.calls == [
+        ("SELECT version FROM user_progress_version WHERE user_id = %s", True),
+        ("SELECT version FROM user_progress_version WHERE user_id = %s", True),
+        ("SELECT 'a?' WHERE 1 = %s", None),
+    ]
+    after = query_stats()
+    assert after["statements_prepared"] - before["statements_prepared"] == 1
+    assert after["prepare_hits"] - before["prepare_hits"] == 1
+    assert after["conversion_hits"] > before["conversion_hits"]
+
+    # Without the opt-in, psycopg's own prepare heuristic applies.
+    PostgresConnection(raw).execute(hot, ("b2b_mkt_1",))
+    assert raw.calls[-1][1] is None
+
+
+def test_sqlite_connections_use_performance_profile(tmp_path, monkeypatch):
+    monkeypatch.setenv("SQLITE_PATH", str(tmp_path / "tuned.db"))
+    monkeypatch.setenv("SQLITE_MMAP_SIZE", "1048576")
+    conn = get_db()
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 1048576
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+    finally:
+        conn.close()
+
+    monkeypatch.setenv("SQLITE_PATH", str(tmp_path / "plain.db"))
+    monkeypatch.setenv("SQLITE_PERFORMANCE_PROFILE", "false")
+    conn = get_db()
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    finally:
+        conn.close()
+
+
+def test_write_queue_group_commits_and_isolates_failing_jobs(tmp_path, monkeypatch):
+    monkeypatch.setenv("SQLITE_PATH", str(tmp_path / "queue.db"))
+    conn = get_db()
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+    conn.commit()
+    conn.close()
+
+    writer = SQLiteWriteQueue(max_delay_seconds=0.05)
+    try:
+        futures = [
+            writer.submit(lambda c, i=i: c.execute("INSERT INTO t (id) VALUES (?)", (i,)))
+            for i in range(20)
+        ]
+        duplicate = writer.submit(lambda c: c.execute("INSERT INTO t (id) VALUES (0)"))
+        for future in futures:
+            future.result(timeout=5)
+        with pytest.raises(sqlite3.IntegrityError):
+            duplicate.result(timeout=5)
+    finally:
+        writer.close()
+
+    assert writer.jobs == 20
+    assert writer.batches < 20
+    conn = get_db()
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 20
+    finally:
+        conn.close()
+
+
+def test_write_queue_recovers_when_its_connection_cannot_open(tmp_path, monkeypatch):
+    monkeypatch.setenv("SQLITE_PATH", str(tmp_path / "flaky.db"))
+    conn = get_db()
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+    conn.commit()
+    conn.close()
+
+    attempts = []
+
+    def flaky_connect():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise sqlite3.OperationalError("unable to open database file")
+        return get_db()
+
+    writer = SQLiteWriteQueue(flaky_connect)
+    try:
+        failed = writer.submit(lambda c: c.execute("INSERT INTO t (id) VALUES (1)"))
+        with pytest.raises(sqlite3.OperationalError, match="unable to open"):
+            failed.result(timeout=5)
+        # The dead writer was replaced, so later writes do not hang
+        writer.submit(lambda c: c.execute("INSERT INTO t (id) VALUES (2)")).result(
+            timeout=5
+        )
+    finally:
+        writer.close()
+
+    assert len(attempts) == 2
+    conn = get_db()
+    try:
+        assert conn.execute("SELECT id FROM t").fetchall()[0][0] == 2
+    finally:
+        conn.close()
+
+
+def _queue_writer_process(worker: int, rows: int) -> None:
+    writer = SQLiteWriteQueue()
+    try:
+        futures = [
+            writer.submit(
+                lambda c, i=i: c.execute(
+                    "INSERT INTO t (id, worker) VALUES (?, ?)", (worker * rows + i, worker)
+                )
+            )
+            for i in range(rows)
+        ]
+        for future in futures:
+            future.result(timeout=30)
+    finally:
+        writer.close()
+
+
+def test_write_queues_in_separate_processes_share_the_file_lock(tmp_path, monkeypatch):
+    # Each process has its own writer; nothing coordinates them except the
+    # SQLite lock, which busy_timeout turns into waiting instead of failing.
+    monkeypatch.setenv("SQLITE_PATH", str(tmp_path / "workers.db"))
+    conn = get_db()
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, worker INTEGER NOT NULL)")
+    conn.commit()
+    conn.close()
+
+    ctx = multiprocessing.get_context("spawn")
+    workers, rows = 3, 150
+    processes = [
+        ctx.Process(target=_queue_writer_process, args=(worker, rows))
+        for worker in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+    assert [process.exitcode for process in processes] == [0] * workers
+
+    conn = get_db()
+    try:
+        counts = conn.execute(
+            "SELECT worker, COUNT(*) FROM t GROUP BY worker ORDER BY worker"
+        ).fetchall()
+    finally:
+        conn.close()
+    assert [tuple(row) for row in counts] == [(w, rows) for w in range(workers)]
+
+
+def test_sync_and_async_pools_share_one_connection_budget(monkeypatch):
+    monkeypatch.setenv("DB_POOL_MAX_SIZE", "10")
+    assert ConnectionPool.from_env().max_size + AsyncConnectionPool.from_env().max_size == 10
+
+    monkeypatch.setenv("DB_ASYNC_POOL_MAX_SIZE", "7")
+    assert ConnectionPool.from_env().max_size == 3
+    assert AsyncConnectionPool.from_env().max_size == 7
+
+    monkeypatch.setenv("DB_ASYNC_POOL_MAX_SIZE", "10")
+    with pytest.raises(ValueError):
+        AsyncConnectionPool.from_env()
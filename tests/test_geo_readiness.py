@@ -0,0 +1,228 @@
+"""Tests for the GEO readiness scorer (scripts/analyze_geo_readiness.py)."""
+
+from __future__ import annotations
+
+import copy
+import json
+import random
+import sys
+from pathlib import Path
+
+from scripts import analyze_geo_readiness
+from scripts.analyze_geo_readiness import (
+    DIFF_FILENAME,
+    DIMENSIONS,
+    SummaryAccumulator,
+    analyze_page,
+    compute_summary,
+    iter_page_sources,
+    score_pages,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+BASE_URL = "https://b2b.fastcampus.co.kr"
+
+
+def _page(slug: str, **overrides) -> dict:
+    raw = (FIXTURES / "crawl_page_expected.json").read_text(encoding="utf-8")
+    page = json.loads(raw)
+    page.update(url=f"{BASE_URL}/{slug}", slug=slug, crawled_at="2026-01-01T00:00:00")
+    page.update(copy.deepcopy(overrides))
+    return page
+
+
+def _external_links(count: int) -> list[dict]:
+    return [
+        {"url": f"https://source{i}.example/", "text": "출처"} for i in range(count)
+    ]
+
+
+def _pages() -> list[dict]:
+    return [
+        _page("service_online"),
+        _page("resource_report", external_links=_external_links(5)),
+        _page("refer_customer", title=None, meta_description=None, canonical=None),
+        _page("service_aicamp", rendered_with="selenium", js_rendered=True),
+    ]
+
+
+def _write_pages(directory: Path, pages: list[dict]) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    for page in pages:
+        (directory / f"{page['slug']}.json").write_text(
+            json.dumps(page, ensure_ascii=False), encoding="utf-8"
+        )
+
+
+# ---------------------------------------------------------------------------
+# Streaming summary and parallel scoring
+# ---------------------------------------------------------------------------
+
+
+def test_summary_accumulator_matches_list_based_summary():
+    rng = random.Random(19)
+    results = [analyze_page(page) for page in _pages()]
+    for idx in range(200):
+        scores = {dim: rng.randint(0, 5) for dim in DIMENSIONS}
+        scores["total"] = sum(scores.values())
+        results.append(
+            {
+                "url": f"{BASE_URL}/synthetic/{idx}",
+                "scores": scores,
+                "rendered_with": rng.choice(
+                    ["requests", "requests_only", "selenium", "playwright"]
+                ),
+            }
+        )
+
+    acc = SummaryAccumulator()
+    for result in results:
+        acc.add(result)
+    summary = acc.summary()
+    assert summary == compute_summary(results)
+    assert summary == compute_summary(iter(results))  # one pass over a generator
+
+    for dim in DIMENSIONS:
+        values = [r["scores"][dim] for r in results]
+        assert summary["by_dimension"][dim] == {
+            "avg": round(sum(values) / len(values), 1),
+            "min": min(values),
+            "max": max(values),
+        }
+    n = len(results)
+    critical = sum(r["scores"]["total"] <= 8 for r in results)
+    csr = sum(r["rendered_with"] in ("selenium", "playwright") for r in results)
+    assert f"{critical}/{n} pages score <= 8/25 (critical)" in summary["top_issues"]
+    assert f"{csr}/{n} pages are CSR-rendered (headless browser)" in summary["top_issues"]
+    total = sum(r["scores"]["total"] for r in results)
+    assert acc.average_score == round(total / n, 1)
+
+
+def test_any_headless_backend_counts_as_csr():
+    short = {"text_length": 100, "text_content": ""}
+    for rendered_with in ("selenium", "playwright"):
+        page = _page("spa", rendered_with=rendered_with, js_rendered=True, **short)
+        result = analyze_page(page)
+        assert "SSR page" not in result["details"]["trust"]
+        assert compute_summary([result])["top_issues"].count(
+            "1/1 pages are CSR-rendered (headless browser)"
+        ) == 1
+    for rendered_with in ("requests", "requests_only"):
+        page = _page("ssr", rendered_with=rendered_with, **short)
+        assert "SSR page" in analyze_page(page)["details"]["trust"]
+
+
+def test_empty_summary():
+    assert compute_summary([]) == {"by_dimension": {}, "top_issues": []}
+    assert SummaryAccumulator().average_score == 0.0
+
+
+def test_process_pool_scores_in_input_order(tmp_path):
+    pages = _pages()
+    _write_pages(tmp_path, pages)
+    (tmp_path / "_geo_scorecard.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+
+    expected = {page["slug"]: analyze_page(page) for page in pages}
+    inline = list(score_pages(iter_page_sources(tmp_path, None), workers=1))
+    pooled = list(
+        score_pages(iter_page_sources(tmp_path, None), workers=2, batch_size=1)
+    )
+    names = sorted(f"{slug}.json" for slug in [*expected, "broken"])
+    assert [s.name for s in pooled] == names
+    assert [(s.name, s.result, s.error) for s in pooled] == [
+        (s.name, s.result, s.error) for s in inline
+    ]
+    for scored in pooled:
+        if scored.name == "broken.json":
+            assert scored.result is None and scored.error
+        else:
+            assert scored.result == expected[scored.name[: -len(".json")]]
+
+
+def test_jsonl_stream_scores_like_page_files(tmp_path):
+    pages = _pages()
+    _write_pages(tmp_path / "files", pages)
+    stream = tmp_path / "_pages.jsonl"
+    stream.write_text(
+        "".join(json.dumps(page, ensure_ascii=False) + "\n\n" for page in pages),
+        encoding="utf-8",
+    )
+
+    from_files = {
+        s.result["url"]: s.result
+        for s in score_pages(iter_page_sources(tmp_path / "files", None), workers=1)
+    }
+    from_stream = list(score_pages(iter_page_sources(None, stream), workers=1))
+    assert [s.name for s in from_stream] == [
+        f"_pages.jsonl:{line}" for line in range(1, 2 * len(pages), 2)
+    ]
+    assert {s.result["url"]: s.result for s in from_stream} == from_files
+
+
+# ---------------------------------------------------------------------------
+# Score cache and run-to-run diff
+# ---------------------------------------------------------------------------
+
+
+def _run_scorer(monkeypatch, input_dir: Path, *extra: str) -> tuple[dict, dict]:
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["analyze_geo_readiness.py", "--input-dir", str(input_dir), "--workers", "1"]
+        + list(extra),
+    )
+    analyze_geo_readiness.main()
+    return tuple(
+        json.loads((input_dir / name).read_text(encoding="utf-8"))
+        for name in ("_geo_scorecard.json", DIFF_FILENAME)
+    )
+
+
+def test_score_cache_and_diff_across_runs(tmp_path, monkeypatch):
+    pages = _pages()
+    _write_pages(tmp_path, pages)
+
+    first, diff = _run_scorer(monkeypatch, tmp_path)
+    assert diff["rescored_pages"] == len(pages)
+    assert diff["cached_pages"] == 0
+    assert len(diff["new_pages"]) == len(pages)
+
+    # Second crawl: one page regresses, one improves, one only gets a new
+    # crawled_at (a volatile field, so its record hash is unchanged)
+    online, report, customer = pages[0], pages[1], pages[2]
+    online.update(title=None, meta_description=None, canonical=None)
+    customer["external_links"] = _external_links(5)
+    report["crawled_at"] = "2026-02-01T00:00:00"
+    _write_pages(tmp_path, pages)
+
+    second, diff = _run_scorer(monkeypatch, tmp_path)
+    assert diff["rescored_pages"] == 2
+    assert diff["cached_pages"] == 2
+    assert diff["new_pages"] == []
+    [regression] = diff["regressions"]
+    assert regression["url"] == online["url"]
+    assert regression["delta"] < 0
+    assert regression["dimension_deltas"]["crawlability"] < 0
+    [improvement] = diff["improvements"]
+    assert improvement["url"] == customer["url"]
+    assert improvement["dimension_deltas"] == {"proof": 2}
+    by_url = {page["url"]: page for page in second["pages"]}
+    assert by_url[online["url"]]["scores"] == analyze_page(online)["scores"]
+
+    # Unchanged records come from the cache
+    _, diff = _run_scorer(monkeypatch, tmp_path)
+    assert (diff["rescored_pages"], diff["cached_pages"]) == (0, len(pages))
+
+    # A rules change (SCORING_VERSION bump) rescores everything; same rules,
+    # so nothing moves
+    version = analyze_geo_readiness.SCORING_VERSION + 1
+    monkeypatch.setattr(analyze_geo_readiness, "SCORING_VERSION", version)
+    _, diff = _run_scorer(monkeypatch, tmp_path)
+    assert (diff["rescored_pages"], diff["cached_pages"]) == (len(pages), 0)
+    assert diff["scoring_version"] == version
+    assert diff["regressions"] == diff["improvements"] == []
+
+    # --rescore bypasses a current cache
+    _, diff = _run_scorer(monkeypatch, tmp_path, "--rescore")
+    assert diff["rescored_pages"] == len(pages)
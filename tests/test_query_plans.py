@@ -0,0 +1,126 @@
+"""Query-plan regression tests for the hot queries.
+
+Every statement registered with ``hot_query`` (plus the admin stats
+aggregate) must be answered through an index. SQLite plans come from
+``EXPLAIN QUERY PLAN``; the PostgreSQL variant runs only when
+``DATABASE_URL`` points at PostgreSQL and disables sequential scans, so a
+remaining ``Seq Scan`` means no usable index exists.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+
+import pytest
+
+import apps.api.main  # noqa: F401 - registers the endpoint hot queries
+from apps.api.database import HOT_QUERIES, get_database_backend, get_db, init_db
+from apps.api.progress import REFRESH_MODULE_ROLLUP_SQL, USER_PROGRESS_SQL
+from apps.api.stats import _USER_MODULE_PROGRESS_SQL
+
+# SQLite reports every scan as "SCAN <table>", with "USING [COVERING] INDEX"
+# when it walks a whole index instead of the table. Either way every row is
+# read, so hot queries may only scan these single-row lookup tables.
+SQLITE_SCAN = re.compile(r"^SCAN (\w+)")
+SQLITE_SCAN_ALLOWED = {"content_version"}
+
+
+def _sqlite_scans(plan: list[str]) -> list[str]:
+    return [
+        line
+        for line in plan
+        if (match := SQLITE_SCAN.match(line))
+        and match.group(1) not in SQLITE_SCAN_ALLOWED
+    ]
+
+
+def _hot_queries() -> list[str]:
+    return sorted(HOT_QUERIES) + [
+        _USER_MODULE_PROGRESS_SQL.format(placeholders="?,?"),
+    ]
+
+
+def _params(query: str) -> tuple[str, ...]:
+    return ("1",) * query.count("?")
+
+
+def _sqlite_plan(conn, query: str) -> list[str]:
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {query}", _params(query)).fetchall()
+    return [row[3] for row in rows]
+
+
+@pytest.mark.skipif(get_database_backend() != "sqlite", reason="SQLite plans")
+@pytest.mark.parametrize("query", _hot_queries())
+def test_sqlite_hot_query_has_no_full_scan(query):
+    init_db()
+    conn = get_db()
+    try:
+        plan = _sqlite_plan(conn, query)
+    finally:
+        conn.close()
+    assert not _sqlite_scans(plan), plan
+
+
+def test_sqlite_scan_detection_covers_index_scans():
+    assert _sqlite_scans(
+        [
+            "SCAN steps",
+            "SCAN m USING INDEX idx_modules_stage",
+            "SCAN up USING COVERING INDEX idx_progress_user_step_cover",
+            "SCAN content_version",
+            "SEARCH s USING INTEGER PRIMARY KEY (rowid=?)",
+        ]
+    ) == [
+        "SCAN steps",
+        "SCAN m USING INDEX idx_modules_stage",
+        "SCAN up USING COVERING INDEX idx_progress_user_step_cover",
+    ]
+
+
+@pytest.mark.skipif(get_database_backend() != "sqlite", reason="SQLite plans")
+def test_sqlite_progress_reads_use_covering_index():
+    init_db()
+    conn = get_db()
+    try:
+        progress_plan = _sqlite_plan(conn, USER_PROGRESS_SQL)
+        rollup_plan = _sqlite_plan(conn, REFRESH_MODULE_ROLLUP_SQL)
+    finally:
+        conn.close()
+    assert any(
+        "COVERING INDEX idx_progress_user_step_cover" in line for line in progress_plan
+    ), progress_plan
+    # The rollup is driven from the covering index and joins steps by PK;
+    # see 006_covering_indexes.sqlite.sql
+    searches = [line for line in rollup_plan if line.startswith("SEARCH")]
+    assert searches == [
+        "SEARCH up USING COVERING INDEX idx_progress_user_step_cover (user_id=?)",
+        "SEARCH s USING INTEGER PRIMARY KEY (rowid=?)",
+    ], rollup_plan
+
+
+def _postgres_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", ()):
+        yield from _postgres_nodes(child)
+
+
+@pytest.mark.skipif(get_database_backend() != "postgres", reason="PostgreSQL plans")
+@pytest.mark.parametrize("query", _hot_queries())
+def test_postgres_hot_query_has_no_seq_scan(query):
+    init_db()
+    conn = get_db()
+    try:
+        conn.execute("SET LOCAL enable_seqscan = off")
+        row = conn.execute(f"EXPLAIN (FORMAT JSON) {query}", _params(query)).fetchone()
+    finally:
+        conn.rollback()
+        conn.close()
+    raw = row["QUERY PLAN"]
+    plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+    scans = [
+        node.get("Relation Name")
+        for node in _postgres_nodes(plan)
+        if node["Node Type"] == "Seq Scan"
+    ]
+    assert not scans, scans